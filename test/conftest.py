@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+conftest.py (10/2026)
+Shared fixtures for tests with a local http server
+"""
+
+import io
+import os
+import re
+import threading
+import functools
+import http.server
+import pytest
+
+
+class _Handler(http.server.SimpleHTTPRequestHandler):
+    """Request handler with keep-alive, byte ranges and optional entity tags"""
+
+    protocol_version = "HTTP/1.1"
+    # entity tags for files
+    etags = {}
+    # headers of received requests
+    received = []
+
+    def log_message(self, *args):
+        pass
+
+    def send_head(self):
+        self.received.append(self.headers)
+        # send a truncated response
+        if self.path.endswith("truncated.bin"):
+            self.send_response(200)
+            self.send_header("Content-Length", "100000")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"0" * 1000)
+            self.close_connection = True
+            return None
+        # return not modified if the entity tag matches
+        etag = self.etags.get(self.path)
+        if etag and (self.headers.get("If-None-Match") == etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+        # send the partial content for byte range requests
+        byte_range = re.match(
+            r"bytes=(\d+)-(\d+)", self.headers.get("Range", "")
+        )
+        path = self.translate_path(self.path)
+        if byte_range and os.path.isfile(path):
+            start, end = map(int, byte_range.groups())
+            with open(path, mode="rb") as f:
+                f.seek(start)
+                data = f.read(end - start + 1)
+            size = os.path.getsize(path)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            return io.BytesIO(data)
+        return super().send_head()
+
+    def end_headers(self):
+        # add entity tags for successful requests
+        etag = self.etags.get(self.path)
+        if etag and not getattr(self, "_etag_sent", False):
+            self._etag_sent = True
+            self.send_header("ETag", etag)
+        # accept byte range requests
+        self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+
+@pytest.fixture(scope="session")
+def server(tmp_path_factory):
+    """Local http server serving files from a temporary directory"""
+    directory = tmp_path_factory.mktemp("server")
+    handler = functools.partial(_Handler, directory=str(directory))
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{httpd.server_port}"
+    yield url, directory
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def http_handler():
+    """Request handler class of the local http server"""
+    return _Handler
+
+
+@pytest.fixture
+def remote_file(server):
+    """Create a file on the local http server"""
+    url, directory = server
+
+    def _create(name, size=100000):
+        data = os.urandom(size)
+        directory.joinpath(name).write_bytes(data)
+        return f"{url}/{name}", data
+
+    return _create
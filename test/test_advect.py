@@ -39,3 +39,186 @@ def test_advect(INTEGRATOR):
     # verify results
     assert np.allclose(x_new, x_expected)
     assert np.allclose(y_new, y_expected)
+
+
+# parametrize over interpolation method
+@pytest.mark.parametrize("METHOD", ["linear", "nearest"])
+# PURPOSE: test the velocity interpolation against xarray
+def test_interp(METHOD):
+    # create test data
+    N = 100
+    x = xr.DataArray(10.0 * np.random.rand(N), dims="points")
+    y = xr.DataArray(10.0 * np.random.rand(N), dims="points")
+    # create a dataset with random velocity fields
+    # on irregularly spaced and descending grids
+    ny, nx, nt = 51, 101, 5
+    ds = xr.Dataset()
+    ds["x"] = (("x",), 10.0 * np.linspace(0, 1, nx) ** 2)
+    ds["y"] = (("y",), np.linspace(10, 0, ny))
+    ds["t"] = (("t",), np.array([0.0, 10.0, 15.0, 30.0, 40.0]))
+    ds["U"] = (("y", "x", "t"), np.random.rand(ny, nx, nt))
+    ds["V"] = (("y", "x", "t"), np.random.rand(ny, nx, nt))
+    # time of each point
+    t = 40.0 * np.random.rand(N)
+    # interpolate velocities
+    adv = xAdvect.Advect(ds, x=x, y=y, t=t, method=METHOD)
+    interp = adv.interp(x, y, t=xr.DataArray(t, dims="points"))
+    # expected results from xarray interpolation
+    kwargs = dict(x=x, y=y, t=xr.DataArray(t, dims="points"), method=METHOD)
+    U = ds.U.interp(**kwargs)
+    V = ds.V.interp(**kwargs)
+    # verify results
+    assert np.allclose(interp.U.values, U.values)
+    assert np.allclose(interp.V.values, V.values)
+
+
+# parametrize over advection method
+@pytest.mark.parametrize("INTEGRATOR", ["RK4", "RKF45"])
+# parametrize over data type
+@pytest.mark.parametrize("DTYPE", [np.float64, np.float32])
+# PURPOSE: test the advection module with a rotating velocity field
+def test_rotation(INTEGRATOR, DTYPE):
+    # create test data
+    N = 100
+    r = 5.0 * np.random.rand(N)
+    theta = 2.0 * np.pi * np.random.rand(N)
+    x = xr.DataArray(r * np.cos(theta), dims="points")
+    y = xr.DataArray(r * np.sin(theta), dims="points")
+    t, t0 = 0.0, 600.0
+    # create a dataset with a solid body rotation
+    omega = 2.0 * np.pi / 3600.0  # rad/s
+    ny, nx = 201, 201
+    ds = xr.Dataset()
+    ds["x"] = (("x",), np.linspace(-10, 10, nx))
+    ds["y"] = (("y",), np.linspace(-10, 10, ny))
+    gridx, gridy = np.meshgrid(ds.x.values, ds.y.values)
+    ds["U"] = (("y", "x"), -omega * gridy)
+    ds["V"] = (("y", "x"), omega * gridx)
+    ds["U"].attrs["units"] = "m/s"
+    ds["V"].attrs["units"] = "m/s"
+    # perform advection
+    x_new, y_new = ds.advect.run(
+        x=x, y=y, t=t, t0=t0, step=10, integrator=INTEGRATOR, dtype=DTYPE
+    )
+    # expected results for a solid body rotation
+    x_expected = r * np.cos(theta + omega * (t0 - t))
+    y_expected = r * np.sin(theta + omega * (t0 - t))
+    # verify results
+    atol = 1e-8 if (DTYPE == np.float64) else 1e-4
+    assert np.allclose(x_new, x_expected, atol=atol)
+    assert np.allclose(y_new, y_expected, atol=atol)
+
+
+# parametrize over advection method
+@pytest.mark.parametrize("INTEGRATOR", ["RK4", "RKF45"])
+# PURPOSE: test the advection of batches of parcels
+def test_batch(INTEGRATOR):
+    # create test data
+    B, N = 3, 50
+    r = 5.0 * np.random.rand(B, N)
+    theta = 2.0 * np.pi * np.random.rand(B, N)
+    xs, ys = r * np.cos(theta), r * np.sin(theta)
+    t, t0s = 0.0, np.array([300.0, 600.0, 900.0])
+    # create a dataset with a solid body rotation
+    omega = 2.0 * np.pi / 3600.0  # rad/s
+    ny, nx = 201, 201
+    ds = xr.Dataset()
+    ds["x"] = (("x",), np.linspace(-10, 10, nx))
+    ds["y"] = (("y",), np.linspace(-10, 10, ny))
+    gridx, gridy = np.meshgrid(ds.x.values, ds.y.values)
+    ds["U"] = (("y", "x"), -omega * gridy)
+    ds["V"] = (("y", "x"), omega * gridx)
+    # advect all batches in a single call
+    adv = xAdvect.Advect(ds, x=xs[0], y=ys[0], t=t, integrator=INTEGRATOR)
+    x_new, y_new = adv.run_batch(xs, ys, t0s, step=10)
+    # expected results for a solid body rotation
+    dt = t0s[:, np.newaxis] - t
+    x_expected = r * np.cos(theta + omega * dt)
+    y_expected = r * np.sin(theta + omega * dt)
+    # verify results
+    assert np.allclose(x_new, x_expected)
+    assert np.allclose(y_new, y_expected)
+
+
+# PURPOSE: test that stage velocities are not overwritten between calls
+def test_RKF45_interp():
+    # create test data
+    N = 20
+    x = 5.0 * np.random.rand(N)
+    y = 5.0 * np.random.rand(N)
+    # create a dataset with linearly varying velocity fields
+    ny, nx = 51, 51
+    ds = xr.Dataset()
+    ds["x"] = (("x",), np.linspace(0, 10, nx))
+    ds["y"] = (("y",), np.linspace(0, 10, ny))
+    gridx, gridy = np.meshgrid(ds.x.values, ds.y.values)
+    ds["U"] = (("y", "x"), 0.1 * gridx)
+    ds["V"] = (("y", "x"), 0.1 * gridy)
+    adv = xAdvect.Advect(ds, x=x, y=y, t=0.0, integrator="RKF45")
+    # calculate stage velocities at two sets of coordinates
+    U1, V1 = adv.RFK45_interp(x, y, 1.0)
+    expected = (U1.copy(), V1.copy())
+    U2, V2 = adv.RFK45_interp(y, x, 1.0)
+    # verify the first velocities are unchanged
+    assert U1.shape == (6, N)
+    assert np.array_equal(U1, expected[0])
+    assert np.array_equal(V1, expected[1])
+    assert not np.allclose(U1, U2)
+
+
+# PURPOSE: test that velocity grids are extracted when first used
+def test_prepare_grid():
+    # create a dataset with uniform velocity fields
+    ny, nx = 11, 11
+    ds = xr.Dataset()
+    ds["x"] = (("x",), np.linspace(0, 10, nx))
+    ds["y"] = (("y",), np.linspace(0, 10, ny))
+    ds["U"] = (("y", "x"), 0.1 * np.ones((ny, nx)))
+    ds["V"] = (("y", "x"), 0.1 * np.ones((ny, nx)))
+    x, y = np.array([2.0, 3.0]), np.array([4.0, 5.0])
+    adv = xAdvect.Advect(ds, x=x, y=y, t=0.0, t0=10.0)
+    # velocity grids are not extracted when initializing
+    assert "_grid" not in adv.__dict__
+    adv.translate(step=1)
+    assert adv._grid
+    assert np.allclose(adv.x0, x + 1.0)
+    assert np.allclose(adv.y0, y + 1.0)
+    with pytest.raises(AttributeError):
+        adv._missing
+
+
+# parametrize over time-variable velocity grids
+@pytest.mark.parametrize("TIME", [False, True])
+# PURPOSE: test the CUDA kernel against the CPU kernel
+# (set NUMBA_ENABLE_CUDASIM=1 to run without a CUDA device)
+def test_cuda(TIME):
+    if not xAdvect.kernels.cuda_available():
+        pytest.skip("CUDA device or simulator is not available")
+    # create test data
+    N = 50
+    r = 5.0 * np.random.rand(N)
+    theta = 2.0 * np.pi * np.random.rand(N)
+    x = xr.DataArray(r * np.cos(theta), dims="points")
+    y = xr.DataArray(r * np.sin(theta), dims="points")
+    # create a dataset with a solid body rotation
+    omega = 2.0 * np.pi / 3600.0  # rad/s
+    ny, nx = 41, 41
+    ds = xr.Dataset()
+    ds["x"] = (("x",), np.linspace(-10, 10, nx))
+    ds["y"] = (("y",), np.linspace(-10, 10, ny))
+    gridx, gridy = np.meshgrid(ds.x.values, ds.y.values)
+    if TIME:
+        scale = np.array([0.5, 1.0, 1.5])
+        ds["t"] = (("t",), np.array([0.0, 300.0, 600.0]))
+        ds["U"] = (("y", "x", "t"), -omega * gridy[..., None] * scale)
+        ds["V"] = (("y", "x", "t"), omega * gridx[..., None] * scale)
+    else:
+        ds["U"] = (("y", "x"), -omega * gridy)
+        ds["V"] = (("y", "x"), omega * gridx)
+    # advect parcels on the CPU and on the CUDA device
+    kwargs = dict(x=x, y=y, t=0.0, t0=600.0, step=10, integrator="RK4")
+    x_cpu, y_cpu = ds.advect.run(device="cpu", **kwargs)
+    x_cuda, y_cuda = ds.advect.run(device="cuda", **kwargs)
+    # verify results
+    assert np.allclose(x_cuda, x_cpu)
+    assert np.allclose(y_cuda, y_cpu)
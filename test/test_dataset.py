@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+test_dataset.py (10/2026)
+Verify coordinate transformations of the xarray extension
+"""
+
+import pytest
+import numpy as np
+import xarray as xr
+import xAdvect.io.dataset
+
+
+# parametrize over dataset coordinate reference systems
+@pytest.mark.parametrize("CRS", [4326, 3857, 3413])
+# PURPOSE: test transforming grids of coordinates
+def test_coords_as(CRS):
+    # create a dataset in the coordinate reference system
+    ds = xr.Dataset(coords=dict(x=np.arange(5.0), y=np.arange(4.0)))
+    ds.attrs["crs"] = CRS
+    # input grid of longitudes and latitudes
+    lon = np.linspace(-50.0, -30.0, 11)
+    lat = np.linspace(60.0, 80.0, 7)
+    X, Y = ds.advect.coords_as(lon, lat, crs=4326, type="grid")
+    # expected results from transforming every point in the grid
+    gridx, gridy = np.meshgrid(lon, lat)
+    mx, my = xAdvect.io.dataset._transform(
+        gridx, gridy, source_crs=4326, target_crs=CRS
+    )
+    if CRS == 3413:
+        # polar stereographic grids are not separable
+        assert X.dims == ("y", "x")
+        assert Y.dims == ("y", "x")
+        assert np.allclose(X, mx)
+        assert np.allclose(Y, my)
+    else:
+        # latitude/longitude and mercator grids are separable
+        assert X.dims == ("x",)
+        assert Y.dims == ("y",)
+        assert np.allclose(X, mx[0, :])
+        assert np.allclose(Y, my[:, 0])
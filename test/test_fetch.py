@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+test_fetch.py (10/2026)
+Verify downloads of NASA Earthdata resources
+"""
+
+import asyncio
+import hashlib
+import importlib
+import urllib.request
+import pytest
+
+# fetch module (the fetch function is exported with the same name)
+fetch = importlib.import_module("xAdvect.datasets.fetch")
+
+
+@pytest.fixture
+def granules(server, remote_file, monkeypatch):
+    """Query results for files on the local http server"""
+    url, _ = server
+    remote = dict(remote_file(f"granule{i}.bin") for i in range(4))
+    # skip checking credentials
+    monkeypatch.setattr(fetch, "attempt_login", lambda *args, **kwargs: None)
+
+    def query(urls):
+        monkeypatch.setattr(fetch, "cmr", lambda **kwargs: iter(urls))
+        monkeypatch.setattr(fetch, "cmr_iter", lambda **kwargs: iter(urls))
+
+    query(list(remote.keys()))
+    return remote, query
+
+
+# PURPOSE: test asynchronously downloading files to partial files
+def test_download_async(server, remote_file, tmp_path):
+    aiohttp = pytest.importorskip("aiohttp")
+    url, data = remote_file("async.bin")
+    local = tmp_path.joinpath("async.bin")
+    truncated = tmp_path.joinpath("truncated.bin")
+    truncated_url = f"{server[0]}/truncated.bin"
+
+    async def _download():
+        async with aiohttp.ClientSession() as session:
+            semaphore = asyncio.Semaphore(2)
+            await fetch._download(url, local, session, semaphore)
+            # failed downloads do not leave truncated files
+            with pytest.raises(aiohttp.ClientError):
+                await fetch._download(
+                    truncated_url, truncated, session, semaphore
+                )
+
+    asyncio.run(_download())
+    assert local.read_bytes() == data
+    assert not local.with_name("async.bin.part").exists()
+    assert not truncated.exists()
+    assert not truncated.with_name("truncated.bin.part").exists()
+
+
+# PURPOSE: test querying and asynchronously downloading files
+def test_async_fetch(granules, tmp_path):
+    aiohttp = pytest.importorskip("aiohttp")
+    remote, query = granules
+    # existing files are not downloaded
+    tmp_path.joinpath("granule0.bin").write_bytes(b"existing")
+    paths = asyncio.run(fetch.async_fetch(path=tmp_path, n_parallel=2))
+    assert paths == [tmp_path.joinpath(u.rsplit("/", 1)[-1]) for u in remote]
+    assert paths[0].read_bytes() == b"existing"
+    for path, data in zip(paths[1:], list(remote.values())[1:]):
+        assert path.read_bytes() == data
+    # failed downloads raise errors
+    url = next(iter(remote)).replace("granule0.bin", "missing.bin")
+    query([url])
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(fetch.async_fetch(path=tmp_path))
+    assert not tmp_path.joinpath("missing.bin").exists()
+    assert not tmp_path.joinpath("missing.bin.part").exists()
+
+
+# parametrize over number of concurrent downloads
+@pytest.mark.parametrize("WORKERS", [1, 3])
+# PURPOSE: test querying and downloading files with threads
+def test_fetch(granules, tmp_path, WORKERS):
+    remote, query = granules
+    # existing files are not downloaded
+    tmp_path.joinpath("granule0.bin").write_bytes(b"existing")
+    paths = fetch.fetch(path=tmp_path, workers=WORKERS)
+    assert paths == [tmp_path.joinpath(u.rsplit("/", 1)[-1]) for u in remote]
+    assert paths[0].read_bytes() == b"existing"
+    for path, data in zip(paths[1:], list(remote.values())[1:]):
+        assert path.read_bytes() == data
+        assert not path.with_name(f"{path.name}.part").exists()
+    # failed downloads raise errors
+    url = next(iter(remote)).replace("granule0.bin", "missing.bin")
+    query([url])
+    with pytest.raises(urllib.request.URLError):
+        fetch.fetch(path=tmp_path, workers=WORKERS)
+    assert not tmp_path.joinpath("missing.bin").exists()
+    assert not tmp_path.joinpath("missing.bin.part").exists()
+
+
+# PURPOSE: test opening urls with pooled sessions and openers
+def test_open(remote_file):
+    url, data = remote_file("open.bin")
+    # pooled session if available
+    response = fetch._open(url, timeout=10)
+    assert response.read() == data
+    assert int(response.info()["Content-Length"]) == len(data)
+    # urllib opener
+    opener = urllib.request.build_opener()
+    response = fetch._open(url, headers={"Range": "bytes=0-9"}, opener=opener)
+    assert response.status == 206
+    assert response.read() == data[:10]
+
+
+# parametrize over number of parts
+@pytest.mark.parametrize("PARTS", [1, 2, 5])
+# PURPOSE: test downloading files in parts with range requests
+def test_download_parts(remote_file, http_handler, tmp_path, PARTS):
+    url, data = remote_file("parts.bin", size=100003)
+    ranges = fetch._ranges(url, PARTS)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data) - 1
+    assert all((b[0] == a[1] + 1) for a, b in zip(ranges[:-1], ranges[1:]))
+    # no ranges if the file is smaller than the number of parts
+    small, _ = remote_file("small.bin", size=2)
+    assert fetch._ranges(small, 5) is None
+    # download the parts concurrently and verify the checksum
+    local = tmp_path.joinpath("parts.bin")
+    http_handler.received.clear()
+    output, response_error = fetch.from_earthdata(
+        url,
+        build=False,
+        local=local,
+        hash=hashlib.md5(data).hexdigest(),
+        parallel_parts=PARTS,
+    )
+    assert (output, response_error) == (local, None)
+    assert local.read_bytes() == data
+    assert not local.with_name("parts.bin.part").exists()
+    requested = [h["Range"] for h in http_handler.received if "Range" in h]
+    if PARTS > 1:
+        assert sorted(requested) == sorted(f"bytes={a}-{b}" for a, b in ranges)
+    else:
+        assert not requested
+
+
+# PURPOSE: test downloading files to buffers and reporting errors
+def test_from_earthdata(server, remote_file):
+    url, data = remote_file("buffer.bin")
+    buffer, response_error = fetch.from_earthdata(url, build=False)
+    assert response_error is None
+    assert buffer.read() == data
+    assert buffer.filename == "buffer.bin"
+    # errors are returned with the response
+    output, response_error = fetch.from_earthdata(
+        f"{server[0]}/missing.bin", build=False
+    )
+    assert output is False
+    assert response_error.startswith("Download error")
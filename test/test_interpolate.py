@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+test_interpolate.py (10/2026)
+Verify inpainting of missing data
+"""
+
+import pytest
+import numpy as np
+import xAdvect.interpolate
+
+
+# parametrize over regular and irregular grids
+@pytest.mark.parametrize("REGULAR", [True, False])
+# parametrize over floating point precision
+@pytest.mark.parametrize("DTYPE", ["f8", "f4"])
+# parametrize over number of iterations
+@pytest.mark.parametrize("N", [0, 10])
+# PURPOSE: test inpainting a stack of grids against individual grids
+def test_inpaint_multi(REGULAR, DTYPE, N):
+    rng = np.random.default_rng(0)
+    ny, nx = 40, 50
+    if REGULAR:
+        # regular grid uses the euclidean distance transform
+        xs = np.linspace(0, 10, nx)
+        ys = np.linspace(0, 8, ny)
+    else:
+        # irregular grid uses KDTree queries
+        xs = np.cumsum(rng.uniform(0.1, 0.5, nx))
+        ys = np.cumsum(rng.uniform(0.1, 0.5, ny))
+    gridx, gridy = np.meshgrid(xs, ys)
+    # create a stack of grids with shared and independent masks
+    stack = np.zeros((4, ny, nx), dtype=DTYPE)
+    for i in range(4):
+        stack[i] = np.sin(gridx / (i + 1)) * np.cos(gridy)
+    shared = rng.random((ny, nx)) < 0.3
+    stack[:2, shared] = np.nan
+    stack[2, rng.random((ny, nx)) < 0.5] = np.nan
+    stack[3, 10:20, 15:30] = np.nan
+    original = stack.copy()
+    # inpaint the stack and each individual grid
+    output = xAdvect.interpolate.inpaint_multi(xs, ys, stack, N=N)
+    for z, z0 in zip(stack, output):
+        expected = xAdvect.interpolate.inpaint(xs, ys, z, N=N)
+        assert z0.dtype == expected.dtype == np.dtype(DTYPE)
+        assert np.all(np.isfinite(z0))
+        assert np.array_equal(z0, expected)
+        # valid values are retained
+        valid = np.isfinite(z)
+        assert np.array_equal(z0[valid], z[valid])
+    # input grids are not modified
+    assert np.array_equal(stack, original, equal_nan=True)
+
+
+# PURPOSE: test nearest neighbors on irregular grids against a brute force
+def test_nearest_irregular():
+    rng = np.random.default_rng(1)
+    ny, nx = 15, 20
+    xs = np.cumsum(rng.uniform(0.1, 0.5, nx))
+    ys = np.cumsum(rng.uniform(0.1, 0.5, ny))
+    W = rng.random((ny, nx)) < 0.4
+    irow, icol = xAdvect.interpolate._nearest(xs, ys, W)
+    # distances to all valid values
+    gridx, gridy = np.meshgrid(xs, ys)
+    vx, vy = gridx[W], gridy[W]
+    dist = np.hypot(gridx[..., None] - vx, gridy[..., None] - vy)
+    expected = dist.min(axis=-1)
+    assert np.allclose(
+        np.hypot(gridx - gridx[irow, icol], gridy - gridy[irow, icol]),
+        expected,
+    )
+    assert np.all(W[irow, icol])
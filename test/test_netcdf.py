@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+test_netcdf.py (10/2026)
+Verify reading and combining netCDF files
+"""
+
+import pytest
+import numpy as np
+import xarray as xr
+import xAdvect.io.netcdf
+
+
+def _write(path, x, y, attrs={}, **variables):
+    """Write a small netCDF file with velocity variables"""
+    ds = xr.Dataset(coords=dict(x=x, y=y), attrs=attrs)
+    for key, val in variables.items():
+        ds[key] = (("y", "x"), val)
+    ds.to_netcdf(path, engine="scipy")
+    return path
+
+
+# parametrize over opening files in parallel
+@pytest.mark.parametrize("PARALLEL", [False, True])
+# PURPOSE: test concatenating files along the time dimension
+def test_open_mfdataset_time(tmp_path, PARALLEL):
+    rng = np.random.default_rng(0)
+    x, y = np.arange(5.0), np.arange(4.0)
+    # files for two periods written in reverse order
+    periods = [("2021-01-01", "2021-12-31"), ("2020-01-01", "2020-12-31")]
+    filename = []
+    for i, (start, end) in enumerate(periods):
+        attrs = dict(time_coverage_start=start, time_coverage_end=end)
+        filename.append(
+            _write(
+                tmp_path.joinpath(f"velocity{i}.nc"),
+                x,
+                y,
+                attrs=attrs,
+                U=rng.random((4, 5)),
+                V=rng.random((4, 5)),
+            )
+        )
+    ds = xAdvect.io.netcdf.open_mfdataset(
+        filename, engine="scipy", parallel=PARALLEL
+    )
+    # expected results from combining the files by coordinates
+    d = [xAdvect.io.netcdf.open_dataset(f, engine="scipy") for f in filename]
+    expected = xr.combine_by_coords(
+        d,
+        compat="override",
+        coords="minimal",
+        data_vars="minimal",
+        combine_attrs="override",
+    )
+    assert ds.sizes["time"] == 2
+    assert np.all(np.diff(ds.time) > np.timedelta64(0))
+    xr.testing.assert_identical(ds, expected)
+
+
+# PURPOSE: test combining files without a time dimension
+def test_open_mfdataset_merge(tmp_path):
+    rng = np.random.default_rng(1)
+    y = np.arange(4.0)
+    U, V = rng.random((4, 10)), rng.random((4, 10))
+    # files with different variables on the same grid
+    x = np.arange(10.0)
+    filename = [
+        _write(tmp_path.joinpath("U.nc"), x, y, U=U),
+        _write(tmp_path.joinpath("V.nc"), x, y, V=V),
+    ]
+    ds = xAdvect.io.netcdf.open_mfdataset(filename, engine="scipy")
+    assert "time" not in ds.dims
+    assert np.array_equal(ds.U, U)
+    assert np.array_equal(ds.V, V)
+    # files with the same variables tiling the x-dimension
+    filename = [
+        _write(tmp_path.joinpath("east.nc"), x[5:], y, U=U[:, 5:], V=V[:, 5:]),
+        _write(tmp_path.joinpath("west.nc"), x[:5], y, U=U[:, :5], V=V[:, :5]),
+    ]
+    ds = xAdvect.io.netcdf.open_mfdataset(filename, engine="scipy")
+    assert "time" not in ds.dims
+    assert np.array_equal(ds.x, x)
+    assert np.array_equal(ds.U, U)
+    assert np.array_equal(ds.V, V)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""
+test_utilities.py (10/2026)
+Verify http download and request utilities
+"""
+
+import io
+import os
+import asyncio
+import hashlib
+import posixpath
+import functools
+import urllib.request
+import pytest
+import xAdvect.utilities
+
+
+# PURPOSE: test that custom openers bypass pooled connections
+def test_installed_opener(remote_file):
+    pytest.importorskip("urllib3")
+    url, data = remote_file("opener.bin")
+    # handler that records requests through the installed opener
+    requests = []
+
+    class _Record(urllib.request.BaseHandler):
+        def http_request(self, request):
+            requests.append(request.full_url)
+            return request
+
+    urllib.request.install_opener(urllib.request.build_opener(_Record()))
+    try:
+        buffer = xAdvect.utilities.from_http(url, use_pool=True)
+    finally:
+        urllib.request.install_opener(None)
+    assert buffer.read() == data
+    assert requests == [url]
+
+
+# PURPOSE: test that pooled connections honor proxy variables
+def test_pooled_proxies(remote_file, monkeypatch):
+    pytest.importorskip("urllib3")
+    url, data = remote_file("proxy.bin")
+    # unreachable proxy server
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:1")
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    with pytest.raises(urllib.request.URLError):
+        xAdvect.utilities.from_http(url, use_pool=True)
+    # bypass the proxy server for the local host
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    buffer = xAdvect.utilities.from_http(url, use_pool=True)
+    assert buffer.read() == data
+
+
+# parametrize over hashing algorithms
+@pytest.mark.parametrize("ALGORITHM", ["md5", "sha256", "blake3"])
+# PURPOSE: test file hashes for paths, file objects and buffers
+def test_get_hash(tmp_path, ALGORITHM):
+    if ALGORITHM == "blake3":
+        blake3 = pytest.importorskip("blake3")
+        new = blake3.blake3
+    else:
+        new = functools.partial(hashlib.new, ALGORITHM)
+    data = os.urandom(100000)
+    expected = new(data).hexdigest()
+    local = tmp_path.joinpath("hash.bin")
+    local.write_bytes(data)
+    # hash the local file, an open file object and a buffer
+    assert xAdvect.utilities.get_hash(local, ALGORITHM) == expected
+    with local.open(mode="rb") as fid:
+        assert xAdvect.utilities.get_hash(fid, ALGORITHM) == expected
+    buffer = io.BytesIO(data)
+    assert xAdvect.utilities.get_hash(buffer, ALGORITHM) == expected
+
+
+@pytest.fixture
+def etags(tmp_path, monkeypatch):
+    """Store entity tags within a temporary cache directory"""
+    monkeypatch.setattr(xAdvect.utilities, "get_cache_path", tmp_path.joinpath)
+    return tmp_path.joinpath(xAdvect.utilities._etags_file)
+
+
+# parametrize over pooled connections
+@pytest.mark.parametrize("POOL", [False, True])
+# PURPOSE: test conditional requests using modification times
+def test_conditional_modified(remote_file, http_handler, tmp_path, etags, POOL):
+    url, data = remote_file("modified.bin")
+    local = tmp_path.joinpath("modified.bin")
+    # download the file and set the modification time to the future
+    buffer = xAdvect.utilities.from_http(
+        url, local=local, conditional=True, use_pool=POOL
+    )
+    assert buffer.read() == data
+    assert local.read_bytes() == data
+    assert not local.with_name("modified.bin.part").exists()
+    mtime = local.stat().st_mtime + 86400
+    os.utime(local, (mtime, mtime))
+    # check that the local file is kept if not modified
+    http_handler.received.clear()
+    buffer = xAdvect.utilities.from_http(
+        url, local=local, conditional=True, use_pool=POOL
+    )
+    assert "If-Modified-Since" in http_handler.received[-1]
+    assert buffer.read() == data
+    assert buffer.filename == "modified.bin"
+    assert local.stat().st_mtime == mtime
+    # check that no buffer is returned if not requested
+    buffer = xAdvect.utilities.from_http(
+        url, local=local, conditional=True, use_pool=POOL, return_buffer=False
+    )
+    assert buffer is None
+    # check that the local file is replaced if outdated
+    os.utime(local, (0, 0))
+    local.write_bytes(b"outdated")
+    os.utime(local, (0, 0))
+    xAdvect.utilities.from_http(
+        url, local=local, conditional=True, use_pool=POOL
+    )
+    assert local.read_bytes() == data
+
+
+# PURPOSE: test conditional requests using entity tags
+def test_conditional_etag(remote_file, http_handler, tmp_path, etags):
+    url, data = remote_file("etag.bin")
+    http_handler.etags["/etag.bin"] = '"v1"'
+    local = tmp_path.joinpath("etag.bin")
+    # download the file and store the entity tag
+    xAdvect.utilities.from_http(url, local=local, conditional=True)
+    assert local.read_bytes() == data
+    assert etags.exists()
+    stored = xAdvect.utilities._load_etags()
+    assert stored[url] == ['"v1"', str(local.absolute())]
+    # outdated modification time so only the entity tag matches
+    os.utime(local, (0, 0))
+    http_handler.received.clear()
+    buffer = xAdvect.utilities.from_http(url, local=local, conditional=True)
+    assert http_handler.received[-1]["If-None-Match"] == '"v1"'
+    assert buffer.read() == data
+    assert local.stat().st_mtime == 0
+    # entity tags are only sent for the same local file
+    other = tmp_path.joinpath("other.bin")
+    other.write_bytes(b"other")
+    os.utime(other, (0, 0))
+    http_handler.received.clear()
+    xAdvect.utilities.from_http(url, local=other, conditional=True)
+    assert "If-None-Match" not in http_handler.received[-1]
+    assert other.read_bytes() == data
+
+
+# parametrize over pooled connections
+@pytest.mark.parametrize("POOL", [False, True])
+# PURPOSE: test that failed downloads do not replace local files
+def test_partial_download(server, tmp_path, POOL):
+    url, _ = server
+    local = tmp_path.joinpath("truncated.bin")
+    local.write_bytes(b"existing")
+    with pytest.raises(Exception):
+        xAdvect.utilities.from_http(
+            f"{url}/truncated.bin", local=local, use_pool=POOL
+        )
+    # local file is unchanged and the temporary file is removed
+    assert local.read_bytes() == b"existing"
+    assert not local.with_name("truncated.bin.part").exists()
+
+
+@pytest.fixture(params=["aiohttp", "threads"])
+def concurrency(request, monkeypatch):
+    """Download with aiohttp or with a pool of threads"""
+    if request.param == "aiohttp":
+        pytest.importorskip("aiohttp")
+    else:
+        # hide aiohttp to use the thread pool
+        available = xAdvect.utilities.dependency_available
+        monkeypatch.setattr(
+            xAdvect.utilities,
+            "dependency_available",
+            lambda name, *args: (name != "aiohttp") and available(name, *args),
+        )
+    return request.param
+
+
+# PURPOSE: test downloading multiple files concurrently
+def test_from_http_many(remote_file, tmp_path, concurrency):
+    remote = [remote_file(f"many{i}.bin", size=50000 + i) for i in range(6)]
+    urls = [url for url, _ in remote]
+    local = [tmp_path.joinpath(f"many{i}.bin") for i in range(6)]
+    buffers = xAdvect.utilities.from_http_many(
+        urls, local=local, max_concurrency=3
+    )
+    for (url, data), buffer, path in zip(remote, buffers, local):
+        assert buffer.read() == data
+        assert buffer.filename == posixpath.basename(url)
+        assert path.read_bytes() == data
+        assert not path.with_name(f"{path.name}.part").exists()
+
+
+# PURPOSE: test that failed downloads raise errors
+def test_from_http_many_error(remote_file, tmp_path, concurrency):
+    url, _ = remote_file("exists.bin")
+    missing = posixpath.join(posixpath.dirname(url), "missing.bin")
+    local = [tmp_path.joinpath("exists.bin"), tmp_path.joinpath("missing.bin")]
+    with pytest.raises(Exception) as exc_info:
+        xAdvect.utilities.from_http_many([url, missing], local=local)
+    # error is the http status of the missing file
+    status = getattr(exc_info.value, "code", None)
+    status = getattr(exc_info.value, "status", status)
+    assert status == 404
+    assert not local[1].exists()
+    assert not local[1].with_name("missing.bin.part").exists()
+
+
+# PURPOSE: test downloads from within a running event loop
+def test_from_http_many_running_loop(remote_file):
+    remote = [remote_file(f"loop{i}.bin") for i in range(3)]
+
+    async def _download():
+        # thread pool is used if an event loop is already running
+        return xAdvect.utilities.from_http_many([url for url, _ in remote])
+
+    buffers = asyncio.run(_download())
+    for (url, data), buffer in zip(remote, buffers):
+        assert buffer.read() == data
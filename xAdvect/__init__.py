@@ -12,6 +12,7 @@ Documentation is available at https://xAdvect.readthedocs.io
 
 # base modules
 import xAdvect.interpolate
+import xAdvect.kernels
 import xAdvect.spatial
 import xAdvect.tools
 import xAdvect.utilities
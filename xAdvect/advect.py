@@ -1,17 +1,45 @@
 #!/usr/bin/env python3
 """
 advect.py
-Written by Tyler Sutterley (02/2026)
+Written by Tyler Sutterley (10/2026)
 Routines for advecting ice parcels using velocity estimates
 
 PYTHON DEPENDENCIES:
     numpy: Scientific Computing Tools For Python
         https://numpy.org
         https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
+    scipy: Scientific Tools for Python
+        https://docs.scipy.org/doc/
     xarray: N-D labeled arrays and datasets in Python
         https://docs.xarray.dev/en/stable/
 
+PROGRAM DEPENDENCIES:
+    kernels.py: compiled kernels for sampling velocity grids
+
 UPDATE HISTORY:
+    Updated 10/2026: extract velocity grids when first used by kernels
+    Updated 10/2026: use compiled kernels to interpolate regular grids
+    Updated 10/2026: fused compiled kernel for fourth-order Runge-Kutta steps
+    Updated 10/2026: accumulate Runge-Kutta-Fehlberg stages as stacked arrays
+    Updated 10/2026: extract velocity grids once for irregular grid spacing
+    Updated 10/2026: calculate time range of velocity dataset once
+    Updated 10/2026: reuse scratch buffers for parcel coordinates and times
+    Updated 10/2026: Butcher tableau for RKF45 as module-level constants
+    Updated 10/2026: single-pass compiled reduction for RKF45 convergence
+    Updated 10/2026: fused compiled kernel for RKF45 stage velocities
+    Updated 10/2026: parallel compiled kernel for explicit Euler steps
+    Updated 10/2026: add option for single precision velocity grids
+    Updated 10/2026: set up time-invariant or time-variable sampling once
+    Updated 10/2026: use map_coordinates for rectilinear grids without numba
+    Updated 10/2026: remove copies of immutable advection parameters
+    Updated 10/2026: skip time bookkeeping for time-invariant velocities
+    Updated 10/2026: run all Euler and RK4 steps within compiled kernels
+    Updated 10/2026: interpolate velocities as arrays within integrators
+    Updated 10/2026: add option to run RK4 kernel on CUDA devices
+    Updated 10/2026: use cached lookup of compiled integration kernels
+    Updated 10/2026: convert scalar times without creating arrays
+    Updated 10/2026: add function to advect batches of parcels in one call
+    Updated 10/2026: shortcut number of steps for single start and end times
     Updated 02/2026: adjust logging levels for advection steps
     Written 01/2026
 """
@@ -22,12 +50,63 @@ import copy
 import logging
 import numpy as np
 import xarray as xr
+import scipy.ndimage
 import timescale.time
+import xAdvect.kernels
 
 
 # default epoch for time conversions
 __epoch__ = timescale.time._j2000_epoch
 
+# attributes set when extracting velocity grids for compiled kernels
+_grid_attributes = frozenset(
+    [
+        "_grid",
+        "_compiled",
+        "_U",
+        "_V",
+        "_x_grid",
+        "_dxi",
+        "_y_grid",
+        "_dyi",
+        "_t_grid",
+        "_kernel_grid",
+    ]
+)
+
+# Butcher tableau for Runge-Kutta-Fehlberg 4(5) method
+_RKF45_A = np.array(
+    [
+        [1.0 / 4.0, 0.0, 0.0, 0.0, 0.0],
+        [3.0 / 32.0, 9.0 / 32.0, 0.0, 0.0, 0.0],
+        [1932.0 / 2197.0, -7200.0 / 2197.0, 7296.0 / 2197.0, 0.0, 0.0],
+        [439.0 / 216.0, -8.0, 3680.0 / 513.0, -845.0 / 4104.0, 0.0],
+        [-8.0 / 27.0, 2.0, -3544.0 / 2565.0, 1859.0 / 4104.0, -11.0 / 40.0],
+    ],
+    dtype=np.float64,
+)
+# weights for the 4th order accurate solution
+_RKF45_B4 = np.array(
+    [25.0 / 216.0, 0.0, 1408.0 / 2565.0, 2197.0 / 4104.0, -1.0 / 5.0, 0.0],
+    dtype=np.float64,
+)
+# weights for the 5th order accurate solution
+_RKF45_B5 = np.array(
+    [
+        16.0 / 135.0,
+        0.0,
+        6656.0 / 12825.0,
+        28561.0 / 56430.0,
+        -9.0 / 50.0,
+        2.0 / 55.0,
+    ],
+    dtype=np.float64,
+)
+# tableau coefficients are read-only
+for _coefficients in (_RKF45_A, _RKF45_B4, _RKF45_B5):
+    _coefficients.flags.writeable = False
+del _coefficients
+
 
 class Advect:
     """
@@ -58,11 +137,19 @@ class Advect:
             - ``'RKF45'``
     method: str, default 'linear'
         Interpolation method for velocities
-            - ``'linear'``, ``'nearest'``: scipy regular grid interpolations
+            - ``'linear'``, ``'nearest'``: regular grid interpolations
     time_units: str, default 'seconds'
         Units for input time coordinates
     fill_value: float or NoneType, default np.nan
         invalid value for output data
+    dtype: np.dtype, default np.float64
+        Data type of velocity grids and parcel coordinates
+        for the compiled kernels
+    device: str, default 'cpu'
+        Device for the compiled fourth-order Runge-Kutta kernel
+
+            - ``'cpu'``
+            - ``'cuda'``
     """
 
     np.seterr(invalid="ignore")
@@ -76,23 +163,56 @@ class Advect:
         kwargs.setdefault("integrator", "RK4")
         kwargs.setdefault("method", "linear")
         kwargs.setdefault("time_units", "seconds since 2018-01-01T00:00:00")
+        kwargs.setdefault("dtype", np.float64)
+        kwargs.setdefault("device", "cpu")
         # parse time units
         epoch, to_sec = timescale.time.parse_date_string(kwargs["time_units"])
+        self._epoch, self._to_sec = epoch, to_sec
         # set default class attributes
         self.x = copy.deepcopy(kwargs["x"])
         self.y = copy.deepcopy(kwargs["y"])
         # convert times to deltatime in seconds since J2000
         self._time = timescale.from_deltatime(
-            to_sec * np.array(kwargs["t"], dtype="f8"), epoch=epoch
+            self._seconds(kwargs["t"], to_sec), epoch=epoch
         )
         self.t = self._time.to_deltatime(epoch=__epoch__, scale=86400.0)
         self._time0 = timescale.from_deltatime(
-            to_sec * np.array(kwargs["t0"], dtype="f8"), epoch=epoch
+            self._seconds(kwargs["t0"], to_sec), epoch=epoch
         )
         self.t0 = self._time0.to_deltatime(epoch=__epoch__, scale=86400.0)
         self.velocity = ds
-        self.integrator = copy.deepcopy(kwargs["integrator"])
-        self.method = copy.deepcopy(kwargs["method"])
+        # data type for velocity grids and parcel coordinates
+        # (time coordinates are always double precision)
+        self.dtype = np.dtype(kwargs["dtype"])
+        # time range of the velocity dataset
+        self._has_t = "t" in ds
+        if self._has_t:
+            self._tmin = np.min(ds.t.values)
+            self._tmax = np.max(ds.t.values)
+        self.integrator = kwargs["integrator"]
+        self.method = kwargs["method"]
+        # device for compiled kernels
+        self.device = kwargs["device"]
+        if self.device not in ("cpu", "cuda"):
+            raise ValueError(f"Invalid device {self.device}")
+        if (self.device == "cuda") and not xAdvect.kernels.cuda_available():
+            raise ValueError("CUDA device is not available")
+
+    @staticmethod
+    def _seconds(t: float | np.ndarray, to_sec: float):
+        """
+        Converts times to seconds without copying scalars to arrays
+
+        Parameters
+        ----------
+        t: float or np.ndarray
+            time coordinates
+        to_sec: float
+            conversion factor to seconds
+        """
+        if np.isscalar(t):
+            return to_sec * float(t)
+        return to_sec * np.asarray(t, dtype=np.float64)
 
     def run(self, **kwargs):
         """
@@ -110,6 +230,60 @@ class Advect:
         # return final coordinates
         return self.x0, self.y0
 
+    def run_batch(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        t0s: np.ndarray,
+        **kwargs,
+    ):
+        """
+        Runs the advection of batches of parcels with separate ending times
+
+        Parameters
+        ----------
+        xs: np.ndarray
+            x-coordinates with dimensions ``(batch, parcels)``
+        ys: np.ndarray
+            y-coordinates with dimensions ``(batch, parcels)``
+        t0s: np.ndarray
+            Ending time for each batch in the input time units
+        kwargs: dict
+            Keyword arguments for ``translate``
+
+        Returns
+        -------
+        x0: np.ndarray
+            Final x-coordinates with dimensions ``(batch, parcels)``
+        y0: np.ndarray
+            Final y-coordinates with dimensions ``(batch, parcels)``
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        shape = np.broadcast_shapes(xs.shape, ys.shape)
+        # convert ending times to deltatime in seconds since J2000
+        t0s = np.asarray(t0s, dtype=np.float64)
+        t0s = t0s.reshape((shape[0],) + (1,) * (len(shape) - 1))
+        time0 = timescale.from_deltatime(
+            self._seconds(t0s, self._to_sec), epoch=self._epoch
+        )
+        t0 = time0.to_deltatime(epoch=__epoch__, scale=86400.0)
+        # save the coordinates and times of the parcels
+        x, y, t, t0_ = self.x, self.y, self.t, self.t0
+        try:
+            # advect all batches as a single set of parcels
+            self.x = np.broadcast_to(xs, shape).ravel()
+            self.y = np.broadcast_to(ys, shape).ravel()
+            self.t = np.broadcast_to(t, shape).ravel()
+            self.translate(t0=np.broadcast_to(t0, shape).ravel(), **kwargs)
+            x0 = np.reshape(self.x0, shape)
+            y0 = np.reshape(self.y0, shape)
+        finally:
+            # restore the coordinates and times of the parcels
+            self.x, self.y, self.t, self.t0 = x, y, t, t0_
+        # return final coordinates
+        return x0, y0
+
     def interp(
         self,
         x: np.ndarray,
@@ -131,16 +305,18 @@ class Advect:
         kwargs: dict
             keyword arguments for xarray interpolation
         """
+        # set default keyword arguments
+        kwargs.setdefault("method", self.method)
+        # use compiled kernels for rectilinear grids if possible
+        if self._grid and (kwargs["method"] in ("linear", "nearest")):
+            u, v = self._sample(x, y, t, method=kwargs["method"])
+            return self._as_dataset(u, v, like=x)
         # create xarray Dataset for interpolated velocities
         ds = xr.Dataset()
         # interpolate to specified coordinates
-        if "t" in self.velocity:
+        if self._has_t:
             # clip time to within range of velocity dataset
-            clipped = np.clip(
-                copy.deepcopy(t),
-                np.min(self.velocity.t.values),
-                np.max(self.velocity.t.values),
-            )
+            clipped = np.clip(t, self._tmin, self._tmax)
             # interpolate to x, y, and t coordinates
             for v in ("U", "V"):
                 ds[v] = self.velocity[v].interp(x=x, y=y, t=clipped, **kwargs)
@@ -151,6 +327,358 @@ class Advect:
         # return the dataset
         return ds
 
+    def _interp(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        t: float | np.ndarray = 0.0,
+    ):
+        """
+        Interpolates velocity data to specified coordinates
+        using the current interpolation method
+
+        Parameters
+        ----------
+        x: np.ndarray
+            x-coordinates
+        y: np.ndarray
+            y-coordinates
+        t: float or np.ndarray, default 0.0
+            time coordinates
+
+        Returns
+        -------
+        u: np.ndarray
+            x-component of velocity
+        v: np.ndarray
+            y-component of velocity
+        """
+        # use compiled kernels for rectilinear grids if possible
+        if self._grid and (self.method in ("linear", "nearest")):
+            return self._sample(x, y, t, method=self.method)
+        # interpolate using xarray
+        ds = self.interp(x=x, y=y, t=t)
+        return (ds.U.values, ds.V.values)
+
+    @staticmethod
+    def _as_dataset(
+        u: np.ndarray,
+        v: np.ndarray,
+        like: np.ndarray | xr.DataArray | None = None,
+    ):
+        """
+        Creates an xarray Dataset of interpolated velocities
+
+        Parameters
+        ----------
+        u: np.ndarray
+            x-component of velocity
+        v: np.ndarray
+            y-component of velocity
+        like: np.ndarray, xarray.DataArray or NoneType, default None
+            coordinates with dimensions to retain
+        """
+        ds = xr.Dataset()
+        for key, val in (("U", u), ("V", v)):
+            # retain the dimensions and coordinates of DataArrays
+            if isinstance(like, xr.DataArray) and (like.shape == val.shape):
+                ds[key] = like.copy(data=val).rename(key)
+            else:
+                ds[key] = xr.DataArray(val)
+        return ds
+
+    def _prepare_grid(self):
+        """
+        Extracts velocity grids and coordinates for the compiled kernels
+
+        Called when the grid attributes are first accessed
+        """
+        # rectilinear grids and compiled kernels are not available
+        self._grid = False
+        self._compiled = False
+        # velocity grids must have only spatial and time dimensions
+        has_t = self._has_t
+        dims = ("t", "y", "x") if has_t else ("y", "x")
+        if set(self.velocity.U.dims) != set(dims):
+            return
+        if set(self.velocity.V.dims) != set(dims):
+            return
+        # extract velocity grids as arrays
+        U = np.asarray(self.velocity.U.transpose(*dims).values, self.dtype)
+        V = np.asarray(self.velocity.V.transpose(*dims).values, self.dtype)
+        grid, inverse = {}, {}
+        for axis, d in enumerate(dims):
+            c = np.asarray(self.velocity[d].values, dtype=np.float64)
+            # sort coordinates to be monotonically increasing
+            isort = np.argsort(c, kind="stable")
+            if np.any(isort != np.arange(c.size)):
+                c = c[isort]
+                U = np.take(U, isort, axis=axis)
+                V = np.take(V, isort, axis=axis)
+            # spatial coordinates must have at least two unique values
+            if (d != "t") and (c.size < 2):
+                return
+            if np.any(np.diff(c) <= 0):
+                return
+            grid[d] = np.ascontiguousarray(c)
+            # inverse grid spacing for regularly spaced coordinates
+            # (binary search is used for irregular coordinates)
+            if (c.size > 1) and np.allclose(np.diff(c), c[1] - c[0]):
+                inverse[d] = 1.0 / (c[1] - c[0])
+            else:
+                inverse[d] = 0.0
+        # store velocity grids as contiguous arrays
+        self._U = np.ascontiguousarray(U)
+        self._V = np.ascontiguousarray(V)
+        # store grid coordinates and inverse grid spacing
+        self._x_grid, self._dxi = grid["x"], inverse["x"]
+        self._y_grid, self._dyi = grid["y"], inverse["y"]
+        self._t_grid = grid["t"] if has_t else np.zeros((1,))
+        # velocity grids and coordinates for the integration kernels
+        # (time-invariant grids have a single time slice)
+        self._kernel_grid = (
+            self._U if has_t else self._U[np.newaxis, :, :],
+            self._V if has_t else self._V[np.newaxis, :, :],
+            self._x_grid,
+            self._dxi,
+            self._y_grid,
+            self._dyi,
+            self._t_grid,
+        )
+        self._grid = True
+        self._compiled = xAdvect.kernels.numba_available
+
+    def _sample(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        t: float | np.ndarray = 0.0,
+        method: str = "linear",
+    ):
+        """
+        Interpolates velocity grids to specified coordinates
+        using compiled kernels or ``scipy.ndimage.map_coordinates``
+
+        Parameters
+        ----------
+        x: np.ndarray
+            x-coordinates
+        y: np.ndarray
+            y-coordinates
+        t: float or np.ndarray, default 0.0
+            time coordinates
+        method: str, default 'linear'
+            Interpolation method
+
+                - ``'linear'``: linear interpolation
+                - ``'nearest'``: nearest-neighbor interpolation
+        """
+        # clip time to within range of velocity dataset
+        if self._has_t:
+            t = np.clip(t, self._tmin, self._tmax)
+        # broadcast coordinates to a common shape
+        x, y, t = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64),
+            np.asarray(y, dtype=np.float64),
+            np.asarray(t, dtype=np.float64),
+        )
+        shape = x.shape
+        xi = np.ascontiguousarray(x).ravel()
+        yi = np.ascontiguousarray(y).ravel()
+        order = 0 if (method == "nearest") else 1
+        # allocate for output velocities
+        u = np.empty_like(xi)
+        v = np.empty_like(yi)
+        if not self._compiled:
+            ti = np.ascontiguousarray(t).ravel()
+            # interpolate with map_coordinates if numba is unavailable
+            self._map_coordinates(xi, yi, ti, order, u, v)
+        elif self._has_t:
+            ti = np.ascontiguousarray(t).ravel()
+            # interpolate to x, y, and t coordinates
+            xAdvect.kernels.trilinear(
+                self._U,
+                self._V,
+                xi,
+                yi,
+                ti,
+                self._x_grid,
+                self._dxi,
+                self._y_grid,
+                self._dyi,
+                self._t_grid,
+                order,
+                u,
+                v,
+            )
+        else:
+            # interpolate to x and y coordinates
+            xAdvect.kernels.bilinear(
+                self._U,
+                self._V,
+                xi,
+                yi,
+                self._x_grid,
+                self._dxi,
+                self._y_grid,
+                self._dyi,
+                order,
+                u,
+                v,
+            )
+        # return the velocities with the shape of the coordinates
+        return (u.reshape(shape), v.reshape(shape))
+
+    def _map_coordinates(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        t: np.ndarray,
+        order: int,
+        u: np.ndarray,
+        v: np.ndarray,
+    ):
+        """
+        Interpolates velocity grids to specified coordinates
+        using ``scipy.ndimage.map_coordinates``
+
+        Parameters
+        ----------
+        x: np.ndarray
+            x-coordinates
+        y: np.ndarray
+            y-coordinates
+        t: np.ndarray
+            time coordinates
+        order: int
+            interpolation order
+
+                - ``0``: nearest-neighbor
+                - ``1``: linear
+        u: np.ndarray
+            output x-component of velocity
+        v: np.ndarray
+            output y-component of velocity
+        """
+        # fractional indices of the coordinates within the grids
+        # (points outside of the spatial grids are invalid)
+        coords = []
+        if self._has_t:
+            nt = len(self._t_grid)
+            coords.append(np.interp(t, self._t_grid, np.arange(nt)))
+        for c, g in ((y, self._y_grid), (x, self._x_grid)):
+            i = np.arange(len(g))
+            coords.append(np.interp(c, g, i, left=np.nan, right=np.nan))
+        coords = np.vstack(coords)
+        valid = np.all(np.isfinite(coords), axis=0)
+        coords[:, ~valid] = 0.0
+        # interpolate to the fractional indices
+        kwargs = dict(order=order, mode="nearest", prefilter=False)
+        scipy.ndimage.map_coordinates(self._U, coords, output=u, **kwargs)
+        scipy.ndimage.map_coordinates(self._V, coords, output=v, **kwargs)
+        # set invalid points to NaN
+        u[~valid] = np.nan
+        v[~valid] = np.nan
+
+    def _flatten(self, dt: float | np.ndarray):
+        """
+        Broadcasts parcel coordinates, times and time steps
+        to flattened contiguous arrays for the compiled kernels
+
+        Parameters
+        ----------
+        dt: float or np.ndarray
+            integration time step size
+
+        Returns
+        -------
+        shape: tuple
+            broadcasted shape of the parcel coordinates
+        x: np.ndarray
+            flattened x-coordinates
+        y: np.ndarray
+            flattened y-coordinates
+        t: np.ndarray
+            flattened time coordinates
+        dt: np.ndarray
+            flattened time step sizes
+        """
+        arrays = (self.x, self.y, self.t, dt)
+        # broadcasted shape and number of parcels
+        shape = np.broadcast_shapes(*[np.shape(a) for a in arrays])
+        self._ensure_scratch(int(np.prod(shape)))
+        # copy into flattened scratch buffers
+        buffers = (self._sx, self._sy, self._st, self._sdt)
+        for b, a in zip(buffers, arrays):
+            np.copyto(b.reshape(shape), np.asarray(a, dtype=np.float64))
+        return (shape, *buffers)
+
+    def _ensure_scratch(self, P: int):
+        """
+        Allocates reusable flattened scratch buffers for the compiled kernels
+
+        Parameters
+        ----------
+        P: int
+            number of parcels
+        """
+        # reuse existing buffers if the number of parcels is unchanged
+        if getattr(self, "_sx", None) is not None and (self._sx.size == P):
+            return
+        self._sx = np.empty((P,), dtype=self.dtype)
+        self._sy = np.empty((P,), dtype=self.dtype)
+        self._st = np.empty((P,), dtype=np.float64)
+        self._sdt = np.empty((P,), dtype=np.float64)
+
+    @staticmethod
+    def _copyto(dest: np.ndarray | xr.DataArray | None, src):
+        """
+        Copies coordinates into an existing array if possible
+
+        Parameters
+        ----------
+        dest: np.ndarray, xarray.DataArray or NoneType
+            destination array
+        src: np.ndarray or xarray.DataArray
+            source coordinates
+        """
+        if isinstance(dest, (np.ndarray, xr.DataArray)) and (
+            np.shape(dest) == np.shape(src)
+        ):
+            dest[...] = src
+            return dest
+        return copy.deepcopy(src)
+
+    def _unflatten(
+        self,
+        values: np.ndarray,
+        shape: tuple,
+        like: np.ndarray | xr.DataArray,
+    ):
+        """
+        Reshapes flattened kernel outputs to the dimensions of the input
+
+        Parameters
+        ----------
+        values: np.ndarray
+            flattened output values
+        shape: tuple
+            broadcasted shape of the parcel coordinates
+        like: np.ndarray or xarray.DataArray
+            input coordinates
+        """
+        # copy out of the scratch buffers
+        values = values.reshape(shape).copy()
+        # retain the dimensions and coordinates of DataArrays
+        if isinstance(like, xr.DataArray) and (like.shape == shape):
+            return like.copy(data=values)
+        return values
+
+    @property
+    def _order(self):
+        """Interpolation order for the compiled kernels"""
+        return 0 if (self.method == "nearest") else 1
+
     # PURPOSE: translate a parcel between two times using an advection function
     def translate(self, **kwargs):
         """
@@ -185,18 +713,19 @@ class Advect:
         kwargs.setdefault("N", None)
         kwargs.setdefault("t0", self.t0)
         # update advection class attributes
-        if kwargs["integrator"] != self.integrator:
-            self.integrator = copy.deepcopy(kwargs["integrator"])
-        if kwargs["method"] != self.method:
-            self.method = copy.deepcopy(kwargs["method"])
-        if kwargs["t0"] != self.t0:
-            self.t0 = copy.deepcopy(kwargs["t0"])
+        self.integrator = kwargs["integrator"]
+        self.method = kwargs["method"]
+        if kwargs["t0"] is not self.t0:
+            self.t0 = np.asarray(kwargs["t0"], dtype=np.float64)
         # advect the parcel every step
         # (using closest number of iterations)
         step = np.float64(kwargs["step"])
         # set or calculate the number of steps to advect the dataset
         if kwargs["N"] is not None:
-            n_steps = copy.deepcopy(kwargs["N"])
+            n_steps = kwargs["N"]
+        elif (np.size(self.t) == 1) and (np.size(self.t0) == 1):
+            # number of steps between single start and end times
+            n_steps = np.abs(self.t0 - self.t).item() / step
         elif np.min(self.t0) < np.min(self.t):
             # maximum number of steps to advect backwards in time
             n_steps = np.abs(np.max(self.t) - np.min(self.t0)) / step
@@ -238,18 +767,31 @@ class Advect:
         kwargs.setdefault("N", 1)
         # translate parcel from t to t0 at time step
         dt = (self.t0 - self.t) / np.float64(kwargs["N"])
+        # use the compiled kernel for rectilinear grids if possible
+        if self._compiled and (self.method in ("linear", "nearest")):
+            # flattened coordinates, times and time steps
+            shape, x0, y0, t, dt = self._flatten(dt)
+            U, V, *grid = self._kernel_grid
+            logging.debug(f"Euler: {kwargs['N']} compiled steps")
+            driver = xAdvect.kernels.get_driver("euler", "cpu")
+            driver(U, V, x0, y0, t, dt, kwargs["N"], *grid, self._order)
+            # reshape to the original dimensions
+            self.x0 = self._unflatten(x0, shape, self.x)
+            self.y0 = self._unflatten(y0, shape, self.y)
+            return self
         self.x0 = copy.deepcopy(self.x)
         self.y0 = copy.deepcopy(self.y)
         # keep track of time for 3-dimensional interpolations
-        t = copy.deepcopy(self.t)
+        t = copy.deepcopy(self.t) if self._has_t else None
         for i in range(kwargs["N"]):
             logging.debug(f"Euler step {i + 1} of {kwargs['N']}")
-            ds = self.interp(x=self.x0, y=self.y0, t=t)
+            u, v = self._interp(x=self.x0, y=self.y0, t=t)
             # add displacements to x0 and y0
-            self.x0 += ds.U.values * dt
-            self.y0 += ds.V.values * dt
-            # add to time
-            t += dt
+            self.x0 += u * dt
+            self.y0 += v * dt
+            # add to time for 3-dimensional interpolations
+            if self._has_t:
+                t += dt
         # return the translated coordinates
         return self
 
@@ -267,45 +809,41 @@ class Advect:
         kwargs.setdefault("N", 1)
         # translate parcel from t to t0 at time step
         dt = np.squeeze(self.t0 - self.t) / np.float64(kwargs["N"])
+        # use the fused compiled kernel for rectilinear grids if possible
+        if self._compiled and (self.method in ("linear", "nearest")):
+            # flattened coordinates, times and time steps
+            shape, x0, y0, t, dt = self._flatten(dt)
+            U, V, *grid = self._kernel_grid
+            logging.debug(f"RK4: {kwargs['N']} compiled steps")
+            # integrate on the CUDA device or in parallel on the CPU
+            driver = xAdvect.kernels.get_driver("RK4", self.device)
+            driver(U, V, x0, y0, t, dt, kwargs["N"], *grid, self._order)
+            # reshape to the original dimensions
+            self.x0 = self._unflatten(x0, shape, self.x)
+            self.y0 = self._unflatten(y0, shape, self.y)
+            return self
         self.x0 = copy.deepcopy(self.x)
         self.y0 = copy.deepcopy(self.y)
         # keep track of time for 3-dimensional interpolations
-        t = copy.deepcopy(self.t)
+        t = copy.deepcopy(self.t) if self._has_t else None
         for i in range(kwargs["N"]):
             logging.debug(f"RK4 step {i + 1} of {kwargs['N']}")
-            ds1 = self.interp(x=self.x0, y=self.y0, t=t)
-            x2 = self.x0 + 0.5 * ds1.U.values * dt
-            y2 = self.y0 + 0.5 * ds1.V.values * dt
-            ds2 = self.interp(x=x2, y=y2, t=t)
-            x3 = self.x0 + 0.5 * ds2.U.values * dt
-            y3 = self.y0 + 0.5 * ds2.V.values * dt
-            ds3 = self.interp(x=x3, y=y3, t=t)
-            x4 = self.x0 + ds3.U.values * dt
-            y4 = self.y0 + ds3.V.values * dt
-            ds4 = self.interp(x=x4, y=y4, t=t)
+            u1, v1 = self._interp(x=self.x0, y=self.y0, t=t)
+            x2 = self.x0 + 0.5 * u1 * dt
+            y2 = self.y0 + 0.5 * v1 * dt
+            u2, v2 = self._interp(x=x2, y=y2, t=t)
+            x3 = self.x0 + 0.5 * u2 * dt
+            y3 = self.y0 + 0.5 * v2 * dt
+            u3, v3 = self._interp(x=x3, y=y3, t=t)
+            x4 = self.x0 + u3 * dt
+            y4 = self.y0 + v3 * dt
+            u4, v4 = self._interp(x=x4, y=y4, t=t)
             # add displacements to x0 and y0
-            self.x0 += (
-                dt
-                * (
-                    ds1.U.values
-                    + 2.0 * ds2.U.values
-                    + 2.0 * ds3.U.values
-                    + ds4.U.values
-                )
-                / 6.0
-            )
-            self.y0 += (
-                dt
-                * (
-                    ds1.V.values
-                    + 2.0 * ds2.V.values
-                    + 2.0 * ds3.V.values
-                    + ds4.V.values
-                )
-                / 6.0
-            )
-            # add to time
-            t += dt
+            self.x0 += dt * (u1 + 2.0 * u2 + 2.0 * u3 + u4) / 6.0
+            self.y0 += dt * (v1 + 2.0 * v2 + 2.0 * v3 + v4) / 6.0
+            # add to time for 3-dimensional interpolations
+            if self._has_t:
+                t += dt
         # return the translated coordinates
         return self
 
@@ -321,23 +859,6 @@ class Advect:
         """
         # set default keyword options
         kwargs.setdefault("N", 1)
-        # coefficients in Butcher tableau for Runge-Kutta-Fehlberg 4(5) method
-        b4 = [
-            25.0 / 216.0,
-            0.0,
-            1408.0 / 2565.0,
-            2197.0 / 4104.0,
-            -1.0 / 5.0,
-            0.0,
-        ]
-        b5 = [
-            16.0 / 135.0,
-            0.0,
-            6656.0 / 12825.0,
-            28561.0 / 56430.0,
-            -9.0 / 50.0,
-            2.0 / 55.0,
-        ]
         # using an adaptive step size:
         # iterate solution until the difference is less than the tolerance
         # difference between the 4th and 5th order solutions
@@ -348,33 +869,43 @@ class Advect:
         scale = 1
         self.x0 = copy.deepcopy(self.x)
         self.y0 = copy.deepcopy(self.y)
+        # 4th and 5th order accurate solutions
+        X4OA, Y4OA, X5OA, Y5OA = (None, None, None, None)
+        # time for 3-dimensional interpolations
+        t = None
+        # reuse the stage velocity arrays of the compiled kernel if possible
+        if self._compiled and (self.method in ("linear", "nearest")):
+            interp = self._RKF45_stages
+        else:
+            interp = self.RFK45_interp
         # while the difference (sigma) is greater than the tolerance
         while (sigma > tolerance) or np.isnan(sigma):
             # translate parcel from t to t0 at time step
             dt = (self.t0 - self.t) / np.float64(scale * kwargs["N"])
-            X4OA = copy.deepcopy(self.x)
-            Y4OA = copy.deepcopy(self.y)
-            X5OA = copy.deepcopy(self.x)
-            Y5OA = copy.deepcopy(self.y)
+            # reset solutions to the initial coordinates
+            X4OA = self._copyto(X4OA, self.x)
+            Y4OA = self._copyto(Y4OA, self.y)
+            X5OA = self._copyto(X5OA, self.x)
+            Y5OA = self._copyto(Y5OA, self.y)
             # keep track of time for 3-dimensional interpolations
-            t = copy.deepcopy(self.t)
+            t = self._copyto(t, self.t) if self._has_t else None
             for i in range(scale * kwargs["N"]):
                 logging.debug(f"RKF45 step {i + 1} of {scale * kwargs['N']}")
                 # calculate fourth order accurate solutions
-                u4, v4 = self.RFK45_interp(X4OA, Y4OA, dt, t=t)
+                u4, v4 = interp(X4OA, Y4OA, dt, t=t)
                 # add displacements to X40A and Y40A
-                X4OA += dt * np.dot(b4, u4)
-                Y4OA += dt * np.dot(b4, v4)
+                X4OA += dt * np.tensordot(_RKF45_B4, u4, axes=1)
+                Y4OA += dt * np.tensordot(_RKF45_B4, v4, axes=1)
                 # calculate fifth order accurate solutions
-                u5, v5 = self.RFK45_interp(X5OA, Y5OA, dt, t=t)
+                u5, v5 = interp(X5OA, Y5OA, dt, t=t)
                 # add displacements to X50A and Y50A
-                X5OA += dt * np.dot(b5, u5)
-                Y5OA += dt * np.dot(b5, v5)
-                # add to time
-                t += dt
+                X5OA += dt * np.tensordot(_RKF45_B5, u5, axes=1)
+                Y5OA += dt * np.tensordot(_RKF45_B5, v5, axes=1)
+                # add to time for 3-dimensional interpolations
+                if self._has_t:
+                    t += dt
             # calculate difference between 4th and 5th order accurate solutions
-            variance = (X5OA - X4OA) ** 2 + (Y5OA - Y4OA) ** 2
-            sigma = np.sqrt(np.nanmean(variance))
+            sigma = self._sigma(X4OA, Y4OA, X5OA, Y5OA)
             logging.info(f"RKF45 sigma: {sigma:.4f} (tolerance: {tolerance})")
             # if sigma is less than the tolerance: save x and y coordinates
             # else: multiply scale by factors of 2 and re-run iteration
@@ -386,6 +917,27 @@ class Advect:
         # return the translated coordinates
         return self
 
+    @staticmethod
+    def _sigma(*args):
+        """
+        Calculates the root mean square difference between the
+        4th and 5th order Runge-Kutta-Fehlberg solutions
+
+        Parameters
+        ----------
+        *args: np.ndarray
+            x and y-coordinates of the 4th and 5th order solutions
+        """
+        arrays = [np.asarray(a, dtype=np.float64) for a in args]
+        X4OA, Y4OA, X5OA, Y5OA = np.broadcast_arrays(*arrays)
+        # use a single compiled reduction if available
+        if xAdvect.kernels.numba_available:
+            return xAdvect.kernels.rkf45_sigma(
+                X4OA.ravel(), Y4OA.ravel(), X5OA.ravel(), Y5OA.ravel()
+            )
+        variance = (X5OA - X4OA) ** 2 + (Y5OA - Y4OA) ** 2
+        return np.sqrt(np.nanmean(variance))
+
     # PURPOSE: calculates X and Y velocities for Runge-Kutta-Fehlberg 4(5) method
     def RFK45_interp(
         self, xi: np.ndarray, yi: np.ndarray, dt: np.ndarray, **kwargs
@@ -405,114 +957,75 @@ class Advect:
             time coordinates
         """
         kwargs.setdefault("t", None)
-        # Butcher tableau for Runge-Kutta-Fehlberg 4(5) method
-        A = np.array(
-            [
-                [1.0 / 4.0, 0.0, 0.0, 0.0, 0.0],
-                [3.0 / 32.0, 9.0 / 32.0, 0.0, 0.0, 0.0],
-                [1932.0 / 2197.0, -7200.0 / 2197.0, 7296.0 / 2197.0, 0.0, 0.0],
-                [439.0 / 216.0, -8.0, 3680.0 / 513.0, -845.0 / 4104.0, 0.0],
-                [
-                    -8.0 / 27.0,
-                    2.0,
-                    -3544.0 / 2565.0,
-                    1859.0 / 4104.0,
-                    -11.0 / 40.0,
-                ],
-            ]
-        )
+        # use the fused compiled kernel for rectilinear grids if possible
+        # (copying the velocities from the reused stage arrays)
+        if self._compiled and (self.method in ("linear", "nearest")):
+            U, V = self._RKF45_stages(xi, yi, dt, kwargs["t"])
+            return (U.copy(), V.copy())
+        # calculate velocities at the first stage
+        u, v = self._interp(x=xi, y=yi, t=kwargs["t"])
+        # allocate for the velocities at each stage
+        U = np.zeros((6, *np.shape(u)))
+        V = np.zeros((6, *np.shape(v)))
+        U[0] = u
+        V[0] = v
         # calculate velocities and parameters for iteration
-        ds1 = self.interp(x=xi, y=yi, t=kwargs["t"])
-        x2 = xi + A[0, 0] * ds1.U.values * dt
-        y2 = yi + A[0, 0] * ds1.V.values * dt
-        ds2 = self.interp(x=x2, y=y2, t=kwargs["t"])
-        x3 = xi + (A[1, 0] * ds1.U.values + A[1, 1] * ds2.U.values) * dt
-        y3 = yi + (A[1, 0] * ds1.V.values + A[1, 1] * ds2.V.values) * dt
-        ds3 = self.interp(x=x3, y=y3, t=kwargs["t"])
-        x4 = (
-            xi
-            + (
-                A[2, 0] * ds1.U.values
-                + A[2, 1] * ds2.U.values
-                + A[2, 2] * ds3.U.values
-            )
-            * dt
-        )
-        y4 = (
-            yi
-            + (
-                A[2, 0] * ds1.V.values
-                + A[2, 1] * ds2.V.values
-                + A[2, 2] * ds3.V.values
-            )
-            * dt
-        )
-        ds4 = self.interp(x=x4, y=y4, t=kwargs["t"])
-        x5 = (
-            xi
-            + (
-                A[3, 0] * ds1.U.values
-                + A[3, 1] * ds2.U.values
-                + A[3, 2] * ds3.U.values
-                + A[3, 3] * ds4.U.values
-            )
-            * dt
-        )
-        y5 = (
-            yi
-            + (
-                A[3, 0] * ds1.V.values
-                + A[3, 1] * ds2.V.values
-                + A[3, 2] * ds3.V.values
-                + A[3, 3] * ds4.V.values
-            )
-            * dt
-        )
-        ds5 = self.interp(x=x5, y=y5, t=kwargs["t"])
-        x6 = (
-            xi
-            + (
-                A[4, 0] * ds1.U.values
-                + A[4, 1] * ds2.U.values
-                + A[4, 2] * ds3.U.values
-                + A[4, 3] * ds4.U.values
-                + A[4, 4] * ds5.U.values
-            )
-            * dt
-        )
-        y6 = (
-            yi
-            + (
-                A[4, 0] * ds1.V.values
-                + A[4, 1] * ds2.V.values
-                + A[4, 2] * ds3.V.values
-                + A[4, 3] * ds4.V.values
-                + A[4, 4] * ds5.V.values
-            )
-            * dt
-        )
-        ds6 = self.interp(x=x6, y=y6, t=kwargs["t"])
-        U = np.array(
-            [
-                ds1.U.values,
-                ds2.U.values,
-                ds3.U.values,
-                ds4.U.values,
-                ds5.U.values,
-                ds6.U.values,
-            ]
+        for k in range(5):
+            # weighted sum of the velocities from the previous stages
+            x = xi + np.tensordot(_RKF45_A[k, : k + 1], U[: k + 1], axes=1) * dt
+            y = yi + np.tensordot(_RKF45_A[k, : k + 1], V[: k + 1], axes=1) * dt
+            U[k + 1], V[k + 1] = self._interp(x=x, y=y, t=kwargs["t"])
+        return (U, V)
+
+    def _RKF45_stages(
+        self,
+        xi: np.ndarray,
+        yi: np.ndarray,
+        dt: np.ndarray,
+        t: np.ndarray | None = None,
+    ):
+        """
+        Calculates X and Y velocities for Runge-Kutta-Fehlberg 4(5) method
+        using compiled kernels
+
+        Parameters
+        ----------
+        xi: np.ndarray
+            x-coordinates
+        yi: np.ndarray
+            y-coordinates
+        dt: np.ndarray
+            integration time step size
+        t: np.ndarray or NoneType, default None
+            time coordinates
+
+        Returns
+        -------
+        U: np.ndarray
+            x-velocities at each stage (reused between calls)
+        V: np.ndarray
+            y-velocities at each stage (reused between calls)
+        """
+        t = 0.0 if t is None else t
+        # broadcast coordinates to a common shape
+        arrays = [np.asarray(a, dtype=np.float64) for a in (xi, yi, t, dt)]
+        arrays = np.broadcast_arrays(*arrays)
+        shape = arrays[0].shape
+        x, y, t, dt = [np.ascontiguousarray(a).ravel() for a in arrays]
+        # reuse stacked velocities if the number of parcels is unchanged
+        stages = (len(_RKF45_A) + 1, x.size)
+        if getattr(self, "_us", None) is None or (self._us.shape != stages):
+            self._us = np.empty(stages, dtype=self.dtype)
+            self._vs = np.empty(stages, dtype=self.dtype)
+        # calculate velocities at each stage
+        U, V, *grid = self._kernel_grid
+        xAdvect.kernels.rkf45_stages(
+            U, V, x, y, t, dt, *grid, self._order, _RKF45_A, self._us, self._vs
         )
-        V = np.array(
-            [
-                ds1.V.values,
-                ds2.V.values,
-                ds3.V.values,
-                ds4.V.values,
-                ds5.V.values,
-                ds6.V.values,
-            ]
+        return (
+            self._us.reshape((-1, *shape)),
+            self._vs.reshape((-1, *shape)),
         )
-        return (U, V)
 
     @property
     def distance(self):
@@ -531,6 +1044,16 @@ class Advect:
         else:
             return dist
 
+    def __getattr__(self, name):
+        # extract velocity grids when first used
+        # (avoids loading lazy arrays when initializing)
+        if name in _grid_attributes:
+            self._prepare_grid()
+            return object.__getattribute__(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
     def __getitem__(self, key):
         return getattr(self, key)
 
@@ -1,10 +1,29 @@
 #!/usr/bin/env python
 """
 fetch.py
-Written by Tyler Sutterley (01/2026)
+Written by Tyler Sutterley (10/2026)
 Download routines for NASA Earthdata files
 
 UPDATE HISTORY:
+    Updated 10/2026: cache user tokens and credentials for each host and user
+    Updated 10/2026: download granules concurrently in fetch
+    Updated 10/2026: reuse openers with verified credentials
+    Updated 10/2026: use pooled requests sessions if available
+    Updated 10/2026: add asynchronous downloads with aiohttp
+    Updated 10/2026: hash and write local files in a single streaming pass
+    Updated 10/2026: use 1 MiB buffers for reading and writing downloads
+    Updated 10/2026: cache temporary s3 credentials until expiration
+    Updated 10/2026: precompile s3 prefix pattern with case-insensitive flag
+    Updated 10/2026: filter CMR json responses with a list comprehension
+    Updated 10/2026: parse json responses with orjson if available
+    Updated 10/2026: generate presigned urls for multiple keys concurrently
+    Updated 10/2026: download large files in parallel parts with range requests
+    Updated 10/2026: encode CMR query parameters with urlencode
+    Updated 10/2026: expire cached logins and reuse unexpired user tokens
+    Updated 10/2026: only generate checksums if a hash is provided
+    Updated 10/2026: overlap CMR pagination with granule downloads
+    Updated 10/2026: join remote urls once and split only granule names
+    Updated 10/2026: check for existing granules with one directory scan
     Updated 01/2026: return the list of queried granules from fetch
     Written 01/2026
 """
@@ -16,24 +35,37 @@ import os
 import re
 import ssl
 import sys
-import json
+import time
 import netrc
 import base64
+import asyncio
 import shutil
 import getpass
 import hashlib
 import logging
 import pathlib
 import builtins
+import datetime
 import posixpath
+import urllib.parse
+import concurrent.futures
 from xAdvect.utilities import (
     CookieJar,
     urllib2,
     _default_ssl_context,
+    _json_loads,
+    dependency_available,
     get_cache_path,
+    import_dependency,
     url_split,
 )
 
+# attempt imports
+aiohttp = import_dependency("aiohttp")
+aiohttp_available = dependency_available("aiohttp")
+requests = import_dependency("requests")
+requests_available = dependency_available("requests")
+
 __all__ = [
     "s3_client",
     "s3_filesystem",
@@ -41,8 +73,10 @@ __all__ = [
     "s3_key",
     "s3_presigned_url",
     "generate_presigned_url",
+    "generate_presigned_urls",
     "attempt_login",
     "build_opener",
+    "session",
     "get_token",
     "list_tokens",
     "revoke_token",
@@ -50,10 +84,28 @@ __all__ = [
     "from_earthdata",
     "cmr_filter_json",
     "cmr",
+    "cmr_iter",
     "fetch",
+    "async_fetch",
 ]
 
 
+# openers with verified credentials for each host, user and handlers
+# and the time of verification
+_openers = {}
+# time in seconds to reuse verified openers
+_login_ttl = 3600.0
+# unexpired NASA Earthdata user tokens for each host and user
+_tokens = {}
+# pooled requests sessions for each Earthdata login host
+_sessions = {}
+# verified credentials for each Earthdata login host and user
+_credentials = {}
+# temporary s3 credentials and expiration times for each endpoint
+_s3_credentials = {}
+# s3 clients and file systems for each endpoint and region
+_s3_sessions = {}
+
 # NASA on-prem DAAC providers
 _daac_providers = {
     "gesdisc": "GES_DISC",
@@ -94,6 +146,57 @@ _s3_buckets = {
     "podaac": "podaac-ops-cumulus-protected",
 }
 
+# CMR descriptor links for each endpoint
+_cmr_rel = {
+    "data": "http://esipfed.org/ns/fedsearch/1.1/data#",
+    "opendap": "http://esipfed.org/ns/fedsearch/1.1/service#",
+    "s3": "http://esipfed.org/ns/fedsearch/1.1/s3#",
+}
+
+# s3 url prefix pattern
+_s3_prefix = re.compile(r"^s3://", re.IGNORECASE)
+
+
+# PURPOSE: get temporary s3 credentials for NASA Cumulus
+def _cumulus(HOST: str, timeout: int | None = None, buffer: float = 60.0):
+    """
+    Get temporary s3 credentials for NASA Cumulus, reusing
+    cached credentials until they are about to expire
+
+    Parameters
+    ----------
+    HOST: str
+        NASA Cumulus AWS S3 credential host
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    buffer: float, default 60.0
+        time in seconds before expiration to refresh credentials
+
+    Returns
+    -------
+    cumulus: dict
+        temporary s3 credentials
+    expiration: float
+        expiration time of the credentials as a POSIX timestamp
+    """
+    # reuse cached credentials if not expiring
+    if (HOST in _s3_credentials) and (
+        _s3_credentials[HOST][1] > (time.time() + buffer)
+    ):
+        return _s3_credentials[HOST]
+    request = urllib2.Request(HOST)
+    response = urllib2.urlopen(request, timeout=timeout)
+    cumulus = _json_loads(response.read())
+    # parse the expiration time (credentials are valid for 1 hour)
+    try:
+        expiration = datetime.datetime.fromisoformat(cumulus["expiration"])
+    except (KeyError, TypeError, ValueError):
+        expiration = time.time() + 3600.0
+    else:
+        expiration = expiration.timestamp()
+    _s3_credentials[HOST] = (cumulus, expiration)
+    return _s3_credentials[HOST]
+
 
 # PURPOSE: get AWS s3 client for NSIDC Cumulus
 def s3_client(
@@ -121,9 +224,11 @@ def s3_client(
     """
     import boto3
 
-    request = urllib2.Request(HOST)
-    response = urllib2.urlopen(request, timeout=timeout)
-    cumulus = json.loads(response.read())
+    cumulus, expiration = _cumulus(HOST, timeout=timeout)
+    # reuse the AWS client if created with the current credentials
+    key = ("client", HOST, region_name)
+    if (key in _s3_sessions) and (_s3_sessions[key][1] == expiration):
+        return _s3_sessions[key][0]
     # get AWS client object
     client = boto3.client(
         "s3",
@@ -132,6 +237,7 @@ def s3_client(
         aws_session_token=cumulus["sessionToken"],
         region_name=region_name,
     )
+    _s3_sessions[key] = (client, expiration)
     # return the AWS client for region
     return client
 
@@ -162,9 +268,11 @@ def s3_filesystem(
     """
     import s3fs
 
-    request = urllib2.Request(HOST)
-    response = urllib2.urlopen(request, timeout=timeout)
-    cumulus = json.loads(response.read())
+    cumulus, expiration = _cumulus(HOST, timeout=timeout)
+    # reuse the file system if created with the current credentials
+    key = ("filesystem", HOST, region_name)
+    if (key in _s3_sessions) and (_s3_sessions[key][1] == expiration):
+        return _s3_sessions[key][0]
     # get AWS file system session object
     session = s3fs.S3FileSystem(
         anon=False,
@@ -173,6 +281,7 @@ def s3_filesystem(
         token=cumulus["sessionToken"],
         client_kwargs=dict(region_name=region_name),
     )
+    _s3_sessions[key] = (session, expiration)
     # return the AWS session for region
     return session
 
@@ -193,7 +302,7 @@ def s3_bucket(presigned_url: str):
         s3 bucket name
     """
     host = url_split(presigned_url)
-    bucket = re.sub(r"s3:\/\/", r"", host[0], re.IGNORECASE)
+    bucket = _s3_prefix.sub("", host[0], count=1)
     return bucket
 
 
@@ -265,23 +374,66 @@ def generate_presigned_url(bucket: str, key: str, expiration: int = 3600):
     presigned_url: str
         s3 presigned https url
     """
-    import boto3
-
     # generate a presigned URL for S3 object
-    s3 = boto3.client("s3")
-    try:
-        response = s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": bucket, "Key": key},
-            ExpiresIn=expiration,
-        )
-    except Exception as exc:
-        logging.error(exc)
-        return None
+    (response,) = generate_presigned_urls(bucket, [key], expiration)
     # The response contains the presigned URL
     return response
 
 
+# PURPOSE: generate s3 presigned https urls for a list of keys
+def generate_presigned_urls(
+    bucket: str,
+    keys: list,
+    expiration: int = 3600,
+    max_workers: int = 16,
+):
+    """
+    Generate presigned https URLs to share S3 objects
+
+    Parameters
+    ----------
+    bucket: str
+        s3 bucket name
+    keys: list
+        s3 bucket keys for objects
+    expiration: int
+        Time in seconds for the presigned URLs to remain valid
+    max_workers: int, default 16
+        maximum number of concurrent signing threads
+
+    Returns
+    -------
+    presigned_urls: list
+        s3 presigned https urls
+    """
+    import boto3
+
+    # shared client for all S3 objects
+    s3 = boto3.client("s3")
+
+    # generate a presigned URL for a S3 object
+    def presign(key):
+        try:
+            response = s3.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket, "Key": key},
+                ExpiresIn=expiration,
+            )
+        except Exception as exc:
+            logging.error(exc)
+            return None
+        return response
+
+    # sign single keys without a thread pool
+    if len(keys) <= 1:
+        return [presign(key) for key in keys]
+    max_workers = min(max_workers, len(keys))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        presigned_urls = list(ex.map(presign, keys))
+    # return the list of presigned URLs
+    return presigned_urls
+
+
 # PURPOSE: attempt to build an opener with netrc
 def attempt_login(
     urs: str = "urs.earthdata.nasa.gov",
@@ -340,6 +492,13 @@ def attempt_login(
     # if username or password are not available
     if not username:
         username = builtins.input(f"Username for {urs}: ")
+    # reuse an existing opener for the host, user and handlers
+    options = (password_manager, redirect, authorization_header)
+    key = (urs, username, *options)
+    if (key in _openers) and (time.time() - _openers[key][1] < _login_ttl):
+        opener, _ = _openers[key]
+        urllib2.install_opener(opener)
+        return opener
     if not password:
         password = getpass.getpass(prompt=f"Password for {username}@{urs}: ")
     # for each retry
@@ -361,6 +520,11 @@ def attempt_login(
         except Exception as exc:
             logging.error(exc)
         else:
+            _openers[key] = (opener, time.time())
+            _credentials[(urs, username)] = (username, password)
+            # use the verified credentials for pooled sessions
+            if requests_available:
+                session(urs=urs, auth=(username, password))
             return opener
         # reattempt login
         username = builtins.input(f"Username for {urs}: ")
@@ -369,6 +533,51 @@ def attempt_login(
     raise RuntimeError("End of Retries: Check NASA Earthdata credentials")
 
 
+# PURPOSE: get the NASA Earthdata username for a host
+def _username(urs: str = "urs.earthdata.nasa.gov", **kwargs):
+    """
+    Get the NASA Earthdata username for a host from a netrc file
+    or from keyword arguments without prompting
+
+    Parameters
+    ----------
+    urs: str, default 'urs.earthdata.nasa.gov'
+        NASA Earthdata URS 3 host
+    username: str, default from environmental variable
+        NASA Earthdata username
+    netrc: str, default ~/.netrc
+        path to .netrc file for authentication
+    """
+    kwargs.setdefault("username", os.environ.get("EARTHDATA_USERNAME"))
+    kwargs.setdefault("netrc", pathlib.Path.home().joinpath(".netrc"))
+    try:
+        username, _, _ = netrc.netrc(kwargs["netrc"]).authenticators(urs)
+    except Exception:
+        username = kwargs["username"]
+    return username
+
+
+# PURPOSE: remove cached credentials for a NASA Earthdata host
+def _invalidate(
+    urs: str = "urs.earthdata.nasa.gov", username: str | None = None
+):
+    """
+    Remove cached openers, credentials and tokens for a
+    NASA Earthdata host after a failed authorization
+
+    Parameters
+    ----------
+    urs: str, default 'urs.earthdata.nasa.gov'
+        NASA Earthdata URS 3 host
+    username: str or NoneType, default None
+        NASA Earthdata username (default all users)
+    """
+    for cache in (_openers, _credentials, _tokens):
+        for key in [k for k in cache if k[0] == urs]:
+            if (username is None) or (key[1] == username):
+                cache.pop(key)
+
+
 # PURPOSE: "login" to NASA Earthdata with supplied credentials
 def build_opener(
     username: str,
@@ -442,15 +651,78 @@ def build_opener(
     return opener
 
 
+# PURPOSE: get a requests session with connection pooling
+def session(
+    urs: str | None = "urs.earthdata.nasa.gov",
+    auth: tuple | None = None,
+    retries: int = 5,
+):
+    """
+    Get a ``requests`` session with connection pooling and retries
+    for NASA Earthdata
+
+    Parameters
+    ----------
+    urs: str or NoneType, default 'urs.earthdata.nasa.gov'
+        Earthdata login URS 3 host
+
+        Set to ``None`` for sessions without Earthdata credentials
+    auth: tuple or NoneType, default None
+        NASA Earthdata username and password
+    retries: int, default 5
+        number of retry attempts
+
+    Returns
+    -------
+    session: obj
+        ``requests.Session`` instance
+    """
+    # reuse an existing session for the host
+    if urs in _sessions:
+        if auth is not None:
+            _sessions[urs].auth = auth
+        return _sessions[urs]
+    import requests.adapters
+    import urllib3.util.retry
+
+    class EarthdataSession(requests.Session):
+        # only send credentials to the Earthdata login host when redirected
+        # (other hosts have the authorization header removed)
+        def rebuild_auth(self, prepared_request, response):
+            host = urllib.parse.urlparse(prepared_request.url).hostname
+            if (urs is not None) and (host == urs) and self.auth:
+                prepared_request.prepare_auth(self.auth)
+                return
+            super().rebuild_auth(prepared_request, response)
+
+    _sessions[urs] = EarthdataSession()
+    _sessions[urs].auth = auth
+    # mount adapter with connection pooling and retries
+    retry = urllib3.util.retry.Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=10, pool_maxsize=20, max_retries=retry
+    )
+    _sessions[urs].mount("https://", adapter)
+    _sessions[urs].mount("http://", adapter)
+    return _sessions[urs]
+
+
 # PURPOSE: generate a NASA Earthdata user token
 def get_token(
     HOST: str = "https://urs.earthdata.nasa.gov/api/users/token",
     build: bool = True,
     urs: str = "urs.earthdata.nasa.gov",
+    **kwargs,
 ):
     """
     Generate a NASA Earthdata User Token
 
+    Reuses the last generated token for the host if unexpired
+
     Parameters
     ----------
     HOST: str or list
@@ -474,6 +746,10 @@ def get_token(
     # set default keyword arguments
     kwargs.setdefault("username", os.environ.get("EARTHDATA_USERNAME"))
     kwargs.setdefault("password", os.environ.get("EARTHDATA_PASSWORD"))
+    # reuse the last generated token for the user if unexpired
+    key = (urs, _username(urs, **kwargs))
+    if build and (key in _tokens) and (_tokens[key][1] > time.time()):
+        return _tokens[key][0]
     # attempt to build urllib2 opener and check credentials
     if build:
         attempt_login(
@@ -485,12 +761,28 @@ def get_token(
         response = urllib2.urlopen(request)
     except urllib2.HTTPError as exc:
         logging.debug(exc.code)
+        # remove cached credentials if unauthorized
+        if exc.code in (401, 403):
+            _invalidate(urs, _username(urs, **kwargs))
         raise RuntimeError(exc.reason) from exc
     except urllib2.URLError as exc:
         logging.debug(exc.reason)
         raise RuntimeError("Check internet connection") from exc
-    # read and return JSON response
-    return json.loads(response.read())
+    # read JSON response
+    token = _json_loads(response.read())
+    # cache the token until its expiration date
+    try:
+        expiration = datetime.datetime.strptime(
+            token["expiration_date"], "%m/%d/%Y"
+        ).timestamp()
+    except (KeyError, TypeError, ValueError):
+        pass
+    else:
+        # only cache tokens generated with verified credentials
+        if build:
+            _tokens[key] = (token, expiration)
+    # return JSON response
+    return token
 
 
 # PURPOSE: generate a NASA Earthdata user token
@@ -540,12 +832,15 @@ def list_tokens(
         response = urllib2.urlopen(request)
     except urllib2.HTTPError as exc:
         logging.debug(exc.code)
+        # remove cached credentials if unauthorized
+        if exc.code in (401, 403):
+            _invalidate(urs, _username(urs, **kwargs))
         raise RuntimeError(exc.reason) from exc
     except urllib2.URLError as exc:
         logging.debug(exc.reason)
         raise RuntimeError("Check internet connection") from exc
     # read and return JSON response
-    return json.loads(response.read())
+    return _json_loads(response.read())
 
 
 # PURPOSE: revoke a NASA Earthdata user token
@@ -554,6 +849,7 @@ def revoke_token(
     HOST: str = f"https://urs.earthdata.nasa.gov/api/users/revoke_token",
     build: bool = True,
     urs: str = "urs.earthdata.nasa.gov",
+    **kwargs,
 ):
     """
     Generate a NASA Earthdata User Token
@@ -594,10 +890,17 @@ def revoke_token(
         response = urllib2.urlopen(request)
     except urllib2.HTTPError as exc:
         logging.debug(exc.code)
+        # remove cached credentials if unauthorized
+        if exc.code in (401, 403):
+            _invalidate(urs, _username(urs, **kwargs))
         raise RuntimeError(exc.reason) from exc
     except urllib2.URLError as exc:
         logging.debug(exc.reason)
         raise RuntimeError("Check internet connection") from exc
+    # remove the revoked token from the cache
+    for key, (cached, _) in list(_tokens.items()):
+        if (key[0] == urs) and (cached.get("access_token") == token):
+            _tokens.pop(key)
     # verbose response
     logging.debug(f"Token Revoked: {token}")
 
@@ -619,6 +922,147 @@ def check_credentials():
         return True
 
 
+# errors from opening urls
+_errors = (urllib2.HTTPError, urllib2.URLError)
+if requests_available:
+    _errors += (requests.RequestException,)
+
+
+# PURPOSE: open a url with a pooled session or urllib
+def _open(
+    url: str,
+    headers: dict | None = None,
+    timeout: int | None = None,
+    urs: str | None = None,
+    opener=None,
+    method: str = "GET",
+):
+    """
+    Open a url using a pooled ``requests`` session if available
+
+    Parameters
+    ----------
+    url: str
+        remote url
+    headers: dict or NoneType, default None
+        request headers
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    urs: str or NoneType, default None
+        Earthdata login URS 3 host for credentials
+    opener: obj or NoneType, default None
+        ``OpenerDirector`` instance
+    method: str, default 'GET'
+        HTTP request method
+
+    Returns
+    -------
+    response: obj
+        file-like response with ``read`` and ``info`` methods
+    """
+    headers = headers or {}
+    # use urllib if requests is unavailable or with a specified opener
+    if (opener is not None) or not requests_available:
+        request = urllib2.Request(url, headers=headers, method=method)
+        if opener is not None:
+            return opener.open(request, timeout=timeout)
+        return urllib2.urlopen(request, timeout=timeout)
+    # stream the response from a pooled session
+    r = session(urs=urs).request(
+        method, url, headers=headers, timeout=timeout, stream=True
+    )
+    r.raise_for_status()
+    r.raw.decode_content = True
+    # add response headers to the file-like object
+    r.raw.info = lambda: r.headers
+    return r.raw
+
+
+# PURPOSE: get byte ranges for downloading a file in parts
+def _ranges(
+    url: str,
+    parts: int,
+    timeout: int | None = None,
+    urs: str | None = None,
+):
+    """
+    Get byte ranges for downloading a file in parts if the
+    server accepts range requests
+
+    Parameters
+    ----------
+    url: str
+        remote url
+    parts: int
+        number of parts
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    urs: str or NoneType, default None
+        Earthdata login URS 3 host for credentials
+
+    Returns
+    -------
+    ranges: list or NoneType
+        first and last bytes of each part
+    """
+    response = _open(url, timeout=timeout, urs=urs, method="HEAD")
+    headers = {k.lower(): v for k, v in dict(response.info()).items()}
+    size = int(headers.get("content-length", 0))
+    # check that the server accepts byte ranges
+    if (headers.get("accept-ranges") != "bytes") or (size < parts):
+        return None
+    return [
+        (i * size // parts, (i + 1) * size // parts - 1) for i in range(parts)
+    ]
+
+
+# PURPOSE: download byte ranges of a file concurrently
+def _download_parts(
+    url: str,
+    local: pathlib.Path,
+    ranges: list,
+    timeout: int | None = None,
+    urs: str | None = None,
+    chunk: int = 1048576,
+):
+    """
+    Download byte ranges of a file concurrently into a local file
+
+    Parameters
+    ----------
+    url: str
+        remote url
+    local: pathlib.Path
+        path to allocated local file
+    ranges: list
+        first and last bytes of each part
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    urs: str or NoneType, default None
+        Earthdata login URS 3 host for credentials
+    chunk: int, default 1048576
+        buffer size in bytes for reading and writing files
+    """
+
+    # download a part and write at its offset in the local file
+    def part(start, end):
+        headers = {"Range": f"bytes={start}-{end}"}
+        response = _open(url, headers=headers, timeout=timeout, urs=urs)
+        # verify that the server returned the partial content
+        if response.status != 206:
+            raise urllib2.URLError(f"Range request not satisfied for {url}")
+        with local.open(mode="r+b") as f:
+            f.seek(start)
+            while buffer := response.read(chunk):
+                f.write(buffer)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+        futures = [ex.submit(part, *r) for r in ranges]
+        # raise any exceptions from the downloads
+        for future in futures:
+            future.result()
+
+
 # PURPOSE: download a file from a NASA Earthdata provider
 def from_earthdata(
     HOST: str | list,
@@ -627,7 +1071,9 @@ def from_earthdata(
     urs: str = "urs.earthdata.nasa.gov",
     local: str | pathlib.Path | None = None,
     hash: str = "",
-    chunk: int = 16384,
+    hash_algorithm: str = "md5",
+    chunk: int = 1048576,
+    parallel_parts: int = 1,
     verbose: bool = False,
     mode: oct = 0o775,
     **kwargs,
@@ -652,9 +1098,17 @@ def from_earthdata(
     local: str or NoneType, default None
         path to local file
     hash: str, default ''
-        MD5 hash of local file
-    chunk: int, default 16384
-        chunk size for transfer encoding
+        checksum hash of local file
+
+        Checksums are only generated if a hash is provided
+    hash_algorithm: str, default 'md5'
+        ``hashlib`` algorithm of the checksum hash
+    chunk: int, default 1048576
+        buffer size in bytes for reading and writing files
+    parallel_parts: int, default 1
+        number of parts to download concurrently with range requests
+
+        Only used if ``local`` is provided and the server accepts ranges
     verbose: bool, default False
         print file transfer information
     mode: oct, default 0o775
@@ -664,6 +1118,8 @@ def from_earthdata(
     -------
     remote_buffer: obj
         BytesIO representation of file
+
+        Path to the local file if ``local`` is provided
     response_error: str or None
         notification for response error
     """
@@ -679,42 +1135,75 @@ def from_earthdata(
     # verify inputs for remote https host
     if isinstance(HOST, str):
         HOST = url_split(HOST)
+    # full url of remote file
+    url = posixpath.join(*HOST)
     # try downloading from https
     try:
+        # get byte ranges for downloading file parts concurrently
+        if local and (parallel_parts > 1):
+            ranges = _ranges(url, parallel_parts, timeout, urs)
+        else:
+            ranges = None
         # Create and submit request.
-        request = urllib2.Request(posixpath.join(*HOST))
-        response = urllib2.urlopen(request, timeout=timeout)
-    except (urllib2.HTTPError, urllib2.URLError) as exc:
+        if not ranges:
+            response = _open(url, timeout=timeout, urs=urs)
+    except _errors as exc:
         logging.error(exc)
-        response_error = "Download error from {0}".format(posixpath.join(*HOST))
+        response_error = "Download error from {0}".format(url)
         return (False, response_error)
-    else:
-        # copy remote file contents to bytesIO object
-        remote_buffer = io.BytesIO()
-        shutil.copyfileobj(response, remote_buffer, chunk)
-        remote_buffer.seek(0)
-        # save file basename with bytesIO object
-        remote_buffer.filename = HOST[-1]
-        # generate checksum hash for remote file
-        remote_hash = hashlib.md5(remote_buffer.getvalue()).hexdigest()
-        # compare checksums
-        if local and (hash != remote_hash):
-            # convert to absolute path
-            local = pathlib.Path(local).expanduser().absolute()
-            # create directory if non-existent
-            local.parent.mkdir(mode=mode, parents=True, exist_ok=True)
-            # print file information
-            args = (posixpath.join(*HOST), str(local))
-            logging.info("{0} -->\n\t{1}".format(*args))
-            # store bytes to file using chunked transfer encoding
-            remote_buffer.seek(0)
-            with local.open(mode="wb") as f:
-                shutil.copyfileobj(remote_buffer, f, chunk)
+    # stream remote file contents to the local file
+    if local:
+        # convert to absolute path
+        local = pathlib.Path(local).expanduser().absolute()
+        # create directory if non-existent
+        local.parent.mkdir(mode=mode, parents=True, exist_ok=True)
+        # print file information
+        args = (url, str(local))
+        logging.info("{0} -->\n\t{1}".format(*args))
+        # generate checksum hash while writing to a partial file
+        partial = local.with_name(f"{local.name}.part")
+        digest = hashlib.new(hash_algorithm) if hash else None
+        if ranges:
+            # allocate the partial file and download parts concurrently
+            with partial.open(mode="wb") as f:
+                f.truncate(ranges[-1][1] + 1)
+            try:
+                _download_parts(url, partial, ranges, timeout, urs, chunk)
+            except _errors as exc:
+                logging.error(exc)
+                partial.unlink()
+                response_error = "Download error from {0}".format(url)
+                return (False, response_error)
+            # generate checksum hash from the partial file
+            if digest is not None:
+                with partial.open(mode="rb") as f:
+                    while buffer := f.read(chunk):
+                        digest.update(buffer)
+        elif digest is not None:
+            with partial.open(mode="wb") as f:
+                while buffer := response.read(chunk):
+                    digest.update(buffer)
+                    f.write(buffer)
+        else:
+            with partial.open(mode="wb") as f:
+                shutil.copyfileobj(response, f, chunk)
+        # compare checksums and keep the existing file if unchanged
+        if digest and local.exists() and (hash == digest.hexdigest()):
+            partial.unlink()
+        else:
+            partial.replace(local)
             # change the permissions mode
             local.chmod(mode=mode)
-        # return the bytesIO object
-        remote_buffer.seek(0)
-        return (remote_buffer, None)
+        # return the path to the local file
+        return (local, None)
+    # copy remote file contents to bytesIO object
+    remote_buffer = io.BytesIO()
+    shutil.copyfileobj(response, remote_buffer, chunk)
+    # save file basename with bytesIO object
+    remote_buffer.filename = HOST[-1]
+    # return the bytesIO object
+    remote_buffer.seek(0)
+    return (remote_buffer, None)
 
 
 # PURPOSE: filter the CMR json response for desired data files
@@ -741,29 +1230,20 @@ def cmr_filter_json(
     granule_urls: list
         granule urls from NSIDC
     """
-    # output list of granule urls
-    granule_urls = []
     # check that there are urls for request
     if ("feed" not in search_results) or (
         "entry" not in search_results["feed"]
     ):
-        return granule_urls
-    # descriptor links for each endpoint
-    rel = {}
-    rel["data"] = "http://esipfed.org/ns/fedsearch/1.1/data#"
-    rel["opendap"] = "http://esipfed.org/ns/fedsearch/1.1/service#"
-    rel["s3"] = "http://esipfed.org/ns/fedsearch/1.1/s3#"
-    # iterate over references and get cmr location
-    for entry in search_results["feed"]["entry"]:
-        for link in entry["links"]:
-            # skip links without descriptors
-            if "rel" not in link.keys():
-                continue
-            if "inherited" in link.keys():
-                continue
-            # append if selected endpoint and request type
-            if link["rel"] == rel[endpoint]:
-                granule_urls.append(link["href"])
+        return []
+    # descriptor link for the endpoint
+    target = _cmr_rel[endpoint]
+    # get cmr location for non-inherited links of the selected endpoint
+    granule_urls = [
+        link["href"]
+        for entry in search_results["feed"]["entry"]
+        for link in entry["links"]
+        if (link.get("rel") == target) and ("inherited" not in link)
+    ]
     # return the list of urls and granule ids
     return granule_urls
 
@@ -811,11 +1291,71 @@ def cmr(
     granule_urls: list
         granule urls
     """
+    # return the list of granule urls
+    return list(
+        cmr_iter(
+            collection_concept_id,
+            producer_granule_id=producer_granule_id,
+            readable_granule_name=readable_granule_name,
+            provider=provider,
+            endpoint=endpoint,
+            opener=opener,
+            context=context,
+            verbose=verbose,
+            **kwargs,
+        )
+    )
+
+
+# PURPOSE: iterate over cmr query results
+def cmr_iter(
+    collection_concept_id: str,
+    producer_granule_id: str | None = None,
+    readable_granule_name: list | None = None,
+    provider: str = "NSIDC_CPRD",
+    endpoint: str = "data",
+    opener=None,
+    context: ssl.SSLContext = _default_ssl_context,
+    verbose: bool = False,
+    **kwargs,
+):
+    """
+    Query the NASA Common Metadata Repository (CMR) and yield
+    granule urls as each page of results is received
+
+    Parameters
+    ----------
+    collection_concept_id: str
+        Earthdata Collection ID of the data product
+    producer_granule_id: str or NoneType, default None
+        CMR producer granule id
+    readable_granule_name: list or NoneType, default None
+        list of CMR readable granule names
+    provider: str, default 'NSIDC_CPRD'
+        CMR data provider
+    endpoint: str, default 'data'
+        url endpoint type
+
+            - ``'data'``: NASA Earthdata https archive
+            - ``'opendap'``: NASA Earthdata OPeNDAP archive
+            - ``'s3'``: NASA Earthdata Cumulus AWS S3 bucket
+    opener: obj or NoneType, default None
+        ``OpenerDirector`` instance
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for ``urllib`` opener object
+    verbose: bool, default False
+        print file transfer information
+
+    Yields
+    ------
+    granule_url: str
+        granule url
+    """
     # create logger
     loglevel = logging.INFO if verbose else logging.CRITICAL
     logging.basicConfig(level=loglevel)
     # attempt to build urllib2 opener
-    if opener is None:
+    if (opener is None) and not requests_available:
         # build urllib2 opener with SSL context
         # https://docs.python.org/3/howto/urllib2.html#id5
         handler = []
@@ -836,55 +1376,77 @@ def cmr(
     ]
     # build list of CMR query parameters
     CMR_KEYS = []
-    CMR_KEYS.append(f"?provider={provider}")
-    CMR_KEYS.append("&sort_key[]=start_date")
-    CMR_KEYS.append("&sort_key[]=producer_granule_id")
-    CMR_KEYS.append(f"&page_size={cmr_page_size}")
+    CMR_KEYS.append(("provider", provider))
+    CMR_KEYS.append(("sort_key[]", "start_date"))
+    CMR_KEYS.append(("sort_key[]", "producer_granule_id"))
+    CMR_KEYS.append(("page_size", cmr_page_size))
     # append collection concept ID string
-    CMR_KEYS.append(f"&collection-concept-id={collection_concept_id}")
+    CMR_KEYS.append(("collection-concept-id", collection_concept_id))
     # append producer granule id string
     if producer_granule_id is not None:
-        CMR_KEYS.append(f"&producer-granule-id={producer_granule_id}")
+        CMR_KEYS.append(("producer-granule-id", producer_granule_id))
     # append readable granule name strings
     if readable_granule_name is not None:
-        CMR_KEYS.append("&options[readable_granule_name][pattern]=true")
-        for gran in readable_granule_name:
-            CMR_KEYS.append(f"&readable_granule_name[]={gran}")
-    # full CMR query url
-    cmr_query_url = "".join([posixpath.join(*CMR_HOST), *CMR_KEYS])
+        CMR_KEYS.append(("options[readable_granule_name][pattern]", "true"))
+        CMR_KEYS.extend(
+            ("readable_granule_name[]", g) for g in readable_granule_name
+        )
+    # full CMR query url with escaped parameters
+    query = urllib.parse.urlencode(CMR_KEYS, safe="[]*?")
+    cmr_query_url = f"{posixpath.join(*CMR_HOST)}?{query}"
     logging.info(f"CMR request={cmr_query_url}")
-    # output list of granule names and urls
-    granule_urls = []
     cmr_search_after = None
     while True:
-        req = urllib2.Request(cmr_query_url)
+        headers = {}
         # add CMR search after header
         if cmr_search_after:
-            req.add_header("CMR-Search-After", cmr_search_after)
+            headers["CMR-Search-After"] = cmr_search_after
             logging.debug(f"CMR-Search-After: {cmr_search_after}")
-        response = opener.open(req)
+        response = _open(cmr_query_url, headers=headers, opener=opener)
         # get search after index for next iteration
         headers = {k.lower(): v for k, v in dict(response.info()).items()}
         cmr_search_after = headers.get("cmr-search-after")
         # read the CMR search as JSON
-        search_page = json.loads(response.read().decode("utf-8"))
+        search_page = _json_loads(response.read())
         urls = cmr_filter_json(search_page, endpoint=endpoint)
+        # yield the urls from the page
+        yield from urls
         if not urls or cmr_search_after is None:
             break
-        # extend lists
-        granule_urls.extend(urls)
-    # return the list of granule ids and urls
-    return granule_urls
 
 
-def fetch(path: pathlib.Path = get_cache_path(), **kwargs):
+# PURPOSE: get the names of existing files in a local path
+def _existing(path: pathlib.Path):
     """
-    Query resources from the NASA Common Metadata Repository (CMR)
-    and download them to a local path
+    Get the names of existing files in a local path
+    with a single directory scan
 
     Parameters
     ----------
-    path: str or pathlib.Path, default xAdvect.utilities.get_cache_path()
+    path: pathlib.Path
+        local path to download resources
+
+    Returns
+    -------
+    existing: set
+        names of existing files
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+
+# PURPOSE: get the local paths for granules in a CMR query
+def _granules(path: pathlib.Path, **kwargs):
+    """
+    Get local paths for resources from a CMR query and the
+    list of resources to download
+
+    Parameters
+    ----------
+    path: pathlib.Path
         local path to download resources
     kwargs: dict
         keyword arguments for ``cmr``
@@ -893,18 +1455,247 @@ def fetch(path: pathlib.Path = get_cache_path(), **kwargs):
     -------
     granules: list
         local paths for queried resources
+    pending: list
+        remote urls and local paths for resources to download
     """
     granules = []
+    pending = []
+    # names of existing files in the local path
+    existing = _existing(path)
     # for each url in the CMR query
     for url in cmr(**kwargs):
-        # split the url into parts and get the granule name
-        *_, file = url_split(url)
+        # get the granule name from the url
+        file = url.rsplit("/", 1)[-1]
         # full path to output local file
         local = path.joinpath(file)
         # check if existing and download if not
-        if not local.exists():
-            from_earthdata(url, local=local)
+        if file not in existing:
+            pending.append((url, local))
+            existing.add(file)
         # append to list of granules
         granules.append(local)
+    return (granules, pending)
+
+
+# PURPOSE: query CMR and download resources to a local path
+def fetch(
+    path: pathlib.Path = get_cache_path(),
+    workers: int | None = None,
+    use_async: bool = False,
+    **kwargs,
+):
+    """
+    Query resources from the NASA Common Metadata Repository (CMR)
+    and download them to a local path
+
+    Parameters
+    ----------
+    path: str or pathlib.Path, default xAdvect.utilities.get_cache_path()
+        local path to download resources
+    workers: int or NoneType, default None
+        maximum number of concurrent downloads
+
+        Default is from the ``XADVECT_FETCH_WORKERS`` environment
+        variable or 5
+    use_async: bool, default False
+        download resources asynchronously with ``async_fetch``
+    kwargs: dict
+        keyword arguments for ``cmr``
+
+    Returns
+    -------
+    granules: list
+        local paths for queried resources
+    """
+    # download resources asynchronously
+    if use_async:
+        return asyncio.run(async_fetch(path=path, n_parallel=workers, **kwargs))
+    # maximum number of concurrent downloads
+    if workers is None:
+        workers = int(os.environ.get("XADVECT_FETCH_WORKERS", 5))
+    granules = []
+    futures = []
+    # names of existing files in the local path
+    existing = _existing(path)
+    # download missing granules concurrently while paging through CMR
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        # for each url in the CMR query
+        for url in cmr_iter(**kwargs):
+            # get the granule name from the url
+            file = url.rsplit("/", 1)[-1]
+            # full path to output local file
+            local = path.joinpath(file)
+            # check if existing and download if not
+            if file not in existing:
+                # build opener and check credentials once for all downloads
+                if not futures:
+                    attempt_login()
+                futures.append(
+                    ex.submit(from_earthdata, url, build=False, local=local)
+                )
+                existing.add(file)
+            # append to list of granules
+            granules.append(local)
+        # raise any exceptions or response errors from the downloads
+        for future in futures:
+            output, response_error = future.result()
+            if not output:
+                raise urllib2.URLError(response_error)
+    # return list of granules
+    return granules
+
+
+# PURPOSE: asynchronously download a file from a NASA Earthdata provider
+async def _download(
+    url: str,
+    local: pathlib.Path,
+    session,
+    semaphore: asyncio.Semaphore,
+    auth=None,
+    urs: str = "urs.earthdata.nasa.gov",
+    timeout: int | None = None,
+    chunk: int = 1048576,
+    mode: oct = 0o775,
+    max_redirects: int = 10,
+):
+    """
+    Asynchronously download a file from a NASA Earthdata provider
+
+    Parameters
+    ----------
+    url: str
+        remote https url
+    local: pathlib.Path
+        path to local file
+    session: obj
+        ``aiohttp.ClientSession`` instance
+    semaphore: obj
+        ``asyncio.Semaphore`` limiting the number of downloads
+    auth: obj or NoneType, default None
+        ``aiohttp.BasicAuth`` NASA Earthdata credentials
+    urs: str, default 'urs.earthdata.nasa.gov'
+        NASA Earthdata URS 3 host
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    chunk: int, default 1048576
+        buffer size in bytes for reading and writing files
+    mode: oct, default 0o775
+        permissions mode of output local file
+    max_redirects: int, default 10
+        maximum number of redirects to follow
+    """
+    timeout = aiohttp.ClientTimeout(total=timeout)
+    async with semaphore:
+        # follow redirects and only send credentials to the login host
+        for _ in range(max_redirects):
+            host = urllib.parse.urlparse(url).hostname
+            kwargs = dict(auth=auth) if (host == urs) else {}
+            async with session.get(
+                url, timeout=timeout, allow_redirects=False, **kwargs
+            ) as response:
+                if response.status in (301, 302, 303, 307, 308):
+                    url = urllib.parse.urljoin(
+                        url, response.headers["Location"]
+                    )
+                    continue
+                response.raise_for_status()
+                # create directory if non-existent
+                local.parent.mkdir(mode=mode, parents=True, exist_ok=True)
+                logging.info(f"{url} -->\n\t{local}")
+                # store bytes to a partial file using chunked transfer encoding
+                # (removing the partial file if the download fails)
+                partial = local.with_name(f"{local.name}.part")
+                try:
+                    with partial.open(mode="wb") as f:
+                        async for buffer in response.content.iter_chunked(
+                            chunk
+                        ):
+                            f.write(buffer)
+                except BaseException:
+                    partial.unlink(missing_ok=True)
+                    raise
+                # replace the local file with the completed download
+                os.replace(partial, local)
+                # change the permissions mode
+                local.chmod(mode=mode)
+                return
+    raise RuntimeError(f"Exceeded {max_redirects} redirects for {url}")
+
+
+# PURPOSE: query CMR and asynchronously download resources
+async def async_fetch(
+    path: pathlib.Path | None = None,
+    n_parallel: int | None = None,
+    urs: str = "urs.earthdata.nasa.gov",
+    timeout: int | None = None,
+    chunk: int = 1048576,
+    **kwargs,
+):
+    """
+    Query resources from the NASA Common Metadata Repository (CMR)
+    and asynchronously download them to a local path
+
+    Parameters
+    ----------
+    path: pathlib.Path or NoneType, default None
+        local path to download resources
+
+        Default is ``xAdvect.utilities.get_cache_path()``
+    n_parallel: int or NoneType, default None
+        maximum number of concurrent downloads
+
+        Default is from the ``XADVECT_FETCH_WORKERS`` environment
+        variable or 8
+    urs: str, default 'urs.earthdata.nasa.gov'
+        NASA Earthdata URS 3 host
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    chunk: int, default 1048576
+        buffer size in bytes for reading and writing files
+    kwargs: dict
+        keyword arguments for ``cmr``
+
+    Returns
+    -------
+    granules: list
+        local paths for queried resources
+    """
+    # raise error if aiohttp is unavailable
+    if not aiohttp_available:
+        raise ImportError("aiohttp is required for asynchronous downloads")
+    # default local path to download resources
+    if path is None:
+        path = get_cache_path()
+    # maximum number of concurrent downloads
+    if n_parallel is None:
+        n_parallel = int(os.environ.get("XADVECT_FETCH_WORKERS", 8))
+    # get local paths and resources to download
+    granules, pending = _granules(path, **kwargs)
+    if not pending:
+        return granules
+    # check credentials once for all downloads
+    attempt_login(urs)
+    key = (urs, _username(urs))
+    auth = (
+        aiohttp.BasicAuth(*_credentials[key]) if key in _credentials else None
+    )
+    # share a connection pool and cookies between downloads
+    connector = aiohttp.TCPConnector(limit=n_parallel)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        semaphore = asyncio.Semaphore(n_parallel)
+        tasks = [
+            _download(
+                url,
+                local,
+                session,
+                semaphore,
+                auth=auth,
+                urs=urs,
+                timeout=timeout,
+                chunk=chunk,
+            )
+            for url, local in pending
+        ]
+        await asyncio.gather(*tasks)
     # return list of granules
     return granules
@@ -8,22 +8,38 @@ PYTHON DEPENDENCIES:
     numpy: Scientific Computing Tools For Python
         https://numpy.org
         https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
+    numba: JIT compiler for Python and NumPy (optional)
+        https://numba.pydata.org/
     scipy: Scientific Tools for Python
         https://docs.scipy.org/doc/
     xarray: N-D labeled arrays and datasets in Python
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: use multithreaded scipy.fft discrete cosine transforms
+    Updated 10/2026: broadcast lambda function and reuse iteration buffers
+    Updated 10/2026: iterate in single precision for float32 data
+    Updated 10/2026: use distance transform for nearest neighbor values
+    Updated 10/2026: parallel KDTree queries for irregularly spaced grids
+    Updated 10/2026: gather KDTree coordinates without meshgrids
+    Updated 10/2026: fuse iteration arithmetic with compiled kernels
+    Updated 10/2026: inpaint multiple variables with shared masks and buffers
+    Updated 10/2026: copy valid values with masked stores
+    Updated 10/2026: stop iterations early if the grid has converged
+    Updated 10/2026: cache lambda functions between calls
     Written 01/2026
 """
 
 from __future__ import annotations
 
+import functools
 import numpy as np
-import scipy.fftpack
+import scipy.fft
+import scipy.ndimage
 import scipy.spatial
+import xAdvect.kernels
 
-__all__ = ["inpaint"]
+__all__ = ["inpaint", "inpaint_multi"]
 
 
 def inpaint(
@@ -34,6 +50,8 @@ def inpaint(
     s0: int = 3,
     power: int = 2,
     epsilon: float = 2.0,
+    tol: float = 1e-5,
+    workers: int | None = -1,
     **kwargs,
 ):
     """
@@ -48,7 +66,9 @@ def inpaint(
     ys: np.ndarray
         input y-coordinates
     zs: np.ndarray
-        input data
+        input data (not modified)
+
+        Iterations are in single precision for ``float32`` data
     N: int, default 0
         Number of iterations (0 for nearest neighbors)
     s0: int, default 3
@@ -57,59 +77,333 @@ def inpaint(
         power for lambda function
     epsilon: float, default 2.0
         relaxation factor
+    tol: float, default 1e-5
+        relative change in the grid for stopping iterations early
+
+        Set to 0 to run all ``N`` iterations
+    workers: int or NoneType, default -1
+        maximum number of threads for discrete cosine transforms
+
+        Negative values wrap around from the number of CPU cores
+    """
+    (z0,) = inpaint_multi(
+        xs,
+        ys,
+        [zs],
+        N=N,
+        s0=s0,
+        power=power,
+        epsilon=epsilon,
+        tol=tol,
+        workers=workers,
+        **kwargs,
+    )
+    # return the inpainted grid
+    return z0
+
+
+def inpaint_multi(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zs: list,
+    N: int = 0,
+    s0: int = 3,
+    power: int = 2,
+    epsilon: float = 2.0,
+    tol: float = 1e-5,
+    workers: int | None = -1,
+    **kwargs,
+):
     """
-    # find masked values
-    if isinstance(zs, np.ma.MaskedArray):
-        W = np.logical_not(zs.mask)
-    else:
-        W = np.isfinite(zs)
-    # no valid values can be found
-    if not np.any(W):
-        raise ValueError("No valid values found")
-
-    # dimensions of input grid
-    ny, nx = np.shape(zs)
-
-    # calculate initial values using nearest neighbors
-    # computation of distance Matrix
+    Inpaint over missing data in multiple two-dimensional arrays on
+    the same grid, sharing the nearest neighbor search between arrays
+    with identical masks and the lambda function between all arrays
+
+    Parameters
+    ----------
+    xs: np.ndarray
+        input x-coordinates
+    ys: np.ndarray
+        input y-coordinates
+    zs: list
+        input data arrays (not modified)
+    N: int, default 0
+        Number of iterations (0 for nearest neighbors)
+    s0: int, default 3
+        Smoothing
+    power: int, default 2
+        power for lambda function
+    epsilon: float, default 2.0
+        relaxation factor
+    tol: float, default 1e-5
+        relative change in the grid for stopping iterations early
+
+        Set to 0 to run all ``N`` iterations
+    workers: int or NoneType, default -1
+        maximum number of threads for discrete cosine transforms
+
+        Negative values wrap around from the number of CPU cores
+
+    Returns
+    -------
+    z0: list
+        inpainted grids
+    """
+    # indices of nearest valid values for each mask
+    indices = {}
+    # lambda functions and iteration buffers for each precision
+    buffers = {}
+    output = []
+    for z in zs:
+        # find masked values
+        if isinstance(z, np.ma.MaskedArray):
+            W = np.logical_not(np.ma.getmaskarray(z))
+        else:
+            W = np.isfinite(z)
+        # no valid values can be found
+        if not np.any(W):
+            raise ValueError("No valid values found")
+        # calculate initial values using nearest neighbors
+        # reusing the search for identical masks
+        key = np.packbits(W).tobytes()
+        if key not in indices:
+            indices[key] = _nearest(xs, ys, W)
+        # copy valid original values and nearest neighbors
+        z0 = np.ma.getdata(z)[indices[key]]
+        # return nearest neighbors interpolation
+        if N == 0:
+            output.append(z0)
+            continue
+        # floating point precision for iterations
+        dtype = np.result_type(z.dtype, np.float32)
+        if dtype not in buffers:
+            buffers[dtype] = _buffers(np.shape(z), power, dtype)
+        # iterate to inpaint the grid
+        z0 = _iterate(
+            W,
+            z0,
+            *buffers[dtype],
+            N=N,
+            s0=s0,
+            epsilon=epsilon,
+            tol=tol,
+            workers=workers,
+        )
+        # reset original values
+        np.copyto(z0, np.ma.getdata(z), casting="unsafe", where=W)
+        output.append(z0)
+    # return the inpainted grids
+    return output
+
+
+def _nearest(xs: np.ndarray, ys: np.ndarray, W: np.ndarray):
+    """
+    Find the grid indices of the nearest valid values
+
+    Parameters
+    ----------
+    xs: np.ndarray
+        input x-coordinates
+    ys: np.ndarray
+        input y-coordinates
+    W: np.ndarray
+        mask of valid values
+
+    Returns
+    -------
+    indices: tuple
+        row and column indices of the nearest valid values
+    """
+    # check if the grid is regularly spaced
+    spacing = [np.diff(c) for c in (ys, xs)]
+    regular = all(np.allclose(d, d[0]) for d in spacing if len(d))
+    if regular:
+        # use the indices of the nearest valid values from a
+        # euclidean distance transform with the grid spacing
+        sampling = [np.abs(d[0]) if len(d) else 1.0 for d in spacing]
+        ii = scipy.ndimage.distance_transform_edt(
+            np.logical_not(W),
+            sampling=sampling,
+            return_distances=False,
+            return_indices=True,
+        )
+        return tuple(ii)
     # use scipy spatial KDTree routines
-    xgrid, ygrid = np.meshgrid(xs, ys)
-    tree = scipy.spatial.cKDTree(np.c_[xgrid[W], ygrid[W]])
-    # find nearest neighbors
+    # gather coordinates of valid values from the grid indices
+    xs, ys = np.asarray(xs), np.asarray(ys)
+    row, col = np.nonzero(W)
+    points = np.column_stack((xs[col], ys[row])).astype("f8", copy=False)
+    tree = scipy.spatial.cKDTree(points)
+    # find nearest neighbors using all available threads
     masked = np.logical_not(W)
-    _, ii = tree.query(np.c_[xgrid[masked], ygrid[masked]], k=1)
-    # copy valid original values
-    z0 = np.zeros((ny, nx), dtype=zs.dtype)
-    z0[W] = np.copy(zs[W])
-    # copy nearest neighbors
-    z0[masked] = zs[W][ii]
-    # return nearest neighbors interpolation
-    if N == 0:
-        return z0
+    qrow, qcol = np.nonzero(masked)
+    query = np.column_stack((xs[qcol], ys[qrow]))
+    _, ii = tree.query(query, k=1, workers=-1)
+    # indices of valid values and nearest neighbors
+    irow, icol = np.indices(np.shape(W))
+    irow[masked] = row[ii]
+    icol[masked] = col[ii]
+    return (irow, icol)
 
-    # copy data to new array with 0 values for mask
-    ZI = np.zeros((ny, nx), dtype=zs.dtype)
-    ZI[W] = np.copy(z0[W])
 
-    # calculate lambda function
-    L = np.zeros((ny, nx))
-    L += np.broadcast_to(np.cos(np.pi * np.arange(ny) / ny)[:, None], (ny, nx))
-    L += np.broadcast_to(np.cos(np.pi * np.arange(nx) / nx)[None, :], (ny, nx))
-    LAMBDA = np.power(2.0 * (2.0 - L), power)
+@functools.lru_cache(maxsize=8)
+def _lambda(ny: int, nx: int, power: int, dtype: str):
+    """
+    Calculate the lambda function for a grid
+
+    Parameters
+    ----------
+    ny: int
+        number of rows in the grid
+    nx: int
+        number of columns in the grid
+    power: int
+        power for lambda function
+    dtype: str
+        floating point precision for iterations
+
+    Returns
+    -------
+    LAMBDA: np.ndarray
+        lambda function (read-only)
+    """
+    # calculate lambda function from broadcasted cosines
+    Ly = np.cos(np.pi * np.arange(ny) / ny).astype(dtype)
+    Lx = np.cos(np.pi * np.arange(nx) / nx).astype(dtype)
+    LAMBDA = np.power(2.0 * (2.0 - Ly[:, None] - Lx[None, :]), power)
+    # guard the cached array against modification
+    LAMBDA.flags.writeable = False
+    return LAMBDA
+
+
+def _buffers(shape: tuple, power: int, dtype: np.dtype):
+    """
+    Calculate the lambda function and allocate iteration buffers
+
+    Parameters
+    ----------
+    shape: tuple
+        dimensions of input grid
+    power: int
+        power for lambda function
+    dtype: np.dtype
+        floating point precision for iterations
+
+    Returns
+    -------
+    LAMBDA: np.ndarray
+        lambda function
+    GAMMA: np.ndarray
+        buffer for smoothness weights
+    tmp: np.ndarray
+        buffer for transform inputs
+    """
+    ny, nx = shape
+    # get the (cached) lambda function
+    LAMBDA = _lambda(ny, nx, power, np.dtype(dtype).str)
+    # allocate buffers for iterations
+    GAMMA = np.empty_like(LAMBDA)
+    tmp = np.empty((ny, nx), dtype=dtype)
+    return (LAMBDA, GAMMA, tmp)
+
 
+def _iterate(
+    W: np.ndarray,
+    z0: np.ndarray,
+    LAMBDA: np.ndarray,
+    GAMMA: np.ndarray,
+    tmp: np.ndarray,
+    N: int = 0,
+    s0: int = 3,
+    epsilon: float = 2.0,
+    tol: float = 1e-5,
+    workers: int | None = -1,
+):
+    """
+    Iteratively inpaint a grid initialized with nearest neighbors
+
+    Parameters
+    ----------
+    W: np.ndarray
+        mask of valid values
+    z0: np.ndarray
+        initial grid
+    LAMBDA: np.ndarray
+        lambda function
+    GAMMA: np.ndarray
+        buffer for smoothness weights
+    tmp: np.ndarray
+        buffer for transform inputs
+    N: int, default 0
+        Number of iterations
+    s0: int, default 3
+        Smoothing
+    epsilon: float, default 2.0
+        relaxation factor
+    tol: float, default 1e-5
+        relative change in the grid for stopping iterations early
+    workers: int or NoneType, default -1
+        maximum number of threads for discrete cosine transforms
+
+    Returns
+    -------
+    z0: np.ndarray
+        inpainted grid
+    """
+    # floating point precision for iterations
+    dtype = tmp.dtype
+    # copy data to new array with 0 values for mask
+    ZI = np.zeros(np.shape(z0), dtype=dtype)
+    np.copyto(ZI, z0, casting="unsafe", where=W)
+    # use contiguous floating point arrays for transforms
+    z0 = np.ascontiguousarray(z0, dtype=dtype)
     # smoothness parameters
-    s = np.logspace(s0, -6, N)
+    s = np.logspace(s0, -6, N).astype(dtype)
+    # buffer for checking convergence every few iterations
+    previous = np.empty_like(z0) if (tol > 0) else None
     for i in range(N):
-        # calculate discrete cosine transform
-        GAMMA = 1.0 / (1.0 + s[i] * LAMBDA)
-        DISCOS = GAMMA * scipy.fftpack.dctn(W * (ZI - z0) + z0, norm="ortho")
-        # update interpolated grid
-        z0 = (
-            epsilon * scipy.fftpack.idctn(DISCOS, norm="ortho")
-            + (1.0 - epsilon) * z0
-        )
-
-    # reset original values
-    z0[W] = np.copy(zs[W])
+        # save the grid before the update to check convergence
+        check = (tol > 0) and (i % 4 == 3)
+        if check:
+            np.copyto(previous, z0)
+        # fuse iteration arithmetic with compiled kernels
+        if xAdvect.kernels.numba_available:
+            # calculate discrete cosine transform
+            xAdvect.kernels.inpaint_input(W, ZI, z0, tmp)
+            DISCOS = scipy.fft.dctn(
+                tmp, type=2, norm="ortho", workers=workers, overwrite_x=True
+            )
+            xAdvect.kernels.inpaint_scale(DISCOS, LAMBDA, s[i])
+            # update interpolated grid
+            update = scipy.fft.idctn(
+                DISCOS, type=2, norm="ortho", workers=workers, overwrite_x=True
+            )
+            xAdvect.kernels.inpaint_update(z0, update, epsilon)
+        else:
+            # calculate weights for smoothness parameter
+            np.multiply(LAMBDA, s[i], out=GAMMA)
+            GAMMA += 1.0
+            np.reciprocal(GAMMA, out=GAMMA)
+            # calculate discrete cosine transform
+            np.subtract(ZI, z0, out=tmp)
+            tmp *= W
+            tmp += z0
+            DISCOS = scipy.fft.dctn(
+                tmp, type=2, norm="ortho", workers=workers, overwrite_x=True
+            )
+            DISCOS *= GAMMA
+            # update interpolated grid
+            update = scipy.fft.idctn(
+                DISCOS, type=2, norm="ortho", workers=workers, overwrite_x=True
+            )
+            update *= epsilon
+            z0 *= 1.0 - epsilon
+            z0 += update
+        # stop iterating if the relative change is below tolerance
+        if check:
+            previous -= z0
+            delta = np.linalg.norm(previous.ravel())
+            if delta < tol * max(np.linalg.norm(z0.ravel()), 1e-30):
+                break
     # return the inpainted grid
     return z0
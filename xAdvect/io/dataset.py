@@ -17,11 +17,20 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: cache parsed coordinate reference systems and transformers
+    Updated 10/2026: crop monotonic coordinates with slices
+    Updated 10/2026: inpaint all variables with shared masks and buffers
+    Updated 10/2026: transform contiguous double precision coordinates
+        transform the axes of grids if the transformation is separable
+        use stored definitions of parsed coordinate reference systems
+        cache dictionaries of coordinate reference systems
+        cache mean times parsed from start and end dates
     Written 01/2026
 """
 
 import pint
 import pyproj
+import functools
 import warnings
 import numpy as np
 import xarray as xr
@@ -45,6 +54,8 @@ class Dataset:
     def __init__(self, ds):
         # initialize Dataset
         self._ds = ds
+        # cached coordinate reference system attribute and parsed CRS
+        self._crs = (None, None)
 
     def assign_coords(
         self,
@@ -104,6 +115,10 @@ class Dataset:
             Transformed x-coordinates
         Y: xarray.DataArray
             Transformed y-coordinates
+
+        Grids are returned as 1-dimensional ``x`` and ``y`` coordinates
+        if the transformation is separable along each axis, otherwise
+        as 2-dimensional ``(y, x)`` coordinates
         """
         # convert coordinate reference system to that of the dataset
         # and format as xarray DataArray with appropriate dimensions
@@ -122,18 +137,8 @@ class Dataset:
         buffer: int or float, default 0
             buffer to add to bounds for cropping
         """
-        # create copy of dataset
-        ds = self._ds.copy()
-        # unpack bounds and buffer
-        xmin = bounds[0] - buffer
-        xmax = bounds[1] + buffer
-        ymin = bounds[2] - buffer
-        ymax = bounds[3] + buffer
         # crop dataset to bounding box
-        ds = ds.where(
-            (ds.x >= xmin) & (ds.x <= xmax) & (ds.y >= ymin) & (ds.y <= ymax),
-            drop=True,
-        )
+        ds = _crop(self._ds, bounds, buffer=buffer)
         # return the cropped dataset
         return ds
 
@@ -144,7 +149,7 @@ class Dataset:
         Parameters
         ----------
         kwargs: keyword arguments
-            keyword arguments for ``xAdvect.interpolate.inpaint``
+            keyword arguments for ``xAdvect.interpolate.inpaint_multi``
 
         Returns
         -------
@@ -152,15 +157,16 @@ class Dataset:
             interpolated xarray Dataset
         """
         # import inpaint function
-        from xAdvect.interpolate import inpaint
+        from xAdvect.interpolate import inpaint_multi
 
         # create copy of dataset
         ds = self._ds.copy()
-        # inpaint each variable in the dataset
-        for v in ds.data_vars.keys():
-            ds[v].values = inpaint(
-                self._x, self._y, self._ds[v].values, **kwargs
-            )
+        # inpaint all variables in the dataset
+        variables = list(ds.data_vars.keys())
+        values = [self._ds[v].values for v in variables]
+        output = inpaint_multi(self._x, self._y, values, **kwargs)
+        for v, z in zip(variables, output):
+            ds[v].values = z
         # return the dataset
         return ds
 
@@ -275,7 +281,10 @@ class Dataset:
         # return the CRS of the dataset
         # default is EPSG:4326 (WGS84)
         CRS = self._ds.attrs.get("crs", 4326)
-        return pyproj.CRS.from_user_input(CRS)
+        # parse the CRS if the attribute has changed
+        if (self._crs[1] is None) or (self._crs[0] != CRS):
+            self._crs = (CRS, _crs(CRS))
+        return self._crs[1]
 
     @property
     def divergence(self):
@@ -325,18 +334,8 @@ class DataArray:
         buffer: int or float, default 0
             buffer to add to bounds for cropping
         """
-        # create copy of dataarray
-        da = self._da.copy()
-        # unpack bounds and buffer
-        xmin = bounds[0] - buffer
-        xmax = bounds[1] + buffer
-        ymin = bounds[2] - buffer
-        ymax = bounds[3] + buffer
-        # crop dataset to bounding box
-        da = da.where(
-            (da.x >= xmin) & (da.x <= xmax) & (da.y >= ymin) & (da.y <= ymax),
-            drop=True,
-        )
+        # crop dataarray to bounding box
+        da = _crop(self._da, bounds, buffer=buffer)
         # return the cropped dataarray
         return da
 
@@ -381,6 +380,209 @@ class DataArray:
         return 1.0 * self.units
 
 
+def _crs(crs: str | int | dict | pyproj.CRS):
+    """
+    Get a coordinate reference system, reusing parsed
+    systems for hashable inputs
+
+    Parameters
+    ----------
+    crs: str, int, dict or pyproj.CRS
+        Coordinate reference system
+
+    Returns
+    -------
+    crs: pyproj.CRS
+        Parsed coordinate reference system
+    """
+    if isinstance(crs, pyproj.CRS):
+        return crs
+    try:
+        return _from_user_input(crs)
+    except TypeError:
+        # unhashable inputs (e.g. dictionaries)
+        return pyproj.CRS.from_user_input(crs)
+
+
+@functools.lru_cache(maxsize=32)
+def _from_user_input(crs: str | int):
+    """
+    Parse a coordinate reference system from a hashable input
+
+    Parameters
+    ----------
+    crs: str or int
+        Coordinate reference system
+
+    Returns
+    -------
+    crs: pyproj.CRS
+        Parsed coordinate reference system
+    """
+    return pyproj.CRS.from_user_input(crs)
+
+
+def _crs_to_dict(crs: str | int | dict | pyproj.CRS) -> dict:
+    """
+    Get the dictionary of a coordinate reference system,
+    reusing converted systems for hashable inputs
+
+    Parameters
+    ----------
+    crs: str, int, dict or pyproj.CRS
+        Coordinate reference system
+
+    Returns
+    -------
+    crs: dict
+        Coordinate reference system as a dictionary
+    """
+    # use the sorted items of dictionaries as keys
+    key = tuple(sorted(crs.items())) if isinstance(crs, dict) else crs
+    try:
+        # copy the cached dictionary
+        return dict(_to_dict(key))
+    except TypeError:
+        # unhashable inputs (e.g. nested dictionaries)
+        return _crs(crs).to_dict()
+
+
+@functools.lru_cache(maxsize=32)
+def _to_dict(key: str | int | tuple | pyproj.CRS) -> dict:
+    """
+    Convert a coordinate reference system from a hashable input
+    into a dictionary
+
+    Parameters
+    ----------
+    key: str, int, tuple or pyproj.CRS
+        Coordinate reference system or sorted dictionary items
+
+    Returns
+    -------
+    crs: dict
+        Coordinate reference system as a dictionary
+    """
+    crs = dict(key) if isinstance(key, tuple) else key
+    return _crs(crs).to_dict()
+
+
+def _mean_time(start: str, end: str) -> np.ndarray:
+    """
+    Get the mean time between two dates, reusing parsed dates
+
+    Parameters
+    ----------
+    start: str
+        start date
+    end: str
+        end date
+
+    Returns
+    -------
+    time: np.ndarray
+        mean time as ``datetime64[ns]``
+    """
+    # copy the cached mean time
+    return _parse_mean_time(start, end).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_mean_time(start: str, end: str) -> np.ndarray:
+    """
+    Parse two dates and calculate the mean time between them
+
+    Parameters
+    ----------
+    start: str
+        start date
+    end: str
+        end date
+
+    Returns
+    -------
+    time: np.ndarray
+        mean time as ``datetime64[ns]``
+    """
+    # parse strings into datetime objects
+    start_time = timescale.time.parse(start)
+    end_time = timescale.time.parse(end)
+    time_array = np.array([start_time, end_time], dtype="datetime64[D]")
+    # convert to timescale objects and take the mean
+    ts = timescale.from_datetime(time_array)
+    return ts.mean().to_datetime()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(source_crs: str, target_crs: str):
+    """
+    Get a transformer between two coordinate reference systems
+
+    Parameters
+    ----------
+    source_crs: str
+        Definition of the source coordinate reference system
+    target_crs: str
+        Definition of the target coordinate reference system
+
+    Returns
+    -------
+    transformer: pyproj.Transformer
+        Coordinate transformer
+    """
+    return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+def _crop(
+    obj: xr.Dataset | xr.DataArray,
+    bounds: list | tuple,
+    buffer: int | float = 0,
+):
+    """
+    Crop a ``Dataset`` or ``DataArray`` to a bounding box
+
+    Uses coordinate slices for monotonic coordinates and
+    masks the data for non-monotonic coordinates
+
+    Parameters
+    ----------
+    obj: xarray.Dataset or xarray.DataArray
+        Input data
+    bounds: list, tuple
+        bounding box [min_x, max_x, min_y, max_y]
+    buffer: int or float, default 0
+        buffer to add to bounds for cropping
+
+    Returns
+    -------
+    obj: xarray.Dataset or xarray.DataArray
+        Cropped data
+    """
+    # unpack bounds and buffer
+    xmin = bounds[0] - buffer
+    xmax = bounds[1] + buffer
+    ymin = bounds[2] - buffer
+    ymax = bounds[3] + buffer
+    # get slices for monotonically increasing or decreasing coordinates
+    indexers = {}
+    for c, (cmin, cmax) in dict(x=(xmin, xmax), y=(ymin, ymax)).items():
+        d = np.diff(obj[c].values)
+        if np.all(d > 0):
+            indexers[c] = slice(cmin, cmax)
+        elif np.all(d < 0):
+            indexers[c] = slice(cmax, cmin)
+        else:
+            break
+    else:
+        # crop to bounding box using coordinate slices
+        return obj.sel(indexers)
+    # crop to bounding box by masking non-monotonic coordinates
+    return obj.where(
+        (obj.x >= xmin) & (obj.x <= xmax) & (obj.y >= ymin) & (obj.y <= ymax),
+        drop=True,
+    )
+
+
 def _transform(
     i1: np.ndarray,
     i2: np.ndarray,
@@ -417,15 +619,81 @@ def _transform(
     # set the direction of the transformation
     kwargs.setdefault("direction", "FORWARD")
     assert kwargs["direction"] in ("FORWARD", "INVERSE", "IDENT")
-    # get the coordinate reference system and transform
-    source_crs = pyproj.CRS.from_user_input(source_crs)
-    transformer = pyproj.Transformer.from_crs(
-        source_crs, target_crs, always_xy=True
-    )
+    # get the definitions of the (parsed) coordinate reference systems
+    # and the cached transform
+    source_crs = _crs(source_crs).srs
+    target_crs = _crs(target_crs).srs
+    transformer = _get_transformer(source_crs, target_crs)
+    # transform scalar coordinates directly
+    if (np.ndim(i1) == 0) and (np.ndim(i2) == 0):
+        o1, o2 = transformer.transform(i1, i2, **kwargs)
+        return (o1, o2)
+    # broadcast coordinates and convert to contiguous double precision
+    i1, i2 = np.broadcast_arrays(i1, i2)
+    shape = i1.shape
+    i1 = np.ascontiguousarray(i1, dtype=np.float64).ravel()
+    i2 = np.ascontiguousarray(i2, dtype=np.float64).ravel()
     # convert coordinate reference system
     o1, o2 = transformer.transform(i1, i2, **kwargs)
     # return the transformed coordinates
-    return (o1, o2)
+    return (o1.reshape(shape), o2.reshape(shape))
+
+
+def _axes(
+    x: np.ndarray,
+    y: np.ndarray,
+    source_crs: str | int | dict = 4326,
+    target_crs: str | int | dict | None = None,
+):
+    """
+    Transform the axes of a grid if the transformation between
+    coordinate reference systems is separable along each axis
+
+    Parameters
+    ----------
+    x: np.ndarray
+        Input x-coordinates
+    y: np.ndarray
+        Input y-coordinates
+    source_crs: str, int, or dict, default 4326 (WGS84 Latitude/Longitude)
+        Coordinate reference system of input coordinates
+    target_crs: str, int, or dict, default None
+        Coordinate reference system of output coordinates
+
+    Returns
+    -------
+    axes: tuple or NoneType
+        Transformed x and y axes if separable
+    """
+    x = np.ravel(x)
+    y = np.ravel(y)
+    # skip transformation for equivalent coordinate reference systems
+    if _crs(source_crs).equals(_crs(target_crs)):
+        return (x, y)
+    # probe the transformation along the first and last rows and columns
+    px, py = _transform(
+        np.concatenate([x, x, x[[0, -1]].repeat(len(y))]),
+        np.concatenate([y[[0, -1]].repeat(len(x)), np.tile(y, 2)]),
+        source_crs=source_crs,
+        target_crs=target_crs,
+        direction="FORWARD",
+    )
+    nx = len(x)
+    ny = len(y)
+    rows = (px[:nx], px[nx : 2 * nx], py[:nx], py[nx : 2 * nx])
+    cols = (px[2 * nx : 2 * nx + ny], px[2 * nx + ny :])
+    cols += (py[2 * nx : 2 * nx + ny], py[2 * nx + ny :])
+    # check that x only varies along rows and y only varies along columns
+    separable = (
+        np.array_equal(rows[0], rows[1])
+        and np.array_equal(cols[2], cols[3])
+        and np.all(rows[2] == rows[2][0])
+        and np.all(rows[3] == rows[3][0])
+        and np.all(cols[0] == cols[0][0])
+        and np.all(cols[1] == cols[1][0])
+    )
+    # return the transformed axes if separable
+    return (rows[0], cols[2]) if separable else None
 
 
 def _coords(
@@ -488,6 +756,14 @@ def _coords(
         coord_type = kwargs.get("type").lower()
     # convert coordinates to a new coordinate reference system
     if (coord_type == "grid") and (np.size(x) != np.size(y)):
+        # transform the 1-dimensional axes if separable
+        axes = _axes(x, y, source_crs=source_crs, target_crs=target_crs)
+        if axes is not None:
+            mx, my = axes
+            X = xr.DataArray(mx, dims=("x"))
+            Y = xr.DataArray(my, dims=("y"))
+            return (X, Y)
+        # transform every point in the grid
         gridx, gridy = np.meshgrid(x, y)
         mx, my = _transform(
             gridx,
@@ -13,6 +13,13 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: open multiple files in parallel using threads
+        concatenate variables along time before merging
+        precompile regular expression patterns for variable mapping
+        reuse parsed coordinate reference systems
+        read chunks concurrently without a global lock
+        cache dictionaries of coordinate reference systems
+        cache mean times parsed from start and end dates
     Updated 02/2026: added logging information when opening files
     Written 01/2026
 """
@@ -21,17 +28,15 @@ from __future__ import division, annotations
 
 import os
 import re
-import pyproj
 import logging
 import pathlib
 import warnings
-import numpy as np
+import concurrent.futures
 import xarray as xr
 import xAdvect.utilities
-import timescale.time
+import xAdvect.io.dataset
 
 # attempt imports
-dask = xAdvect.utilities.import_dependency("dask")
 dask_available = xAdvect.utilities.dependency_available("dask")
 rioxarray = xAdvect.utilities.import_dependency("rioxarray")
 rioxarray.merge = xAdvect.utilities.import_dependency("rioxarray.merge")
@@ -63,13 +68,15 @@ def open_mfdataset(
     ds: xr.Dataset
         xarray Dataset
     """
+    # precompile the regular expression patterns for each variable
+    compiled = {k: re.compile(v, re.I) for k, v in mapping.items()}
     # read the geotiff files as an xarray Datasets
     datasets = []
     for f in filename:
         # determine variable name from mapping
         try:
             (variable,) = [
-                k for k, v in mapping.items() if re.search(v, str(f), re.I)
+                k for k, p in compiled.items() if p.search(os.fspath(f))
             ]
         except ValueError:
             pattern = None
@@ -86,8 +93,8 @@ def open_mfdataset(
                 **kwargs,
             )
         )
-    # merge Datasets
-    darr = xr.merge(datasets, compat="override")
+    # concatenate and merge Datasets
+    darr = _combine(datasets)
     # return xarray Dataset
     return darr
 
@@ -135,6 +142,40 @@ def open_dataset(
     return ds
 
 
+def _combine(objs: list[xr.Dataset] | list[xr.DataArray]):
+    """
+    Concatenate xarray objects for each variable along time
+    and merge the variables
+
+    Parameters
+    ----------
+    objs: list of xarray.Dataset or xarray.DataArray
+        list of xarray objects
+    """
+    # group xarray objects by variable name
+    groups = {}
+    for obj in objs:
+        key = tuple(obj.data_vars) if isinstance(obj, xr.Dataset) else obj.name
+        groups.setdefault(key, []).append(obj)
+    # concatenate each variable along the (sorted) time dimension
+    combined = []
+    for group in groups.values():
+        if (len(group) > 1) and all("time" in obj.dims for obj in group):
+            combined.append(
+                xr.concat(
+                    group,
+                    dim="time",
+                    coords="minimal",
+                    compat="override",
+                    join="override",
+                ).sortby("time")
+            )
+        else:
+            combined.extend(group)
+    # merge the (concatenated) variables
+    return xr.merge(combined, compat="override")
+
+
 # PURPOSE: read a list of model files
 def open_mfdataarray(filename: list[str] | list[pathlib.Path], **kwargs):
     """
@@ -144,8 +185,10 @@ def open_mfdataarray(filename: list[str] | list[pathlib.Path], **kwargs):
     ----------
     filename: list of str or pathlib.Path
         list of files
-    parallel: bool, default False
-        Open files in parallel using ``dask.delayed``
+    parallel: bool, default True
+        Open files in parallel using threads
+    max_workers: int or NoneType, default None
+        maximum number of threads for opening files
     **kwargs: dict
         additional keyword arguments for opening files
 
@@ -155,16 +198,18 @@ def open_mfdataarray(filename: list[str] | list[pathlib.Path], **kwargs):
         xarray DataArray
     """
     # set default keyword arguments
-    kwargs.setdefault("parallel", False)
-    parallel = kwargs.get("parallel") and dask_available
+    parallel = kwargs.pop("parallel", True) and (len(filename) > 1)
+    max_workers = kwargs.pop("max_workers", None)
     # read each file as xarray DataArray and append to list
     if parallel:
-        opener = dask.delayed(open_dataarray)
-        (d,) = dask.compute([opener(f, **kwargs) for f in filename])
+        max_workers = max_workers or min(32, len(filename))
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as ex:
+            futures = [ex.submit(open_dataarray, f, **kwargs) for f in filename]
+            d = [future.result() for future in futures]
     else:
         d = [open_dataarray(f, **kwargs) for f in filename]
-    # merge DataArray
-    darr = xr.merge(d, compat="override")
+    # concatenate and merge DataArrays
+    darr = _combine(d)
     # return xarray DataArray
     return darr
 
@@ -189,6 +234,10 @@ def open_dataarray(
     chunks: int, dict, str, or None, default None
         variable chunk sizes for dask (see ``rioxarray.open_rasterio``)
 
+        Uses ``'auto'`` chunks if ``dask`` is available
+    lock: bool or NoneType, default False
+        Lock for serializing reads (see ``rioxarray.open_rasterio``)
+
     Returns
     -------
     darr: xr.DataArray
@@ -196,6 +245,10 @@ def open_dataarray(
     """
     # get coordinate reference system (CRS) information from kwargs
     crs = kwargs.get("crs", None)
+    # read chunks concurrently without a global lock
+    if (chunks is None) and dask_available:
+        chunks = "auto"
+    kwargs.setdefault("lock", False)
     # verbose logging
     logging.debug(f"Opening GeoTIFF file: {filename}")
     # open the geotiff file using rioxarray
@@ -210,19 +263,15 @@ def open_dataarray(
     elif pattern and re.search(pattern, name, re.I):
         # extract start and end time from filename
         _, start, end, _ = re.findall(pattern, name, re.I).pop()
-        # parse strings into datetime objects
-        start_time = timescale.time.parse(start)
-        end_time = timescale.time.parse(end)
-        time_array = np.array([start_time, end_time], dtype="datetime64[D]")
-        # convert to timescale objects and take the mean
-        ts = timescale.from_datetime(time_array)
-        darr["time"] = xr.DataArray(ts.mean().to_datetime(), dims="band")
+        # calculate the mean time from the (cached) parsed dates
+        time = xAdvect.io.dataset._mean_time(start, end)
+        darr["time"] = xr.DataArray(time, dims="band")
         darr = darr.swap_dims({"band": "time"})
     # attach coordinate reference system (CRS) information
     if crs is not None:
-        darr.attrs["crs"] = pyproj.CRS.from_user_input(crs).to_dict()
+        darr.attrs["crs"] = xAdvect.io.dataset._crs_to_dict(crs)
     else:
         crs_wkt = darr.spatial_ref.attrs["crs_wkt"]
-        darr.attrs["crs"] = pyproj.CRS.from_user_input(crs_wkt).to_dict()
+        darr.attrs["crs"] = xAdvect.io.dataset._crs_to_dict(crs_wkt)
     # return xarray DataArray
     return darr
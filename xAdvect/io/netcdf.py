@@ -15,6 +15,21 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: open multiple files in parallel using threads
+        create remapped datasets with a single constructor
+        reuse parsed coordinate reference systems
+        align dask chunks with the chunks stored on disk
+        rechunk merged datasets from single chunk files
+        combine files with xarray.open_mfdataset if dask is available
+        open files with h5netcdf and rename mapped variables in one pass
+        cache dictionaries of coordinate reference systems
+        cache mean times parsed from start and end dates
+        concatenate files with the same variables along a dimension
+        decode only the remapped variables
+        rechunk merged datasets from files opened with native chunks
+        use opened datasets without copying if not remapped
+        add time dimensions and coordinates in a single pass
+        limit the number of dask workers for opening files
     Updated 02/2026: added logging information when opening files
     Written 01/2026
 """
@@ -22,14 +37,14 @@ UPDATE HISTORY:
 from __future__ import division, annotations
 
 import os
-import pyproj
 import pathlib
 import logging
+import functools
+import concurrent.futures
 import warnings
-import numpy as np
 import xarray as xr
 import xAdvect.utilities
-import timescale.time
+import xAdvect.io.dataset
 
 # attempt imports
 dask = xAdvect.utilities.import_dependency("dask")
@@ -50,26 +65,130 @@ def open_mfdataset(filename: list[str] | list[pathlib.Path], **kwargs):
     ----------
     filename: list of str or pathlib.Path
         list of files
-    parallel: bool, default False
-        Open files in parallel using ``dask.delayed``
+    parallel: bool, default True
+        Open files in parallel
+
+        Uses ``xarray.open_mfdataset`` if ``dask`` is available,
+        otherwise opens files using threads
+    max_workers: int or NoneType, default None
+        maximum number of threads for opening files
+
+        Sets the number of workers of the local ``dask`` scheduler
+        if ``dask`` is available
+    combine_chunks: dict or None, default None
+        dask chunk sizes for the merged dataset (e.g. ``{'time': 200}``)
+
+        Each file is opened as a single chunk and rechunked after merging
+    rechunk: dict or None, default None
+        dask chunk sizes for the merged dataset
+
+        Each file is opened with its ``chunks`` (by default the chunks
+        stored on disk) and rechunked after merging
+    concat_dim: str, default 'time'
+        dimension for concatenating files with the same variables
+
+        Files with different variables are combined using coordinates.
+        Only used if ``dask`` is unavailable, otherwise all files are
+        combined using their coordinates with ``xarray.open_mfdataset``
     **kwargs: dict
         additional keyword arguments for opening files
+
     Returns
     -------
     ds: xarray.Dataset
         xarray Dataset
     """
     # set default keyword arguments
-    kwargs.setdefault("parallel", False)
-    parallel = kwargs.get("parallel") and dask_available
+    parallel = kwargs.pop("parallel", True) and (len(filename) > 1)
+    max_workers = kwargs.pop("max_workers", None)
+    combine_chunks = kwargs.pop("combine_chunks", None)
+    concat_dim = kwargs.pop("concat_dim", "time")
+    # open each file as a single chunk if rechunking after merging
+    if combine_chunks is not None:
+        kwargs["chunks"] = -1
+    # dask chunk sizes after combining
+    rechunk = kwargs.pop("rechunk", None) or combine_chunks
+    # open and combine files with xarray if dask is available
+    # remapping variables within each task of the graph
+    if dask_available:
+        chunks = kwargs.pop("chunks", None)
+        if chunks in (None, "disk"):
+            chunks = {}
+        for f in filename:
+            logging.debug(f"Opening netCDF4 file: {f}")
+        # decoding after remapping if a variable mapping is provided
+        decode_after_remap = kwargs.get("mapping") is not None
+        decode_on_open = not decode_after_remap
+        preprocess = functools.partial(
+            _preprocess,
+            mapping=kwargs.get("mapping"),
+            crs=kwargs.get("crs"),
+            longterm=kwargs.get("longterm", False),
+            decode=decode_after_remap,
+        )
+        # limit the number of workers for opening files
+        config = dict(num_workers=max_workers) if max_workers else {}
+        with dask.config.set(**config):
+            ds = xr.open_mfdataset(
+                filename,
+                chunks=chunks,
+                **_backend_kwargs(kwargs.get("engine", "h5netcdf")),
+                parallel=parallel,
+                preprocess=preprocess,
+                mask_and_scale=decode_on_open,
+                decode_cf=decode_on_open,
+                combine="by_coords",
+                compat="override",
+                coords="minimal",
+                data_vars="minimal",
+                combine_attrs="override",
+            )
+        # rechunk the combined dataset
+        if rechunk is not None:
+            ds = ds.chunk(rechunk)
+        return ds
     # read each file as xarray dataset and append to list
     if parallel:
-        opener = dask.delayed(open_dataset)
-        (d,) = dask.compute([opener(f, **kwargs) for f in filename])
+        max_workers = max_workers or min(32, len(filename))
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as ex:
+            futures = [ex.submit(open_dataset, f, **kwargs) for f in filename]
+            d = [future.result() for future in futures]
     else:
         d = [open_dataset(f, **kwargs) for f in filename]
-    # merge datasets
-    ds = xr.merge(d, compat="override")
+    # concatenate datasets that tile a single dimension
+    variables = set(d[0].data_vars)
+    if all(
+        (concat_dim in dset.dims) and (set(dset.data_vars) == variables)
+        for dset in d
+    ):
+        # order datasets by their first coordinate value
+        # to keep the attributes of the first dataset along the dimension
+        d.sort(key=lambda dset: dset[concat_dim].values.min())
+        ds = xr.concat(
+            d,
+            dim=concat_dim,
+            coords="minimal",
+            data_vars="minimal",
+            compat="override",
+            join="override",
+            combine_attrs="override",
+        )
+        # sort datasets with interleaved coordinates
+        index = ds.indexes.get(concat_dim)
+        if (index is not None) and not index.is_monotonic_increasing:
+            ds = ds.sortby(concat_dim)
+    else:
+        # combine datasets using their coordinates
+        ds = xr.combine_by_coords(
+            d,
+            compat="override",
+            coords="minimal",
+            data_vars="minimal",
+            combine_attrs="override",
+        )
+    # rechunk the combined dataset
+    if rechunk is not None:
+        ds = ds.chunk(rechunk)
     # return xarray dataset
     return ds
 
@@ -91,6 +210,12 @@ def open_dataset(
     chunks: int, dict, str, or None, default None
         variable chunk sizes for dask (see ``xarray.open_dataset``)
 
+        - ``'disk'``: align with the chunks stored on disk
+        - ``None``: align with the chunks stored on disk if ``dask`` is
+          available, otherwise read without ``dask``
+    engine: str or None, default "h5netcdf"
+        xarray backend engine for opening files
+
     Returns
     -------
     ds: xr.Dataset
@@ -102,33 +227,107 @@ def open_dataset(
     crs = kwargs.get("crs", None)
     # verbose logging
     logging.debug(f"Opening netCDF4 file: {filename}")
+    # align dask chunks with the chunks stored on disk
+    # using the preferred chunks of the backend engine
+    if (chunks == "disk") or ((chunks is None) and dask_available):
+        chunks = {}
     # open the netCDF4 file using xarray
-    tmp = xr.open_dataset(filename, mask_and_scale=True, chunks=chunks)
+    # decoding after remapping if a variable mapping is provided
+    decode_after_remap = mapping is not None
+    decode_on_open = not decode_after_remap
+    tmp = xr.open_dataset(
+        filename,
+        mask_and_scale=decode_on_open,
+        decode_cf=decode_on_open,
+        chunks=chunks,
+        **_backend_kwargs(kwargs.get("engine", "h5netcdf")),
+    )
+    # remap variables and assign time and CRS information
+    ds = _preprocess(
+        tmp,
+        mapping=mapping,
+        crs=crs,
+        longterm=kwargs["longterm"],
+        decode=decode_after_remap,
+    )
+    # return the xarray dataset
+    return ds
+
+
+def _backend_kwargs(engine: str | None = "h5netcdf") -> dict:
+    """Keyword arguments for opening netCDF4 files with an engine
+
+    Parameters
+    ----------
+    engine: str or None, default "h5netcdf"
+        xarray backend engine for opening files
+
+    Returns
+    -------
+    kwargs: dict
+        keyword arguments for ``xarray.open_dataset``
+    """
+    kwargs = dict(engine=engine)
+    # sort dimensions without dimension scales without extra lookups
+    if engine == "h5netcdf":
+        kwargs["phony_dims"] = "sort"
+    return kwargs
+
+
+def _preprocess(
+    tmp: xr.Dataset,
+    mapping: dict | None = None,
+    crs: str | int | dict | None = None,
+    longterm: bool = False,
+    decode: bool = False,
+) -> xr.Dataset:
+    """Remap variables and assign time and coordinate reference
+    system information for an opened netCDF4 file
+
+    Parameters
+    ----------
+    tmp: xr.Dataset
+        xarray Dataset opened from a netCDF4 file
+    mapping: dict or None, default None
+        Dictionary mapping standard variable names to those in the file
+    crs: str, int, dict or None, default None
+        Coordinate reference system of the file
+    longterm: bool, default False
+        Datafile is a long-term average
+    decode: bool, default False
+        Decode the remapped variables using CF conventions
+
+        For files opened without decoding
+
+    Returns
+    -------
+    ds: xr.Dataset
+        xarray Dataset
+    """
     tmp = tmp.drop_vars(["lon", "lat"], errors="ignore")
     # apply variable mapping if provided
     if mapping is not None:
-        # create xarray dataset
-        ds = xr.Dataset()
-        for key, value in mapping.items():
-            ds[key] = tmp[value]
-        # copy attributes
-        ds.attrs = tmp.attrs.copy()
+        # select and rename variables in a single pass
+        ds = tmp[list(mapping.values())].rename(
+            {value: key for key, value in mapping.items()}
+        )
+        # mask, scale and decode only the remapped variables
+        if decode:
+            ds = xr.decode_cf(ds)
     else:
-        ds = tmp.copy()
+        ds = tmp
     # assign time dimension for long-term averages or from attributes
-    if kwargs["longterm"]:
+    if longterm:
         pass
     elif "time_coverage_start" in ds.attrs and "time_coverage_end" in ds.attrs:
-        ds = ds.expand_dims(dim="time", axis=2)
-        # parse strings into datetime objects
-        start_time = timescale.time.parse(ds.attrs["time_coverage_start"])
-        end_time = timescale.time.parse(ds.attrs["time_coverage_end"])
-        time_array = np.array([start_time, end_time], dtype="datetime64[D]")
-        # convert to timescale objects and take the mean
-        ts = timescale.from_datetime(time_array)
-        ds["time"] = ts.mean().to_datetime()
+        # calculate the mean time from the (cached) parsed dates
+        time = xAdvect.io.dataset._mean_time(
+            ds.attrs["time_coverage_start"], ds.attrs["time_coverage_end"]
+        )
+        # add the time dimension and coordinate in a single pass
+        ds = ds.expand_dims(dict(time=time), axis=-1)
     # attach coordinate reference system (CRS) information
     if crs is not None:
-        ds.attrs["crs"] = pyproj.CRS.from_user_input(crs).to_dict()
+        ds.attrs["crs"] = xAdvect.io.dataset._crs_to_dict(crs)
     # return the xarray dataset
     return ds
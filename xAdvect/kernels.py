@@ -0,0 +1,1021 @@
+#!/usr/bin/env python
+"""
+kernels.py
+Written by Tyler Sutterley (10/2026)
+Compiled kernels for sampling velocity grids at parcel locations
+
+PYTHON DEPENDENCIES:
+    numpy: Scientific Computing Tools For Python
+        https://numpy.org
+        https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
+    numba: JIT compiler for Python and NumPy
+        https://numba.pydata.org/
+
+UPDATE HISTORY:
+    Updated 10/2026: compile shared integration steps as CUDA device functions
+    Updated 10/2026: single-pass kernel for polar stereographic scaling
+    Updated 10/2026: fused kernels for inpainting iterations
+    Updated 10/2026: single-pass reduction for RKF45 convergence
+    Updated 10/2026: fused stage velocities for RKF45 steps
+    Updated 10/2026: parallel kernel for explicit Euler steps
+    Updated 10/2026: sample time-invariant grids once per stage
+    Updated 10/2026: integrate all Euler and RK4 steps within kernels
+    Updated 10/2026: optional fourth-order Runge-Kutta kernel for CUDA
+    Updated 10/2026: cached lookup of integration kernels
+    Written 10/2026
+"""
+
+from __future__ import annotations
+
+import types
+import functools
+import numpy as np
+import xAdvect.utilities
+
+# attempt imports
+numba = xAdvect.utilities.import_dependency("numba")
+numba_available = xAdvect.utilities.dependency_available("numba")
+cuda = xAdvect.utilities.import_dependency("numba.cuda")
+
+__all__ = [
+    "numba_available",
+    "njit",
+    "prange",
+    "bilinear",
+    "trilinear",
+    "euler_run",
+    "rk4_run",
+    "cuda_available",
+    "rk4_run_cuda",
+    "get_driver",
+    "rkf45_stages",
+    "rkf45_sigma",
+    "inpaint_input",
+    "inpaint_scale",
+    "inpaint_update",
+    "polar_scale",
+]
+
+# fast-math flags for compiled kernels
+# (excluding the no-NaN and no-Inf flags to preserve invalid points)
+_fastmath = {"nsz", "arcp", "contract", "afn", "reassoc"}
+# fast-math flags for reductions over valid points
+# (excluding the no-signed-zeros flag which can fold invalid points)
+_fastmath_reduce = {"arcp", "contract", "afn", "reassoc"}
+
+
+# PURPOSE: compile functions with numba if available
+def njit(*args, **kwargs):
+    """
+    Compile a function with ``numba.njit`` if available
+
+    Returns the original Python function if ``numba`` is not installed
+    """
+    if numba_available:
+        return numba.njit(*args, **kwargs)
+    elif args and callable(args[0]):
+        return args[0]
+    else:
+        return lambda func: func
+
+
+# parallel range for compiled loops
+prange = numba.prange if numba_available else range
+
+
+@njit(fastmath=_fastmath, boundscheck=False, cache=True)
+def _locate(q: float, g: np.ndarray, inv: float):
+    """
+    Calculates the fractional index of a coordinate within a grid
+
+    Parameters
+    ----------
+    q: float
+        coordinate value
+    g: np.ndarray
+        monotonically increasing grid coordinates
+    inv: float
+        inverse of the grid spacing (0 for irregular grids)
+
+    Returns
+    -------
+    f: float
+        fractional index of the coordinate
+    """
+    # regular grids: scale by the inverse grid spacing
+    if inv != 0.0:
+        return (q - g[0]) * inv
+    # irregular grids: binary search for the enclosing interval
+    n = g.shape[0]
+    if not ((q >= g[0]) and (q <= g[n - 1])):
+        return np.nan
+    lo, hi = 0, n - 1
+    while (hi - lo) > 1:
+        mid = (lo + hi) // 2
+        if g[mid] <= q:
+            lo = mid
+        else:
+            hi = mid
+    return lo + (q - g[lo]) / (g[hi] - g[lo])
+
+
+@njit(fastmath=_fastmath, boundscheck=False, cache=True)
+def _clamp(f: float, n: int):
+    """
+    Splits a fractional index into a lower grid index and weight
+
+    Parameters
+    ----------
+    f: float
+        fractional index
+    n: int
+        number of grid points
+
+    Returns
+    -------
+    i: int
+        lower grid index limited to ``[0, n-2]``
+    w: float
+        weight of the upper grid point
+    """
+    # limit the fractional index to within the grid
+    # (invalid values are set to the first grid point)
+    f = f if (f >= 0.0) else 0.0
+    f = f if (f <= n - 1) else n - 1.0
+    # lower grid index and weight
+    i = min(int(f), max(n - 2, 0))
+    return i, f - i
+
+
+@njit(fastmath=_fastmath, boundscheck=False, cache=True)
+def _sample2d(
+    U: np.ndarray,
+    V: np.ndarray,
+    xq: float,
+    yq: float,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    order: int,
+):
+    """
+    Interpolates velocity grids to a single parcel location
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(y, x)``
+    xq: float
+        x-coordinate of the parcel
+    yq: float
+        y-coordinate of the parcel
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    order: int
+        interpolation order
+
+    Returns
+    -------
+    u: float
+        x-component of velocity at the parcel
+    v: float
+        y-component of velocity at the parcel
+    """
+    ny, nx = U.shape
+    # fractional grid indices of the parcel
+    fx = _locate(xq, xg, dxi)
+    fy = _locate(yq, yg, dyi)
+    # check if the parcel is within the grid (and valid)
+    valid = (fx >= 0.0) & (fx <= nx - 1) & (fy >= 0.0) & (fy <= ny - 1)
+    # round to the nearest grid cell
+    if order == 0:
+        fx = np.floor(fx + 0.5)
+        fy = np.floor(fy + 0.5)
+    # lower-left grid indices and weights
+    ix, wx = _clamp(fx, nx)
+    iy, wy = _clamp(fy, ny)
+    # weighted sum of the four corners
+    w00 = (1.0 - wx) * (1.0 - wy)
+    w01 = wx * (1.0 - wy)
+    w10 = (1.0 - wx) * wy
+    w11 = wx * wy
+    u = (
+        w00 * U[iy, ix]
+        + w01 * U[iy, ix + 1]
+        + w10 * U[iy + 1, ix]
+        + w11 * U[iy + 1, ix + 1]
+    )
+    v = (
+        w00 * V[iy, ix]
+        + w01 * V[iy, ix + 1]
+        + w10 * V[iy + 1, ix]
+        + w11 * V[iy + 1, ix + 1]
+    )
+    # parcels outside of the grid (or invalid) are set to NaN
+    if not valid:
+        return np.nan, np.nan
+    return u, v
+
+
+@njit(fastmath=_fastmath, boundscheck=False, cache=True)
+def _sample3d(
+    U: np.ndarray,
+    V: np.ndarray,
+    xq: float,
+    yq: float,
+    tq: float,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+):
+    """
+    Interpolates time-variable velocity grids to a single parcel location
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    xq: float
+        x-coordinate of the parcel
+    yq: float
+        y-coordinate of the parcel
+    tq: float
+        time coordinate of the parcel
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+    Returns
+    -------
+    u: float
+        x-component of velocity at the parcel
+    v: float
+        y-component of velocity at the parcel
+    """
+    nt = U.shape[0]
+    # time-invariant grids: interpolate the single time slice
+    if nt == 1:
+        return _sample2d(U[0], V[0], xq, yq, xg, dxi, yg, dyi, order)
+    # limit the time to within the range of the grids
+    tq = min(max(tq, tg[0]), tg[nt - 1])
+    # fractional time index of the parcel
+    ft = _locate(tq, tg, 0.0)
+    # round to the nearest time
+    if order == 0:
+        ft = np.floor(ft + 0.5)
+    # lower time index and weight
+    it, wt = _clamp(ft, nt)
+    jt = min(it + 1, nt - 1)
+    # interpolate to the parcel location at each time
+    u0, v0 = _sample2d(U[it], V[it], xq, yq, xg, dxi, yg, dyi, order)
+    u1, v1 = _sample2d(U[jt], V[jt], xq, yq, xg, dxi, yg, dyi, order)
+    # linearly interpolate in time
+    return (1.0 - wt) * u0 + wt * u1, (1.0 - wt) * v0 + wt * v1
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def bilinear(
+    U: np.ndarray,
+    V: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    order: int,
+    u: np.ndarray,
+    v: np.ndarray,
+):
+    """
+    Bilinearly interpolates velocity grids to parcel locations
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(y, x)``
+    x: np.ndarray
+        x-coordinates of parcels
+    y: np.ndarray
+        y-coordinates of parcels
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    order: int
+        interpolation order
+
+            - ``0``: nearest-neighbor
+            - ``1``: linear
+    u: np.ndarray
+        output x-component of velocity
+    v: np.ndarray
+        output y-component of velocity
+    """
+    for i in prange(x.shape[0]):
+        u[i], v[i] = _sample2d(U, V, x[i], y[i], xg, dxi, yg, dyi, order)
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def trilinear(
+    U: np.ndarray,
+    V: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    t: np.ndarray,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+    u: np.ndarray,
+    v: np.ndarray,
+):
+    """
+    Trilinearly interpolates time-variable velocity grids
+    to parcel locations
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    x: np.ndarray
+        x-coordinates of parcels
+    y: np.ndarray
+        y-coordinates of parcels
+    t: np.ndarray
+        time coordinates of parcels
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+            - ``0``: nearest-neighbor
+            - ``1``: linear
+    u: np.ndarray
+        output x-component of velocity
+    v: np.ndarray
+        output y-component of velocity
+    """
+    for i in prange(x.shape[0]):
+        u[i], v[i] = _sample3d(
+            U, V, x[i], y[i], t[i], xg, dxi, yg, dyi, tg, order
+        )
+
+
+@njit(fastmath=_fastmath, boundscheck=False, cache=True)
+def _rk4(
+    U: np.ndarray,
+    V: np.ndarray,
+    xi: float,
+    yi: float,
+    ti: float,
+    h: float,
+    N: int,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+):
+    """
+    Integrates a single parcel using fourth-order Runge-Kutta steps
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    xi: float
+        x-coordinate of the parcel
+    yi: float
+        y-coordinate of the parcel
+    ti: float
+        time coordinate of the parcel
+    h: float
+        integration time step size
+    N: int
+        number of integration steps
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+    Returns
+    -------
+    xi: float
+        integrated x-coordinate of the parcel
+    yi: float
+        integrated y-coordinate of the parcel
+    ti: float
+        integrated time coordinate of the parcel
+    """
+    for _ in range(N):
+        # velocities at each of the four stages
+        u1, v1 = _sample3d(U, V, xi, yi, ti, xg, dxi, yg, dyi, tg, order)
+        x2 = xi + 0.5 * u1 * h
+        y2 = yi + 0.5 * v1 * h
+        u2, v2 = _sample3d(U, V, x2, y2, ti, xg, dxi, yg, dyi, tg, order)
+        x3 = xi + 0.5 * u2 * h
+        y3 = yi + 0.5 * v2 * h
+        u3, v3 = _sample3d(U, V, x3, y3, ti, xg, dxi, yg, dyi, tg, order)
+        x4 = xi + u3 * h
+        y4 = yi + v3 * h
+        u4, v4 = _sample3d(U, V, x4, y4, ti, xg, dxi, yg, dyi, tg, order)
+        # add weighted displacements to coordinates
+        xi += h * (u1 + 2.0 * u2 + 2.0 * u3 + u4) / 6.0
+        yi += h * (v1 + 2.0 * v2 + 2.0 * v3 + v4) / 6.0
+        # add to time
+        ti += h
+    return xi, yi, ti
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def euler_run(
+    U: np.ndarray,
+    V: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    t: np.ndarray,
+    dt: np.ndarray,
+    N: int,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+):
+    """
+    Advances parcels in place using explicit Euler steps
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    x: np.ndarray
+        x-coordinates of parcels
+    y: np.ndarray
+        y-coordinates of parcels
+    t: np.ndarray
+        time coordinates of parcels
+    dt: np.ndarray
+        integration time step size of parcels
+    N: int
+        number of integration steps
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+            - ``0``: nearest-neighbor
+            - ``1``: linear
+    """
+    for i in prange(x.shape[0]):
+        h = dt[i]
+        xi, yi, ti = x[i], y[i], t[i]
+        for _ in range(N):
+            u, v = _sample3d(U, V, xi, yi, ti, xg, dxi, yg, dyi, tg, order)
+            # add displacements to coordinates
+            xi += u * h
+            yi += v * h
+            # add to time
+            ti += h
+        x[i], y[i], t[i] = xi, yi, ti
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def rk4_run(
+    U: np.ndarray,
+    V: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    t: np.ndarray,
+    dt: np.ndarray,
+    N: int,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+):
+    """
+    Advances parcels in place using fourth-order Runge-Kutta steps
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    x: np.ndarray
+        x-coordinates of parcels
+    y: np.ndarray
+        y-coordinates of parcels
+    t: np.ndarray
+        time coordinates of parcels
+    dt: np.ndarray
+        integration time step size of parcels
+    N: int
+        number of integration steps
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+            - ``0``: nearest-neighbor
+            - ``1``: linear
+    """
+    for i in prange(x.shape[0]):
+        x[i], y[i], t[i] = _rk4(
+            U, V, x[i], y[i], t[i], dt[i], N, xg, dxi, yg, dyi, tg, order
+        )
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def rkf45_stages(
+    U: np.ndarray,
+    V: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    t: np.ndarray,
+    dt: np.ndarray,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+    A: np.ndarray,
+    us: np.ndarray,
+    vs: np.ndarray,
+):
+    """
+    Calculates velocities at each stage of a Runge-Kutta-Fehlberg step
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    x: np.ndarray
+        x-coordinates of parcels
+    y: np.ndarray
+        y-coordinates of parcels
+    t: np.ndarray
+        time coordinates of parcels
+    dt: np.ndarray
+        integration time step size of parcels
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+            - ``0``: nearest-neighbor
+            - ``1``: linear
+    A: np.ndarray
+        Runge-Kutta matrix of the Butcher tableau
+    us: np.ndarray
+        output x-component of velocity at each stage ``(stages, parcels)``
+    vs: np.ndarray
+        output y-component of velocity at each stage ``(stages, parcels)``
+    """
+    for i in prange(x.shape[0]):
+        h = dt[i]
+        # velocities at the first stage
+        us[0, i], vs[0, i] = _sample3d(
+            U, V, x[i], y[i], t[i], xg, dxi, yg, dyi, tg, order
+        )
+        for k in range(A.shape[0]):
+            # weighted sum of the velocities from the previous stages
+            du = 0.0
+            dv = 0.0
+            for j in range(k + 1):
+                du += A[k, j] * us[j, i]
+                dv += A[k, j] * vs[j, i]
+            xk = x[i] + du * h
+            yk = y[i] + dv * h
+            us[k + 1, i], vs[k + 1, i] = _sample3d(
+                U, V, xk, yk, t[i], xg, dxi, yg, dyi, tg, order
+            )
+
+
+@njit(parallel=True, fastmath=_fastmath_reduce, boundscheck=False, cache=True)
+def rkf45_sigma(
+    x4: np.ndarray,
+    y4: np.ndarray,
+    x5: np.ndarray,
+    y5: np.ndarray,
+):
+    """
+    Calculates the root mean square difference between the 4th and
+    5th order Runge-Kutta-Fehlberg solutions in a single pass
+
+    Parameters
+    ----------
+    x4: np.ndarray
+        x-coordinates of the 4th order solution
+    y4: np.ndarray
+        y-coordinates of the 4th order solution
+    x5: np.ndarray
+        x-coordinates of the 5th order solution
+    y5: np.ndarray
+        y-coordinates of the 5th order solution
+
+    Returns
+    -------
+    sigma: float
+        root mean square difference of valid parcels
+    """
+    acc = 0.0
+    count = 0
+    for i in prange(x4.shape[0]):
+        d = (x5[i] - x4[i]) ** 2 + (y5[i] - y4[i]) ** 2
+        # only include valid parcels
+        if not np.isnan(d):
+            acc += d
+            count += 1
+    # return NaN if there are no valid parcels
+    if count == 0:
+        return np.nan
+    return np.sqrt(acc / count)
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def inpaint_input(
+    W: np.ndarray,
+    ZI: np.ndarray,
+    z0: np.ndarray,
+    out: np.ndarray,
+):
+    """
+    Merges valid data values with the current inpainted grid
+    as the input for a discrete cosine transform
+
+    Parameters
+    ----------
+    W: np.ndarray
+        mask of valid data values
+    ZI: np.ndarray
+        data values with 0 for invalid points
+    z0: np.ndarray
+        current inpainted grid
+    out: np.ndarray
+        output transform input
+    """
+    ny, nx = z0.shape
+    for i in prange(ny):
+        for j in range(nx):
+            out[i, j] = W[i, j] * (ZI[i, j] - z0[i, j]) + z0[i, j]
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def inpaint_scale(
+    DISCOS: np.ndarray,
+    LAMBDA: np.ndarray,
+    s: float,
+):
+    """
+    Scales discrete cosine transform coefficients in place
+    by the weights for a smoothness parameter
+
+    Parameters
+    ----------
+    DISCOS: np.ndarray
+        discrete cosine transform coefficients
+    LAMBDA: np.ndarray
+        lambda function
+    s: float
+        smoothness parameter
+    """
+    ny, nx = DISCOS.shape
+    for i in prange(ny):
+        for j in range(nx):
+            DISCOS[i, j] /= 1.0 + s * LAMBDA[i, j]
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def inpaint_update(
+    z0: np.ndarray,
+    update: np.ndarray,
+    epsilon: float,
+):
+    """
+    Relaxes the inpainted grid in place towards an updated grid
+
+    Parameters
+    ----------
+    z0: np.ndarray
+        current inpainted grid
+    update: np.ndarray
+        updated grid from the inverse transform
+    epsilon: float
+        relaxation factor
+    """
+    ny, nx = z0.shape
+    for i in prange(ny):
+        for j in range(nx):
+            z0[i, j] = epsilon * update[i, j] + (1.0 - epsilon) * z0[i, j]
+
+
+@njit(parallel=True, fastmath=_fastmath, boundscheck=False, cache=True)
+def polar_scale(
+    theta: np.ndarray,
+    ecc: float,
+    ecc2: float,
+    mref: float,
+    tref: float,
+    kp: float,
+    power: int,
+    out: np.ndarray,
+):
+    """
+    Calculates polar stereographic scaling factors in a single pass
+    including the special case at the exact pole
+
+    Parameters
+    ----------
+    theta: np.ndarray
+        positive latitudes in radians (1-dimensional)
+    ecc: float
+        eccentricity of the ellipsoid
+    ecc2: float
+        square of the eccentricity of the ellipsoid
+    mref: float
+        ratio ``m`` at the reference latitude
+    tref: float
+        ratio ``t`` at the reference latitude
+    kp: float
+        distance scaling at the pole
+    power: int
+        power of the scaling factors
+
+            - ``1``: scale factors for distance
+            - ``2``: scale factors for area
+    out: np.ndarray
+        output scaling factors
+    """
+    # tolerance for the pole (matching numpy.isclose)
+    halfpi = np.pi / 2.0
+    tol = 1e-8 + 1e-5 * halfpi
+    for i in prange(theta.shape[0]):
+        th = theta[i]
+        if np.abs(th - halfpi) <= tol:
+            # scaling at the exact pole
+            k = kp
+        else:
+            # calculate ratios at input latitude
+            sinth = np.sin(th)
+            m = np.cos(th) / np.sqrt(1.0 - ecc2 * sinth * sinth)
+            t = np.tan(np.pi / 4.0 - th / 2.0) / (
+                (1.0 - ecc * sinth) / (1.0 + ecc * sinth)
+            ) ** (ecc / 2.0)
+            # distance scaling
+            k = (mref / m) * (t / tref)
+        out[i] = 1.0 / k**power
+
+
+# PURPOSE: check if a CUDA device is available for compiled kernels
+def cuda_available():
+    """
+    Check if ``numba`` can compile kernels for a CUDA device
+    """
+    return numba_available and bool(cuda.is_available())
+
+
+def _device(func, **functions):
+    """
+    Compiles a function as a CUDA device function
+
+    Parameters
+    ----------
+    func: obj
+        compiled or Python function
+    **functions: dict
+        device functions to call in place of the compiled functions
+    """
+    # copy the Python function with the device functions as globals
+    py_func = getattr(func, "py_func", func)
+    namespace = dict(py_func.__globals__, **functions)
+    device_func = types.FunctionType(
+        py_func.__code__,
+        namespace,
+        py_func.__name__,
+        py_func.__defaults__,
+        py_func.__closure__,
+    )
+    return cuda.jit(device=True)(device_func)
+
+
+@functools.cache
+def _rk4_cuda():
+    """
+    Compiles the fourth-order Runge-Kutta kernel for CUDA devices
+    """
+    # share the integration steps of the CPU kernels as device functions
+    locate = _device(_locate)
+    clamp = _device(_clamp)
+    sample2d = _device(_sample2d, _locate=locate, _clamp=clamp)
+    sample3d = _device(
+        _sample3d, _locate=locate, _clamp=clamp, _sample2d=sample2d
+    )
+    rk4 = _device(_rk4, _sample3d=sample3d)
+
+    @cuda.jit
+    def kernel(U, V, x, y, t, dt, N, xg, dxi, yg, dyi, tg, order):
+        # one thread for each parcel
+        i = cuda.grid(1)
+        if i < x.shape[0]:
+            x[i], y[i], t[i] = rk4(
+                U, V, x[i], y[i], t[i], dt[i], N, xg, dxi, yg, dyi, tg, order
+            )
+
+    return kernel
+
+
+def rk4_run_cuda(
+    U: np.ndarray,
+    V: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    t: np.ndarray,
+    dt: np.ndarray,
+    N: int,
+    xg: np.ndarray,
+    dxi: float,
+    yg: np.ndarray,
+    dyi: float,
+    tg: np.ndarray,
+    order: int,
+    threads: int = 128,
+):
+    """
+    Advances parcels in place using fourth-order Runge-Kutta steps
+    on a CUDA device
+
+    Parameters
+    ----------
+    U: np.ndarray
+        x-component of velocity with dimensions ``(t, y, x)``
+    V: np.ndarray
+        y-component of velocity with dimensions ``(t, y, x)``
+    x: np.ndarray
+        x-coordinates of parcels
+    y: np.ndarray
+        y-coordinates of parcels
+    t: np.ndarray
+        time coordinates of parcels
+    dt: np.ndarray
+        integration time step size of parcels
+    N: int
+        number of integration steps
+    xg: np.ndarray
+        monotonically increasing x-coordinates of the grid
+    dxi: float
+        inverse of the grid spacing in x (0 for irregular grids)
+    yg: np.ndarray
+        monotonically increasing y-coordinates of the grid
+    dyi: float
+        inverse of the grid spacing in y (0 for irregular grids)
+    tg: np.ndarray
+        monotonically increasing time coordinates of the grids
+    order: int
+        interpolation order
+
+            - ``0``: nearest-neighbor
+            - ``1``: linear
+    threads: int, default 128
+        number of threads per block
+    """
+    # copy velocity grids and parcels to the device
+    d_U, d_V = cuda.to_device(U), cuda.to_device(V)
+    d_xg, d_yg, d_tg = (
+        cuda.to_device(xg),
+        cuda.to_device(yg),
+        cuda.to_device(tg),
+    )
+    d_x, d_y, d_t = cuda.to_device(x), cuda.to_device(y), cuda.to_device(t)
+    d_dt = cuda.to_device(dt)
+    # integrate each parcel on a separate thread
+    blocks = (x.shape[0] + threads - 1) // threads
+    _rk4_cuda()[blocks, threads](
+        d_U, d_V, d_x, d_y, d_t, d_dt, N, d_xg, dxi, d_yg, dyi, d_tg, order
+    )
+    # copy integrated parcels back to the host
+    d_x.copy_to_host(x)
+    d_y.copy_to_host(y)
+    d_t.copy_to_host(t)
+
+
+# PURPOSE: get the compiled kernel for an integrator and device
+@functools.cache
+def get_driver(integrator: str, device: str = "cpu"):
+    """
+    Get the compiled kernel for integrating parcels through all steps
+
+    Parameters
+    ----------
+    integrator: str
+        Advection function
+
+            - ``'euler'``
+            - ``'RK4'``
+    device: str, default 'cpu'
+        Device for the compiled kernel
+
+            - ``'cpu'``
+            - ``'cuda'``
+
+    Returns
+    -------
+    driver: obj
+        compiled kernel with the signature
+        ``(U, V, x, y, t, dt, N, xg, dxi, yg, dyi, tg, order)``
+    """
+    drivers = {
+        ("euler", "cpu"): euler_run,
+        ("RK4", "cpu"): rk4_run,
+        ("RK4", "cuda"): rk4_run_cuda,
+    }
+    try:
+        return drivers[(integrator, device)]
+    except KeyError as exc:
+        raise ValueError(f"No {device} kernel for {integrator}") from exc
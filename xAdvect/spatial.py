@@ -9,14 +9,21 @@ PYTHON DEPENDENCIES:
     numpy: Scientific Computing Tools For Python
         https://numpy.org
         https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
+    numba: JIT compiler for Python and NumPy (optional)
+        https://numba.pydata.org/
 
 UPDATE HISTORY:
+    Updated 10/2026: single-pass compiled kernel for scaling factors
+    Updated 10/2026: cache ellipsoidal and reference latitude parameters
+    Updated 10/2026: use array attributes when determining data types
     Written 01/2026
 """
 
 from __future__ import annotations
 
+import functools
 import numpy as np
+import xAdvect.kernels
 
 __all__ = [
     "data_type",
@@ -45,14 +52,15 @@ def data_type(x: np.ndarray, y: np.ndarray, t: np.ndarray) -> str:
         - ``'drift'``
         - ``'grid'``
     """
+    # sizes of inputs (without loading lazy arrays)
     xsize = np.size(x)
     ysize = np.size(y)
     tsize = np.size(t)
     if (xsize == 1) and (ysize == 1) and (tsize >= 1):
         return "time series"
-    elif (xsize == ysize) & (xsize == tsize):
+    elif (xsize == ysize) and (xsize == tsize):
         return "drift"
-    elif (np.ndim(x) > 1) & (xsize == ysize):
+    elif (np.ndim(x) > 1) and (xsize == ysize):
         return "grid"
     elif xsize != ysize:
         return "grid"
@@ -92,7 +100,60 @@ def scale_factors(
     """
     assert metric.lower() in ["distance", "area"], "Unknown metric"
     # convert latitude from degrees to positive radians
-    theta = np.radians(np.abs(lat))
+    theta = np.radians(np.abs(np.asarray(lat)))
+    # get the (cached) ellipsoidal and reference latitude parameters
+    ecc, ecc2, mref, tref, kp = _polar_parameters(flat, reference_latitude)
+    # power for distance or area scaling
+    power = 1 if (metric.lower() == "distance") else 2
+    # calculate scaling factors in a single pass with compiled kernels
+    if xAdvect.kernels.numba_available:
+        shape = np.shape(theta)
+        theta = np.ascontiguousarray(theta, dtype=np.float64).ravel()
+        scale = np.empty_like(theta)
+        xAdvect.kernels.polar_scale(
+            theta, ecc, ecc2, mref, tref, kp, power, scale
+        )
+        return scale.reshape(shape)
+    # calculate ratio at input latitudes
+    m = np.cos(theta) / np.sqrt(1.0 - ecc2 * np.sin(theta) ** 2)
+    t = np.tan(np.pi / 4.0 - theta / 2.0) / (
+        (1.0 - ecc * np.sin(theta)) / (1.0 + ecc * np.sin(theta))
+    ) ** (ecc / 2.0)
+    # inverse of the distance or area scaling
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.asarray((mref / m) * (t / tref))
+        np.power(scale, -power, out=scale)
+    # replace scaling at the exact pole
+    scale[np.isclose(theta, np.pi / 2.0)] = 1.0 / (kp**power)
+    return scale
+
+
+@functools.lru_cache(maxsize=16)
+def _polar_parameters(flat: float, reference_latitude: float):
+    """
+    Calculates the ellipsoidal and reference latitude parameters
+    for polar stereographic scaling factors
+
+    Parameters
+    ----------
+    flat: float
+        ellipsoidal flattening
+    reference_latitude: float
+        reference latitude (true scale latitude)
+
+    Returns
+    -------
+    ecc: float
+        eccentricity of the ellipsoid
+    ecc2: float
+        square of the eccentricity of the ellipsoid
+    mref: float
+        ratio ``m`` at the reference latitude
+    tref: float
+        ratio ``t`` at the reference latitude
+    kp: float
+        distance scaling at the pole
+    """
     # convert reference latitude from degrees to positive radians
     theta_ref = np.radians(np.abs(reference_latitude))
     # square of the eccentricity of the ellipsoid
@@ -100,30 +161,16 @@ def scale_factors(
     ecc2 = 2.0 * flat - flat**2
     # eccentricity of the ellipsoid
     ecc = np.sqrt(ecc2)
-    # calculate ratio at input latitudes
-    m = np.cos(theta) / np.sqrt(1.0 - ecc2 * np.sin(theta) ** 2)
-    t = np.tan(np.pi / 4.0 - theta / 2.0) / (
-        (1.0 - ecc * np.sin(theta)) / (1.0 + ecc * np.sin(theta))
-    ) ** (ecc / 2.0)
     # calculate ratio at reference latitude
     mref = np.cos(theta_ref) / np.sqrt(1.0 - ecc2 * np.sin(theta_ref) ** 2)
     tref = np.tan(np.pi / 4.0 - theta_ref / 2.0) / (
         (1.0 - ecc * np.sin(theta_ref)) / (1.0 + ecc * np.sin(theta_ref))
     ) ** (ecc / 2.0)
-    # distance scaling
-    k = (mref / m) * (t / tref)
+    # distance scaling at the pole
     kp = (
         0.5
         * mref
         * np.sqrt(((1.0 + ecc) ** (1.0 + ecc)) * ((1.0 - ecc) ** (1.0 - ecc)))
         / tref
     )
-    if metric.lower() == "distance":
-        # distance scaling
-        scale = np.where(np.isclose(theta, np.pi / 2.0), 1.0 / kp, 1.0 / k)
-    elif metric.lower() == "area":
-        # area scaling
-        scale = np.where(
-            np.isclose(theta, np.pi / 2.0), 1.0 / (kp**2), 1.0 / (k**2)
-        )
-    return scale
+    return (ecc, ecc2, mref, tref, kp)
@@ -13,6 +13,12 @@ PYTHON DEPENDENCIES:
         https://github.com/matplotlib/matplotlib
 
 UPDATE HISTORY:
+    Updated 10/2026: vectorized HSV to RGB conversions for colormaps
+    Updated 10/2026: parse color palette tables in a single pass
+    Updated 10/2026: build segment data for colormaps from arrays
+    Updated 10/2026: compile regular expressions at module level
+    Updated 10/2026: check if colormaps exist before registering
+    Updated 10/2026: single conversion for the Seroussi colormap
     Written 01/2026
 """
 
@@ -26,6 +32,11 @@ from xAdvect.utilities import import_dependency
 mpl = import_dependency("matplotlib")
 mpl.colors = import_dependency("matplotlib.colors")
 
+# regular expression operator to find numerical instances
+_rx_number = re.compile(r"[-+]?(?:(?:\d*\.\d+)|(?:\d+\.?))(?:[Ee][+-]?\d+)?")
+# regular expression operator to find the color model
+_rx_model = re.compile(r"COLOR_MODEL.*(HSV|RGB)", re.I)
+
 
 def from_cpt(filename, use_extremes=True, **kwargs):
     """
@@ -51,71 +62,53 @@ def from_cpt(filename, use_extremes=True, **kwargs):
     # extract basename from cpt filename
     name = re.sub(r"\.cpt", "", filename.name, flags=re.I)
 
-    # compile regular expression operator to find numerical instances
-    rx = re.compile(r"[-+]?(?:(?:\d*\.\d+)|(?:\d+\.?))(?:[Ee][+-]?\d+)?")
-
-    # create list objects for x, r, g, b
-    x, r, g, b = ([], [], [], [])
     # assume RGB color model
     colorModel = "RGB"
     # back, forward and no data flags
     flags = dict(B=None, F=None, N=None)
+    # color data with columns of x1, r1, g1, b1, x2, r2, g2, b2
+    data = []
     for line in file_contents:
-        # find back, forward and no-data flags
-        model = re.search(r"COLOR_MODEL.*(HSV|RGB)", line, re.I)
-        BFN = re.match(r"[BFN]", line, re.I)
         # parse non-color data lines
-        if model:
+        if "COLOR_MODEL" in line.upper():
             # find color model
-            colorModel = model.group(1)
-            continue
-        elif BFN:
-            flags[BFN.group(0)] = [float(i) for i in rx.findall(line)]
-            continue
-        elif re.search(r"#", line):
+            model = _rx_model.search(line)
+            colorModel = model.group(1).upper() if model else colorModel
+        elif line[:1] in ("B", "F", "N", "b", "f", "n"):
+            # find back, forward and no-data flags
+            flags[line[0].upper()] = [
+                float(i) for i in _rx_number.findall(line)
+            ]
+        elif "#" in line:
             # skip over commented header text
             continue
-        # find numerical instances within line
-        x1, r1, g1, b1, x2, r2, g2, b2 = rx.findall(line)
-        # append colors and locations to lists
-        x.append(float(x1))
-        r.append(float(r1))
-        g.append(float(g1))
-        b.append(float(b1))
-    # append end colors and locations to lists
-    x.append(float(x2))
-    r.append(float(r2))
-    g.append(float(g2))
-    b.append(float(b2))
+        elif line.strip():
+            # find numerical instances within the color data line
+            values = _rx_number.findall(line)[:8]
+            if len(values) < 8:
+                raise ValueError(f"Invalid color data line: {line!r}")
+            data.append(values)
+    data = np.array(data, dtype=np.float64)
+    # colors and locations including the end colors and locations
+    x, *colors = np.vstack((data[:, 0:4], data[-1, 4:8])).T
 
     # convert input colormap to output
-    xNorm = [None] * len(x)
     if colorModel == "HSV":
         # convert HSV (hue-saturation-value) to RGB
-        # calculate normalized locations (0:1)
-        for i, xi in enumerate(x):
-            rr, gg, bb = colorsys.hsv_to_rgb(r[i] / 360.0, g[i], b[i])
-            r[i] = rr
-            g[i] = gg
-            b[i] = bb
-            xNorm[i] = (xi - x[0]) / (x[-1] - x[0])
+        h, sat, v = colors
+        r, g, b = _hsv_to_rgb(h / 360.0, sat, v).T
     elif colorModel == "RGB":
         # normalize hexadecimal RGB triple from (0:255) to (0:1)
-        # calculate normalized locations (0:1)
-        for i, xi in enumerate(x):
-            r[i] /= 255.0
-            g[i] /= 255.0
-            b[i] /= 255.0
-            xNorm[i] = (xi - x[0]) / (x[-1] - x[0])
-
-    # output RGB lists containing normalized location and colors
+        r, g, b = np.multiply(colors, 1.0 / 255.0)
+    # calculate normalized locations (0:1)
+    xNorm = (x - x[0]) / (x[-1] - x[0])
+
+    # output RGB arrays containing normalized location and colors
     cdict = dict(
-        red=[None] * len(x), green=[None] * len(x), blue=[None] * len(x)
+        red=np.column_stack((xNorm, r, r)),
+        green=np.column_stack((xNorm, g, g)),
+        blue=np.column_stack((xNorm, b, b)),
     )
-    for i, xi in enumerate(x):
-        cdict["red"][i] = [xNorm[i], r[i], r[i]]
-        cdict["green"][i] = [xNorm[i], g[i], g[i]]
-        cdict["blue"][i] = [xNorm[i], b[i], b[i]]
 
     # create colormap for use in matplotlib
     cmap = mpl.colors.LinearSegmentedColormap(name, cdict, **kwargs)
@@ -136,11 +129,9 @@ def from_cpt(filename, use_extremes=True, **kwargs):
     if use_extremes:
         cmap = cmap.with_extremes(**extremes)
     # register colormap to be recognizable by cm.get_cmap()
-    # catch exception if colormap already exists
-    try:
+    # if the colormap does not already exist
+    if name not in mpl.colormaps:
         mpl.colormaps.register(name=name, cmap=cmap)
-    except:
-        pass
     # return the colormap
     return cmap
 
@@ -172,61 +163,76 @@ def custom_colormap(N, map_name, **kwargs):
         s = np.ones((N))
         v = np.ones((N))
         # calculate RGB color map from HSV
-        color_map = np.zeros((N, 3))
-        for i in range(N):
-            color_map[i, :] = colorsys.hsv_to_rgb(h[i], s[i], v[i])
+        color_map = _hsv_to_rgb(h, s, v)
     elif map_name == "Seroussi":
-        # calculate initial HSV for Helene Seroussi's color map
-        h = np.linspace(0, 1, N)
-        s = np.ones((N))
-        v = np.ones((N))
-        # calculate RGB color map from HSV
-        RGB = np.zeros((N, 3))
-        for i in range(N):
-            RGB[i, :] = colorsys.hsv_to_rgb(h[i], s[i], v[i])
-        # reverse color order and trim to range
-        RGB = RGB[::-1, :]
-        RGB = RGB[1 : np.floor(0.7 * N).astype("i"), :]
-        # calculate HSV color map from RGB
-        HSV = np.zeros_like(RGB)
-        for i, val in enumerate(RGB):
-            HSV[i, :] = colorsys.rgb_to_hsv(val[0], val[1], val[2])
+        # calculate initial hue for Helene Seroussi's color map
+        # fully saturated colors convert back to the same hue
+        # so the hue can be reversed and trimmed before converting
+        h = np.linspace(0, 1, N)[::-1]
+        h = h[1 : np.floor(0.7 * N).astype("i")]
         # calculate saturation as a function of hue
-        HSV[:, 1] = np.clip(0.1 + HSV[:, 0], 0, 1)
+        s = np.clip(0.1 + h, 0, 1)
+        v = np.ones_like(h)
         # calculate RGB color map from HSV
-        color_map = np.zeros_like(HSV)
-        for i, val in enumerate(HSV):
-            color_map[i, :] = colorsys.hsv_to_rgb(val[0], val[1], val[2])
+        color_map = _hsv_to_rgb(h, s, v)
     elif map_name == "Rignot":
         # calculate initial HSV for Eric Rignot's color map
         h = np.linspace(0, 1, N)
         s = np.clip(0.1 + h, 0, 1)
         v = np.ones((N))
         # calculate RGB color map from HSV
-        color_map = np.zeros((N, 3))
-        for i in range(N):
-            color_map[i, :] = colorsys.hsv_to_rgb(h[i], s[i], v[i])
+        color_map = _hsv_to_rgb(h, s, v)
     else:
         raise ValueError(f"Unknown color map {map_name}")
 
-    # output RGB lists containing normalized location and colors
-    Xnorm = len(color_map) - 1.0
+    # output RGB arrays containing normalized location and colors
+    xNorm = np.arange(len(color_map)) / (len(color_map) - 1.0)
+    r, g, b = color_map.T
     cdict = dict(
-        red=[None] * len(color_map),
-        green=[None] * len(color_map),
-        blue=[None] * len(color_map),
+        red=np.column_stack((xNorm, r, r)),
+        green=np.column_stack((xNorm, g, g)),
+        blue=np.column_stack((xNorm, b, b)),
     )
-    for i, rgb in enumerate(color_map):
-        cdict["red"][i] = [float(i) / Xnorm, rgb[0], rgb[0]]
-        cdict["green"][i] = [float(i) / Xnorm, rgb[1], rgb[1]]
-        cdict["blue"][i] = [float(i) / Xnorm, rgb[2], rgb[2]]
 
     # create colormap for use in matplotlib
     cmap = mpl.colors.LinearSegmentedColormap(map_name, cdict, **kwargs)
     # register colormap to be recognizable by cm.get_cmap()
-    try:
+    # if the colormap does not already exist
+    if map_name not in mpl.colormaps:
         mpl.colormaps.register(name=map_name, cmap=cmap)
-    except:
-        pass
     # return the colormap
     return cmap
+
+
+def _hsv_to_rgb(h: np.ndarray, s: np.ndarray, v: np.ndarray):
+    """
+    Converts arrays of HSV (hue-saturation-value) colors to RGB
+
+    Parameters
+    ----------
+    h: np.ndarray
+        hue (0:1)
+    s: np.ndarray
+        saturation (0:1)
+    v: np.ndarray
+        value (0:1)
+
+    Returns
+    -------
+    rgb: np.ndarray
+        RGB colors with shape (N, 3)
+    """
+    h, s, v = np.broadcast_arrays(*np.atleast_1d(h, s, v))
+    # sector of the color wheel and fractional position within sector
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    i = i.astype(int) % 6
+    # calculate color components
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    # select the RGB components for each sector
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return np.column_stack((r, g, b))
@@ -11,6 +11,30 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/platformdirs/
 
 UPDATE HISTORY:
+    Updated 10/2026: stream files through hashing algorithms
+        stream http downloads to file while computing checksums
+        cache parsed URL components on first access
+        split urls in a single pass rather than recursively
+        reuse recent git revision hashes and status checks
+        use module file path rather than inspecting the current frame
+        reuse http connections with urllib3 pool managers if available
+        parse default directory listing times without strptime
+        add optional blake3 hashing algorithm for checksums
+        memory-map large files when computing checksums
+        parse JSON responses with orjson if available
+        update response headers without intermediate dictionaries
+        use thread-local HTML parsers for listing directories
+        parse directory listings in a single pass without a tree
+        precompile regular expression for argument file comments
+        cache the user cache directory for each application
+        cache checks and imports of optional dependencies
+        build URL parents from split components without re-parsing
+        increase default chunk size for http downloads
+        join and resolve URLs from split components without re-parsing
+        add function for downloading multiple files concurrently
+        add conditional requests for only downloading modified files
+        join url components once for each http request
+        raise errors for truncated http downloads
     Updated 01/2026: raise original exceptions in cases of HTTPError/URLError
     Written 01/2026
 """
@@ -23,15 +47,20 @@ import re
 import io
 import ssl
 import json
-import shutil
+import mmap
+import asyncio
 import hashlib
-import inspect
+import email.utils
+import functools
 import logging
 import pathlib
 import warnings
+import threading
 import importlib
 import posixpath
+import http.client
 import subprocess
+import concurrent.futures
 import lxml.etree
 import platformdirs
 import calendar, time
@@ -68,6 +97,7 @@ __all__ = [
     "check_connection",
     "http_list",
     "from_http",
+    "from_http_many",
     "from_json",
 ]
 
@@ -89,6 +119,10 @@ class reify(object):
         return val
 
 
+# absolute path to the package directory
+_package_dir = pathlib.Path(__file__).absolute().parent
+
+
 # PURPOSE: get absolute path within a package from a relative path
 def get_data_path(relpath: list | str | pathlib.Path):
     """
@@ -99,14 +133,24 @@ def get_data_path(relpath: list | str | pathlib.Path):
     relpath: list, str or pathlib.Path
         relative path
     """
-    # current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    filepath = pathlib.Path(filename).absolute().parent
     if isinstance(relpath, list):
         # use *splat operator to extract from list
-        return filepath.joinpath(*relpath)
+        return _package_dir.joinpath(*relpath)
     elif isinstance(relpath, (str, pathlib.Path)):
-        return filepath.joinpath(relpath)
+        return _package_dir.joinpath(relpath)
+
+
+@functools.lru_cache(maxsize=8)
+def _user_cache_path(appname: str = "xadvect"):
+    """
+    Get and create the user cache directory for an application
+
+    Parameters
+    ----------
+    appname: str, default 'xadvect'
+        application name
+    """
+    return platformdirs.user_cache_path(appname=appname, ensure_exists=True)
 
 
 # PURPOSE: get the path to the user cache directory
@@ -124,7 +168,7 @@ def get_cache_path(
         application name
     """
     # get platform-specific cache directory
-    filepath = platformdirs.user_cache_path(appname=appname, ensure_exists=True)
+    filepath = _user_cache_path(appname)
     if isinstance(relpath, list):
         # use *splat operator to extract from list
         filepath = filepath.joinpath(*relpath)
@@ -133,6 +177,7 @@ def get_cache_path(
     return pathlib.Path(filepath)
 
 
+@functools.cache
 def import_dependency(
     name: str, extra: str = "", raise_exception: bool = False
 ):
@@ -173,6 +218,7 @@ def import_dependency(
     return module
 
 
+@functools.cache
 def dependency_available(name: str, minversion: str | None = None):
     """
     Checks whether a module is installed without importing it
@@ -258,6 +304,22 @@ class URL:
         else:
             return cls("/".join([*parts]))
 
+    @classmethod
+    def _from_raw(cls, parts: list | tuple):
+        """
+        Return a ``URL`` object from split components without re-parsing
+
+        Parameters
+        ----------
+        parts: list or tuple
+            URL components as split by ``url_split``
+        """
+        url = cls.__new__(cls)
+        url._raw_paths = list(parts)
+        url.urlname = "/".join(url._raw_paths)
+        url._headers = {}
+        return url
+
     def joinpath(self, *pathsegments: list[str]):
         """Append URL components to existing
 
@@ -266,10 +328,22 @@ class URL:
         pathsegments: list[str]
             URL components to append
         """
+        # append single components directly to the split URL
+        if (
+            self._is_normalized
+            and self._raw_paths[-1]
+            and all(
+                isinstance(p, str) and p and (posixpath.sep not in p)
+                for p in pathsegments
+            )
+        ):
+            return URL._from_raw([*self._raw_paths, *pathsegments])
         return URL("/".join([*self._raw_paths, *pathsegments]))
 
     def resolve(self):
         """Resolve the URL"""
+        if self._is_normalized:
+            return URL._from_raw(self._raw_paths)
         return URL("/".join([*self._raw_paths]))
 
     def is_file(self):
@@ -310,11 +384,11 @@ class URL:
         request = urllib2.Request(self.urlname)
         response = urllib2.urlopen(request, *args, **kwargs)
         self._headers.update(
-            {k.lower(): v for k, v in response.headers.items()}
+            (k.lower(), v) for k, v in response.headers.items()
         )
         return response
 
-    @property
+    @reify
     def name(self):
         """URL basename"""
         return pathlib.PurePosixPath(self.urlname).name
@@ -327,14 +401,17 @@ class URL:
     @property
     def parent(self):
         """URL parent path as a ``URL`` object"""
-        paths = url_split(self.urlname)[:-1]
-        return URL.from_parts(paths)
+        if self._is_normalized and (len(self._raw_paths) > 1):
+            return URL._from_raw(self._raw_paths[:-1])
+        return URL.from_parts(self._raw_paths[:-1])
 
     @property
     def parents(self):
         """URL parents as a list of ``URL`` objects"""
-        paths = url_split(self.urlname)
-        return [URL.from_parts(paths[:i]) for i in range(len(paths) - 1, 0, -1)]
+        paths = self._raw_paths
+        # select constructor based on if components can be reused
+        cls = URL._from_raw if self._is_normalized else URL.from_parts
+        return [cls(paths[:i]) for i in range(len(paths) - 1, 0, -1)]
 
     @property
     def parts(self):
@@ -347,12 +424,19 @@ class URL:
         """URL scheme"""
         return self._components.scheme + "://"
 
-    @property
+    @reify
     def stem(self):
         """URL stem"""
         return pathlib.PurePosixPath(self.urlname).stem
 
-    @property
+    @reify
+    def _is_normalized(self):
+        """
+        Split components are unchanged when rejoined and split
+        """
+        return self._raw_paths[0].rstrip(posixpath.sep) not in _url_schemes
+
+    @reify
     def _components(self):
         """
         URL parsed into six components using ``urlparse``
@@ -395,6 +479,10 @@ def compressuser(filename: str | pathlib.Path):
         return pathlib.Path("~").joinpath(relative_to)
 
 
+# file size in bytes above which files are memory-mapped for hashing
+_mmap_threshold = 1 << 26
+
+
 # PURPOSE: get the hash value of a file
 def get_hash(local: str | io.IOBase | pathlib.Path, algorithm: str = "md5"):
     """
@@ -406,33 +494,129 @@ def get_hash(local: str | io.IOBase | pathlib.Path, algorithm: str = "md5"):
         BytesIO object or path to file
     algorithm: str, default 'md5'
         hashing algorithm for checksum validation
+
+            - ``'blake3'``: requires the optional ``blake3`` package
+            - any algorithm in ``hashlib.algorithms_available``
     """
+    # validate the hashing algorithm
+    if algorithm not in _hash_algorithms_available():
+        raise ValueError(f"Invalid hashing algorithm: {algorithm}")
     # check if open file object or if local file exists
-    if isinstance(local, io.IOBase):
-        # generate checksum hash for a given type
-        if algorithm in hashlib.algorithms_available:
-            return hashlib.new(algorithm, local.getvalue()).hexdigest()
-        else:
-            raise ValueError(f"Invalid hashing algorithm: {algorithm}")
+    if isinstance(local, io.BytesIO):
+        # generate checksum hash without copying the buffer
+        h = _new_hash(algorithm)
+        with local.getbuffer() as buffer:
+            h.update(buffer)
+        return h.hexdigest()
+    elif isinstance(local, io.IOBase):
+        # generate checksum hash from the start of the file object
+        local.seek(0)
+        return _file_digest(local, algorithm)
     elif isinstance(local, (str, pathlib.Path)):
         # generate checksum hash for local file
         local = pathlib.Path(local).expanduser()
         # if file currently doesn't exist, return empty string
         if not local.exists():
             return ""
+        # hash memory-mapped file with multiple threads
+        if algorithm == "blake3":
+            h = _new_hash(algorithm)
+            h.update_mmap(local)
+            return h.hexdigest()
         # open the local_file in binary read mode
         with local.open(mode="rb") as local_buffer:
+            # hash large files directly from the page cache
+            if local.stat().st_size > _mmap_threshold:
+                return _mmap_digest(local_buffer, algorithm)
             # generate checksum hash for a given type
-            if algorithm in hashlib.algorithms_available:
-                return hashlib.new(algorithm, local_buffer.read()).hexdigest()
-            else:
-                raise ValueError(f"Invalid hashing algorithm: {algorithm}")
+            return _file_digest(local_buffer, algorithm)
     else:
         return ""
 
 
+def _hash_algorithms_available():
+    """Set of hashing algorithms available for checksums"""
+    if dependency_available("blake3"):
+        return hashlib.algorithms_available | {"blake3"}
+    return hashlib.algorithms_available
+
+
+def _new_hash(algorithm: str = "md5"):
+    """
+    Create a new hash object for a hashing algorithm
+
+    Parameters
+    ----------
+    algorithm: str, default 'md5'
+        hashing algorithm for checksum validation
+    """
+    # use multithreaded BLAKE3 from the optional package
+    if algorithm == "blake3":
+        blake3 = import_dependency("blake3", raise_exception=True)
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algorithm)
+
+
+def _mmap_digest(fileobj: io.IOBase, algorithm: str = "md5"):
+    """
+    Hash a memory-mapped file through a hashing algorithm
+
+    Parameters
+    ----------
+    fileobj: obj
+        binary file object
+    algorithm: str, default 'md5'
+        hashing algorithm for checksum validation
+    """
+    h = _new_hash(algorithm)
+    with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # hint that pages will be read sequentially
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        h.update(mm)
+    return h.hexdigest()
+
+
+def _file_digest(
+    fileobj: io.IOBase,
+    algorithm: str = "md5",
+    chunk_size: int = 1048576,
+):
+    """
+    Stream a binary file object through a hashing algorithm
+
+    Parameters
+    ----------
+    fileobj: obj
+        binary file object
+    algorithm: str, default 'md5'
+        hashing algorithm for checksum validation
+    chunk_size: int, default 1048576
+        size of chunks to read for Python < 3.11
+    """
+    # use the buffered C implementation if available
+    if hasattr(hashlib, "file_digest"):
+        h = hashlib.file_digest(fileobj, lambda: _new_hash(algorithm))
+        return h.hexdigest()
+    # update the hash with chunks of the file
+    h = _new_hash(algorithm)
+    for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+# path to .git directory from current file path
+_git_dir = _package_dir.parent.joinpath(".git")
+# time and value of the last git status check
+_git_status = []
+# times and values of the last git hash checks for each reference
+_git_hashes = {}
+
+
 # PURPOSE: get the git hash value
-def get_git_revision_hash(refname: str = "HEAD", short: bool = False):
+def get_git_revision_hash(
+    refname: str = "HEAD", short: bool = False, ttl: float = 1.0
+):
     """
     Get the ``git`` hash value for a particular reference
 
@@ -442,49 +626,86 @@ def get_git_revision_hash(refname: str = "HEAD", short: bool = False):
         Symbolic reference name
     short: bool, default False
         Return the shorted hash value
+    ttl: float, default 1.0
+        Time in seconds to reuse a previous hash value
     """
-    # get path to .git directory from current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    basepath = pathlib.Path(filename).absolute().parent.parent
-    gitpath = basepath.joinpath(".git")
+    # reuse the previous hash value if recently checked
+    now = time.monotonic()
+    key = (refname, short)
+    if (key in _git_hashes) and ((now - _git_hashes[key][0]) < ttl):
+        return _git_hashes[key][1]
     # build command
-    cmd = ["git", f"--git-dir={gitpath}", "rev-parse"]
+    cmd = ["git", f"--git-dir={_git_dir}", "rev-parse"]
     cmd.append("--short") if short else None
     cmd.append(refname)
     # get output
     with warnings.catch_warnings():
-        return str(subprocess.check_output(cmd), encoding="utf8").strip()
+        value = str(subprocess.check_output(cmd), encoding="utf8").strip()
+    # store the time and hash value of the check
+    _git_hashes[key] = (now, value)
+    return value
 
 
 # PURPOSE: get the current git status
-def get_git_status():
-    """Get the status of a ``git`` repository as a boolean value"""
-    # get path to .git directory from current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    basepath = pathlib.Path(filename).absolute().parent.parent
-    gitpath = basepath.joinpath(".git")
+def get_git_status(ttl: float = 1.0):
+    """
+    Get the status of a ``git`` repository as a boolean value
+
+    Parameters
+    ----------
+    ttl: float, default 1.0
+        Time in seconds to reuse a previous status
+    """
+    # reuse the previous status if recently checked
+    now = time.monotonic()
+    if _git_status and ((now - _git_status[0]) < ttl):
+        return _git_status[1]
     # build command
-    cmd = ["git", f"--git-dir={gitpath}", "status", "--porcelain"]
+    cmd = ["git", f"--git-dir={_git_dir}", "status", "--porcelain"]
     with warnings.catch_warnings():
-        return bool(subprocess.check_output(cmd))
+        status = bool(subprocess.check_output(cmd))
+    # store the time and status of the check
+    _git_status[:] = [now, status]
+    return status
+
 
+# url schemes to keep with the network location when splitting
+_url_schemes = ("http:", "https:", "ftp:", "s3:")
 
-# PURPOSE: recursively split a url path
+
+# PURPOSE: split a url path
 def url_split(s: str):
     """
-    Recursively split a url path into a list
+    Split a url path into a list
 
     Parameters
     ----------
     s: str
         url string
     """
-    head, tail = posixpath.split(str(s))
-    if head in ("http:", "https:", "ftp:", "s3:"):
-        return (s,)
-    elif head in ("", posixpath.sep):
-        return (tail,)
-    return url_split(head) + (tail,)
+    s = str(s)
+    components = s.split(posixpath.sep)
+    # keep the scheme and network location as a single component
+    if (len(components) > 1) and (components[0] in _url_schemes):
+        # find the network location following the scheme
+        i = next((i for i, c in enumerate(components[1:], 1) if c), None)
+        # return the url if there is no network location
+        if i is None:
+            return (s,)
+        head = (posixpath.sep.join(components[: i + 1]),)
+        components = components[i + 1 :]
+    else:
+        head = ()
+    # remove empty components from repeated separators
+    paths = head + tuple(c for c in components if c)
+    # keep a trailing empty component for trailing separators
+    if not paths or (components and not components[-1]):
+        paths += ("",)
+    return paths
+
+
+# regular expression for comments within argument files
+_rx_comment = re.compile(r"\#.*")
 
 
 # PURPOSE: convert file lines to arguments
@@ -498,7 +719,7 @@ def convert_arg_line_to_args(arg_line):
         line string containing a single argument and/or comments
     """
     # remove commented lines and after argument comments
-    for arg in re.sub(r"\#(.*?)$", r"", arg_line).split():
+    for arg in _rx_comment.sub("", arg_line).split():
         if not arg.strip():
             continue
         yield arg
@@ -524,6 +745,44 @@ def get_unix_time(time_string: str, format: str = "%Y-%m-%d %H:%M:%S"):
         return calendar.timegm(parsed_time)
 
 
+# default format of modification times in Apache directory listings
+_listing_time_format = "%Y-%m-%d %H:%M"
+_rx_listing_time = re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})")
+
+
+def _listing_unix_time(time_string: str, format: str = _listing_time_format):
+    """
+    Get the Unix timestamp value for a directory listing time string
+
+    Parses the default listing format directly and falls back
+    to ``get_unix_time`` for other formats
+
+    Parameters
+    ----------
+    time_string: str
+        formatted time string to parse
+    format: str, default '%Y-%m-%d %H:%M'
+        format for input time string
+    """
+    # check that the string matches the default listing format
+    m = (format == _listing_time_format) and _rx_listing_time.fullmatch(
+        time_string.rstrip()
+    )
+    if not m:
+        return get_unix_time(time_string, format=format)
+    # validate the date and time components
+    year, month, day, hour, minute = map(int, m.groups())
+    if not (
+        (year >= 1)
+        and (1 <= month <= 12)
+        and (1 <= day <= calendar.monthrange(year, month)[1])
+        and (hour < 24)
+        and (minute < 60)
+    ):
+        return get_unix_time(time_string, format=format)
+    return calendar.timegm((year, month, day, hour, minute, 0, 0, 0, 0))
+
+
 def _create_default_ssl_context() -> ssl.SSLContext:
     """Creates the default SSL context"""
     context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
@@ -553,6 +812,128 @@ def _set_ssl_context_options(context: ssl.SSLContext) -> None:
 
 # default ssl context
 _default_ssl_context = _create_ssl_context_no_verify()
+# check if urllib3 is available for connection pooling
+_urllib3_available = dependency_available("urllib3")
+
+
+@functools.cache
+def _pool_manager(context: ssl.SSLContext = _default_ssl_context):
+    """
+    Get a ``urllib3`` pool manager for reusing connections
+
+    Parameters
+    ----------
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for pooled connections
+    """
+    urllib3 = import_dependency("urllib3", raise_exception=True)
+    return urllib3.PoolManager(ssl_context=context, maxsize=16, block=False)
+
+
+@functools.cache
+def _proxy_manager(proxy: str, context: ssl.SSLContext = _default_ssl_context):
+    """
+    Get a ``urllib3`` proxy manager for reusing connections
+
+    Parameters
+    ----------
+    proxy: str
+        url of the proxy server
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for pooled connections
+    """
+    urllib3 = import_dependency("urllib3", raise_exception=True)
+    return urllib3.ProxyManager(
+        proxy, ssl_context=context, maxsize=16, block=False
+    )
+
+
+def _get_pool(url: str, context: ssl.SSLContext = _default_ssl_context):
+    """
+    Get a ``urllib3`` manager for a url honoring proxy environment variables
+
+    Parameters
+    ----------
+    url: str
+        url of the request
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for pooled connections
+    """
+    components = urlparse(url)
+    proxies = urllib2.getproxies()
+    proxy = proxies.get(components.scheme)
+    # use a proxy manager unless the host bypasses the proxy
+    if proxy and not urllib2.proxy_bypass(components.hostname or ""):
+        return _proxy_manager(proxy, context)
+    return _pool_manager(context)
+
+
+def _urlopen(
+    request: urllib2.Request,
+    timeout: int | None = None,
+    context: ssl.SSLContext = _default_ssl_context,
+    use_pool: bool = True,
+):
+    """
+    Open a request reusing pooled connections if ``urllib3`` is available
+
+    Parameters
+    ----------
+    request: obj
+        ``urllib`` request object
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for ``urllib`` opener object
+    use_pool: bool, default True
+        reuse connections with a ``urllib3`` pool manager
+
+        Uses the opener installed with ``urllib.request.install_opener``
+        if available
+
+    Returns
+    -------
+    response: obj
+        file-like response object
+    """
+    # use a custom installed opener (e.g. with authentication handlers)
+    if getattr(urllib2, "_opener", None) is not None:
+        return urllib2.urlopen(request, timeout=timeout)
+    # use the standard library opener if not pooling connections
+    if not (use_pool and _urllib3_available):
+        return urllib2.urlopen(request, timeout=timeout, context=context)
+    urllib3 = import_dependency("urllib3", raise_exception=True)
+    # retry redirects but not failed connections
+    retries = urllib3.Retry(total=None, connect=0, read=0, other=0, redirect=10)
+    kwargs = dict(timeout=timeout) if timeout is not None else {}
+    try:
+        # verification is set by the SSL context
+        with warnings.catch_warnings():
+            warnings.simplefilter(
+                "ignore", urllib3.exceptions.InsecureRequestWarning
+            )
+            response = _get_pool(request.full_url, context).request(
+                request.get_method(),
+                request.full_url,
+                body=request.data,
+                headers=dict(request.header_items()),
+                preload_content=False,
+                retries=retries,
+                **kwargs,
+            )
+    except urllib3.exceptions.HTTPError as exc:
+        # raise errors consistent with the standard library
+        raise urllib2.URLError(exc) from exc
+    # raise errors for unsuccessful requests
+    if response.status >= 400:
+        raise urllib2.HTTPError(
+            request.full_url,
+            response.status,
+            response.reason,
+            response.headers,
+            response,
+        )
+    return response
 
 
 # PURPOSE: check connection with http host
@@ -560,6 +941,7 @@ def check_connection(
     HOST: str,
     context: ssl.SSLContext = _default_ssl_context,
     timeout: int = 20,
+    use_pool: bool = True,
 ):
     """
     Check internet connection with http host
@@ -572,10 +954,13 @@ def check_connection(
         SSL context for ``urllib`` opener object
     timeout: int, default 20
         timeout in seconds for blocking operations
+    use_pool: bool, default True
+        reuse connections with a ``urllib3`` pool manager
     """
     # attempt to connect to http host
     try:
-        urllib2.urlopen(HOST, timeout=timeout, context=context)
+        request = urllib2.Request(HOST)
+        _urlopen(request, timeout, context, use_pool=use_pool).close()
     except urllib2.HTTPError as exc:
         logging.debug(exc.code)
         raise
@@ -587,15 +972,104 @@ def check_connection(
         return True
 
 
+class _ListingTarget:
+    """
+    ``lxml`` parser target for collecting the file names and
+    modification times from an Apache directory listing in a single pass
+
+    Equivalent to the XPath expressions
+    ``//tr/td[not(@*)]//a/@href`` and
+    ``//tr/td[@align="right"][1]/text()``
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear the state of the parser target"""
+        # stack of open element tags and if each is a plain table cell
+        self.stack = []
+        # number of open table cells without attributes
+        self.plain = 0
+        # if the first right-aligned cell was found for each open row
+        self.rows = []
+        # stack depth of the current right-aligned cell and its text
+        self.depth = None
+        self.text = []
+        # output file names and modification times
+        self.colnames = []
+        self.collastmod = []
+
+    def start(self, tag, attrib):
+        """Handle the start of an element"""
+        parent = self.stack[-1][0] if self.stack else None
+        # text nodes of the right-aligned cell are split by child elements
+        if self.depth == len(self.stack):
+            self.flush()
+        plain = (tag == "td") and (parent == "tr") and not attrib
+        self.stack.append((tag, plain))
+        self.plain += plain
+        if tag == "tr":
+            self.rows.append(False)
+        elif (tag == "td") and (parent == "tr") and not plain:
+            # first right-aligned cell within the row
+            if (attrib.get("align") == "right") and not self.rows[-1]:
+                self.rows[-1] = True
+                self.depth = len(self.stack)
+        elif (tag == "a") and self.plain and ("href" in attrib):
+            self.colnames.append(attrib["href"])
+
+    def end(self, tag):
+        """Handle the end of an element"""
+        # add the final text node of the right-aligned cell
+        if self.depth == len(self.stack):
+            self.flush()
+            self.depth = None
+        tag, plain = self.stack.pop()
+        self.plain -= plain
+        if tag == "tr":
+            self.rows.pop()
+
+    def data(self, data):
+        """Handle text data"""
+        # only keep text directly within the right-aligned cell
+        if self.depth == len(self.stack):
+            self.text.append(data)
+
+    def flush(self):
+        """Add the current text node of the right-aligned cell"""
+        if self.text:
+            self.collastmod.append("".join(self.text))
+            self.text = []
+
+    def close(self):
+        """Return the file names and modification times"""
+        return (self.colnames, self.collastmod)
+
+
+# thread-local storage for HTML parsers
+_thread_local = threading.local()
+
+
+def _html_parser():
+    """Get an ``lxml`` HTML parser and target for the current thread"""
+    if not hasattr(_thread_local, "html_parser"):
+        target = _ListingTarget()
+        parser = lxml.etree.HTMLParser(target=target)
+        _thread_local.html_parser = (parser, target)
+    return _thread_local.html_parser
+
+
 # PURPOSE: list a directory on an Apache http Server
 def http_list(
     HOST: str | list,
     timeout: int | None = None,
     context: ssl.SSLContext = _default_ssl_context,
-    parser=lxml.etree.HTMLParser(),
+    parser=None,
     format: str = "%Y-%m-%d %H:%M",
     pattern: str = "",
     sort: bool = False,
+    use_pool: bool = True,
     **kwargs,
 ):
     """
@@ -609,14 +1083,19 @@ def http_list(
         timeout in seconds for blocking operations
     context: obj, default xAdvect.utilities._default_ssl_context
         SSL context for ``urllib`` opener object
-    parser: obj, default lxml.etree.HTMLParser()
+    parser: obj or NoneType, default None
         HTML parser for ``lxml``
+
+        Defaults to a parser local to the current thread.
+        Parsers shared between threads must not be used concurrently
     format: str, default '%Y-%m-%d %H:%M'
         format for input time string
     pattern: str, default ''
         regular expression pattern for reducing list
     sort: bool, default False
         sort output list
+    use_pool: bool, default True
+        reuse connections with a ``urllib3`` pool manager
 
     Returns
     -------
@@ -628,11 +1107,12 @@ def http_list(
     # verify inputs for remote http host
     if isinstance(HOST, str):
         HOST = url_split(HOST)
+    url = posixpath.join(*HOST)
     # try listing from http
     try:
         # Create and submit request.
-        request = urllib2.Request(posixpath.join(*HOST), **kwargs)
-        response = urllib2.urlopen(request, timeout=timeout, context=context)
+        request = urllib2.Request(url, **kwargs)
+        response = _urlopen(request, timeout, context, use_pool=use_pool)
     except urllib2.HTTPError as exc:
         logging.debug(exc.code)
         raise
@@ -642,25 +1122,31 @@ def http_list(
         raise
     else:
         # read and parse request for files (column names and modified times)
-        tree = lxml.etree.parse(response, parser)
-        colnames = tree.xpath("//tr/td[not(@*)]//a/@href")
+        if parser is None:
+            # parse in a single pass with a separate parser for each thread
+            parser, target = _html_parser()
+            target.reset()
+            colnames, times = lxml.etree.parse(response, parser)
+            target.reset()
+        else:
+            tree = lxml.etree.parse(response, parser)
+            colnames = tree.xpath("//tr/td[not(@*)]//a/@href")
+            times = tree.xpath('//tr/td[@align="right"][1]/text()')
         # get the Unix timestamp value for a modification time
-        collastmod = [
-            get_unix_time(i, format=format)
-            for i in tree.xpath('//tr/td[@align="right"][1]/text()')
-        ]
+        collastmod = [_listing_unix_time(i, format=format) for i in times]
         # reduce using regular expression pattern
+        if pattern or sort:
+            items = list(zip(colnames, collastmod))
         if pattern:
-            i = [i for i, f in enumerate(colnames) if re.search(pattern, f)]
-            # reduce list of column names and last modified times
-            colnames = [colnames[indice] for indice in i]
-            collastmod = [collastmod[indice] for indice in i]
-        # sort the list
+            rx = re.compile(pattern)
+            items = [item for item in items if rx.search(item[0])]
+        # sort the list by column name
         if sort:
-            i = [i for i, j in sorted(enumerate(colnames), key=lambda i: i[1])]
-            # sort list of column names and last modified times
-            colnames = [colnames[indice] for indice in i]
-            collastmod = [collastmod[indice] for indice in i]
+            items.sort(key=lambda item: item[0])
+        # reduced list of column names and last modified times
+        if pattern or sort:
+            colnames = [f for f, t in items]
+            collastmod = [t for f, t in items]
         # return the list of column names and last modified times
         return (colnames, collastmod)
 
@@ -672,11 +1158,15 @@ def from_http(
     context: ssl.SSLContext = _default_ssl_context,
     local: str | pathlib.Path | None = None,
     hash: str = "",
-    chunk: int = 16384,
+    chunk: int = 262144,
     headers: dict = {},
     verbose: bool = False,
     fid=sys.stdout,
     mode: oct = 0o775,
+    return_buffer: bool = True,
+    use_pool: bool = True,
+    hash_algorithm: str = "md5",
+    conditional: bool = False,
     **kwargs,
 ):
     """
@@ -693,9 +1183,11 @@ def from_http(
     local: str, pathlib.Path or NoneType, default None
         path to local file
     hash: str, default ''
-        MD5 hash of local file
-    chunk: int, default 16384
+        hash of local file for the hashing algorithm
+    chunk: int, default 262144
         chunk size for transfer encoding
+
+        Should be a multiple of the page size for reading and hashing
     headers: dict, default {}
         dictionary of headers to append from url request
     verbose: bool, default False
@@ -704,10 +1196,19 @@ def from_http(
         open file object to print if verbose
     mode: oct, default 0o775
         permissions mode of output local file
+    return_buffer: bool, default True
+        return a BytesIO representation of the file
+    use_pool: bool, default True
+        reuse connections with a ``urllib3`` pool manager
+    hash_algorithm: str, default 'md5'
+        hashing algorithm for checksum validation
+    conditional: bool, default False
+        only download if the remote file was modified after the
+        existing local file or if its entity tag has changed
 
     Returns
     -------
-    remote_buffer: obj
+    remote_buffer: obj or NoneType
         BytesIO representation of file
     """
     # create logger
@@ -716,12 +1217,19 @@ def from_http(
     # verify inputs for remote http host
     if isinstance(HOST, str):
         HOST = url_split(HOST)
+    url = posixpath.join(*HOST)
     # try downloading from http
     try:
         # Create and submit request.
-        request = urllib2.Request(posixpath.join(*HOST), **kwargs)
-        response = urllib2.urlopen(request, timeout=timeout, context=context)
+        request = urllib2.Request(url, **kwargs)
+        # add headers for only downloading modified files
+        if conditional and local:
+            _add_conditional_headers(request, local)
+        response = _urlopen(request, timeout, context, use_pool=use_pool)
     except urllib2.HTTPError as exc:
+        # local file is up to date with the remote file
+        if conditional and (exc.code == 304):
+            return _not_modified(HOST, url, local, return_buffer)
         logging.debug(exc.code)
         raise
     except urllib2.URLError as exc:
@@ -729,34 +1237,422 @@ def from_http(
         exc.message = "Check internet connection"
         raise
     else:
-        # copy remote file contents to bytesIO object
-        remote_buffer = io.BytesIO()
-        shutil.copyfileobj(response, remote_buffer, chunk)
-        remote_buffer.seek(0)
-        # save file basename with bytesIO object
-        remote_buffer.filename = HOST[-1]
         # copy headers from response
-        headers.update({k.lower(): v for k, v in response.getheaders()})
-        # generate checksum hash for remote file
-        remote_hash = hashlib.md5(remote_buffer.getvalue()).hexdigest()
-        # compare checksums
-        if local and (hash != remote_hash):
+        headers.update((k.lower(), v) for k, v in response.headers.items())
+        # local file is up to date with the remote file
+        if conditional and (response.status == 304):
+            response.read()
+            return _not_modified(HOST, url, local, return_buffer)
+        # stream remote file contents to outputs while computing checksum
+        remote_file = _RemoteFile(
+            HOST,
+            url=url,
+            local=local,
+            hash=hash,
+            hash_algorithm=hash_algorithm,
+            mode=mode,
+            return_buffer=return_buffer,
+        )
+        try:
+            # read remote file using chunked transfer encoding
+            for buffer in iter(lambda: response.read(chunk), b""):
+                remote_file.write(buffer)
+            # raise an error if the response was truncated
+            if getattr(response, "length", None):
+                raise http.client.IncompleteRead(b"", response.length)
+        except BaseException:
+            # remove incomplete temporary file
+            remote_file.abort()
+            raise
+        # compare checksums and get the bytesIO object
+        remote_buffer = remote_file.close()
+        # save the entity tag of the remote file for later requests
+        if conditional and local and response.headers.get("etag"):
+            _store_etag(url, remote_file.local, response.headers["etag"])
+        return remote_buffer
+
+
+# path to the entity tags of downloaded files
+_etags_file = "etags.json"
+# lock for updating the entity tags of downloaded files
+_etags_lock = threading.Lock()
+
+
+def _load_etags() -> dict:
+    """Load the entity tags of downloaded files from the cache"""
+    try:
+        return json.loads(get_cache_path(_etags_file).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_etag(url: str, local: pathlib.Path, etag: str):
+    """
+    Store the entity tag of a downloaded file in the cache
+
+    Parameters
+    ----------
+    url: str
+        url of the remote file
+    local: pathlib.Path
+        path to local file
+    etag: str
+        entity tag of the remote file
+    """
+    with _etags_lock:
+        etags = _load_etags()
+        etags[url] = [etag, str(local)]
+        # atomically replace the cache file
+        cache = get_cache_path(_etags_file)
+        partial = cache.with_name(f"{cache.name}.part")
+        partial.write_text(json.dumps(etags))
+        os.replace(partial, cache)
+
+
+def _add_conditional_headers(
+    request: urllib2.Request, local: str | pathlib.Path
+):
+    """
+    Add headers to a request for only downloading modified files
+
+    Parameters
+    ----------
+    request: obj
+        ``urllib`` request object
+    local: str or pathlib.Path
+        path to local file
+    """
+    local = pathlib.Path(local).expanduser().absolute()
+    if not local.exists():
+        return
+    # modification time of the local file
+    mtime = email.utils.formatdate(local.stat().st_mtime, usegmt=True)
+    request.add_header("If-Modified-Since", mtime)
+    # entity tag of the remote file when last downloaded to the local file
+    etag, path = _load_etags().get(request.full_url, (None, None))
+    if etag and (path == str(local)):
+        request.add_header("If-None-Match", etag)
+
+
+def _not_modified(
+    HOST: list,
+    url: str,
+    local: str | pathlib.Path,
+    return_buffer: bool = True,
+):
+    """
+    Use an existing local file that is up to date with the remote file
+
+    Parameters
+    ----------
+    HOST: list
+        remote http host path split as list
+    url: str
+        url of the remote file
+    local: str or pathlib.Path
+        path to local file
+    return_buffer: bool, default True
+        return a BytesIO representation of the file
+    """
+    local = pathlib.Path(local).expanduser().absolute()
+    logging.info(f"{url} not modified: {local}")
+    if not return_buffer:
+        return None
+    # copy local file contents to bytesIO object
+    local_buffer = io.BytesIO(local.read_bytes())
+    local_buffer.filename = HOST[-1]
+    return local_buffer
+
+
+class _RemoteFile:
+    """
+    Streams remote file contents to a local file and/or a
+    ``BytesIO`` object while computing a checksum
+
+    Parameters
+    ----------
+    HOST: list
+        remote http host path split as list
+    url: str or NoneType, default None
+        url of the remote file
+    local: str, pathlib.Path or NoneType, default None
+        path to local file
+    hash: str, default ''
+        hash of local file for the hashing algorithm
+    hash_algorithm: str, default 'md5'
+        hashing algorithm for checksum validation
+    mode: oct, default 0o775
+        permissions mode of output local file
+    return_buffer: bool, default True
+        return a BytesIO representation of the file
+    """
+
+    def __init__(
+        self,
+        HOST: list,
+        url: str | None = None,
+        local: str | pathlib.Path | None = None,
+        hash: str = "",
+        hash_algorithm: str = "md5",
+        mode: oct = 0o775,
+        return_buffer: bool = True,
+    ):
+        self.HOST = HOST
+        self.url = posixpath.join(*HOST) if url is None else url
+        self.hash = hash
+        self.mode = mode
+        # copy remote file contents to bytesIO object if requested
+        self.remote_buffer = io.BytesIO() if return_buffer else None
+        # generate checksum hash for remote file while reading
+        self.remote_hash = _new_hash(hash_algorithm)
+        # temporary file for writing remote file contents
+        self.local = None
+        self.fid = None
+        if local:
             # convert to absolute path
-            local = pathlib.Path(local).expanduser().absolute()
+            self.local = pathlib.Path(local).expanduser().absolute()
             # create directory if non-existent
-            local.parent.mkdir(mode=mode, parents=True, exist_ok=True)
-            # print file information
-            args = (posixpath.join(*HOST), str(local))
-            logging.info("{0} -->\n\t{1}".format(*args))
-            # store bytes to file using chunked transfer encoding
-            remote_buffer.seek(0)
-            with local.open(mode="wb") as f:
-                shutil.copyfileobj(remote_buffer, f, chunk)
-            # change the permissions mode
-            local.chmod(mode)
+            self.local.parent.mkdir(mode=mode, parents=True, exist_ok=True)
+            self.partial = self.local.with_name(f"{self.local.name}.part")
+            self.fid = self.partial.open(mode="wb")
+
+    def write(self, buffer: bytes):
+        """Add a chunk of the remote file to the outputs"""
+        self.remote_hash.update(buffer)
+        if self.fid is not None:
+            self.fid.write(buffer)
+        if self.remote_buffer is not None:
+            self.remote_buffer.write(buffer)
+
+    def abort(self):
+        """Remove an incomplete temporary file"""
+        if self.fid is not None:
+            self.fid.close()
+            self.partial.unlink(missing_ok=True)
+
+    def close(self):
+        """Compare checksums and finalize outputs"""
+        if self.fid is not None:
+            self.fid.close()
+            if self.hash != self.remote_hash.hexdigest():
+                # print file information
+                args = (self.url, str(self.local))
+                logging.info("{0} -->\n\t{1}".format(*args))
+                # atomically move temporary file to local file
+                os.replace(self.partial, self.local)
+                # change the permissions mode
+                self.local.chmod(self.mode)
+            else:
+                # local file is already up to date
+                self.partial.unlink()
         # return the bytesIO object
-        remote_buffer.seek(0)
-        return remote_buffer
+        if self.remote_buffer is not None:
+            # save file basename with bytesIO object
+            self.remote_buffer.filename = self.HOST[-1]
+            self.remote_buffer.seek(0)
+        return self.remote_buffer
+
+
+# PURPOSE: download multiple files from http hosts concurrently
+def from_http_many(
+    HOST: list,
+    timeout: int | None = None,
+    context: ssl.SSLContext = _default_ssl_context,
+    local: list | None = None,
+    hash: list | None = None,
+    chunk: int = 262144,
+    max_concurrency: int = 16,
+    verbose: bool = False,
+    fid=sys.stdout,
+    mode: oct = 0o775,
+    return_buffer: bool = True,
+    hash_algorithm: str = "md5",
+):
+    """
+    Download multiple files from http hosts concurrently
+
+    Uses ``aiohttp`` if available and a thread pool otherwise
+
+    Parameters
+    ----------
+    HOST: list
+        remote http host paths as strings or split as lists
+    timeout: int or NoneType, default None
+        timeout in seconds for blocking operations
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for ``aiohttp`` or ``urllib`` connections
+    local: list or NoneType, default None
+        paths to local files
+    hash: list or NoneType, default None
+        hashes of local files for the hashing algorithm
+    chunk: int, default 262144
+        chunk size for transfer encoding
+    max_concurrency: int, default 16
+        maximum number of concurrent downloads
+    verbose: bool, default False
+        print file transfer information
+    fid: obj, default sys.stdout
+        open file object to print if verbose
+    mode: oct, default 0o775
+        permissions mode of output local files
+    return_buffer: bool, default True
+        return BytesIO representations of the files
+    hash_algorithm: str, default 'md5'
+        hashing algorithm for checksum validation
+
+    Returns
+    -------
+    remote_buffers: list
+        BytesIO representations of files
+    """
+    # create logger
+    loglevel = logging.INFO if verbose else logging.CRITICAL
+    logging.basicConfig(stream=fid, level=loglevel)
+    # verify inputs for remote http hosts
+    HOST = [url_split(h) if isinstance(h, str) else h for h in HOST]
+    local = [None] * len(HOST) if local is None else local
+    hash = [""] * len(HOST) if hash is None else hash
+    kwargs = dict(
+        chunk=chunk,
+        mode=mode,
+        return_buffer=return_buffer,
+        hash_algorithm=hash_algorithm,
+    )
+    # check if running within an existing event loop
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        running = False
+    else:
+        running = True
+    # download files asynchronously with a shared session
+    if dependency_available("aiohttp") and not running:
+        coroutine = _from_http_gather(
+            HOST, local, hash, timeout, context, max_concurrency, **kwargs
+        )
+        return asyncio.run(coroutine)
+    # download files with a pool of threads
+    with concurrent.futures.ThreadPoolExecutor(max_concurrency) as executor:
+        futures = [
+            executor.submit(
+                from_http,
+                h,
+                timeout=timeout,
+                context=context,
+                local=l,
+                hash=m,
+                headers={},
+                **kwargs,
+            )
+            for h, l, m in zip(HOST, local, hash)
+        ]
+        return [f.result() for f in futures]
+
+
+async def _from_http_gather(
+    HOST: list,
+    local: list,
+    hash: list,
+    timeout: int | None = None,
+    context: ssl.SSLContext = _default_ssl_context,
+    max_concurrency: int = 16,
+    **kwargs,
+):
+    """
+    Download multiple files using a shared ``aiohttp`` session
+
+    Parameters
+    ----------
+    HOST: list
+        remote http host paths split as lists
+    local: list
+        paths to local files
+    hash: list
+        hashes of local files for the hashing algorithm
+    timeout: int or NoneType, default None
+        timeout in seconds for the downloads
+    context: obj, default xAdvect.utilities._default_ssl_context
+        SSL context for ``aiohttp`` connections
+    max_concurrency: int, default 16
+        maximum number of concurrent downloads
+    **kwargs: dict
+        keyword arguments for ``_from_http_async``
+    """
+    aiohttp = import_dependency("aiohttp", raise_exception=True)
+    # bound the number of concurrent downloads
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(ssl=context, limit=max_concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=client_timeout
+    ) as session:
+        tasks = [
+            _from_http_async(session, semaphore, h, local=l, hash=m, **kwargs)
+            for h, l, m in zip(HOST, local, hash)
+        ]
+        return await asyncio.gather(*tasks)
+
+
+async def _from_http_async(
+    session,
+    semaphore: asyncio.Semaphore,
+    HOST: list,
+    chunk: int = 262144,
+    **kwargs,
+):
+    """
+    Download a file from a http host using an ``aiohttp`` session
+
+    Parameters
+    ----------
+    session: obj
+        ``aiohttp`` client session
+    semaphore: obj
+        semaphore for bounding concurrent downloads
+    HOST: list
+        remote http host path split as list
+    chunk: int, default 262144
+        chunk size for transfer encoding
+    **kwargs: dict
+        keyword arguments for ``_RemoteFile``
+    """
+    async with semaphore:
+        url = posixpath.join(*HOST)
+        async with session.get(url, raise_for_status=True) as response:
+            # stream remote file contents while computing checksum
+            remote_file = _RemoteFile(HOST, url=url, **kwargs)
+            try:
+                async for buffer in response.content.iter_chunked(chunk):
+                    remote_file.write(buffer)
+            except BaseException:
+                # remove incomplete temporary file
+                remote_file.abort()
+                raise
+            # compare checksums and return the bytesIO object
+            return remote_file.close()
+
+
+# check if orjson is available for parsing JSON
+_orjson_available = dependency_available("orjson")
+
+
+def _json_loads(data: bytes):
+    """
+    Parse JSON bytes using ``orjson`` if available
+
+    Parameters
+    ----------
+    data: bytes
+        JSON document
+    """
+    if _orjson_available:
+        orjson = import_dependency("orjson")
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # fall back to the standard library for non-standard JSON
+            pass
+    return json.loads(data)
 
 
 # PURPOSE: load a JSON response from a http host
@@ -765,6 +1661,7 @@ def from_json(
     timeout: int | None = None,
     context: ssl.SSLContext = _default_ssl_context,
     headers: dict = {},
+    use_pool: bool = True,
 ) -> dict:
     """
     Load a JSON response from a http host
@@ -779,16 +1676,19 @@ def from_json(
         SSL context for ``urllib`` opener object
     headers: dict, default {}
         dictionary of headers to append from url request
+    use_pool: bool, default True
+        reuse connections with a ``urllib3`` pool manager
     """
     # verify inputs for remote http host
     if isinstance(HOST, str):
         HOST = url_split(HOST)
+    url = posixpath.join(*HOST)
     # try loading JSON from http
     try:
         # Create and submit request for JSON response
-        request = urllib2.Request(posixpath.join(*HOST))
+        request = urllib2.Request(url)
         request.add_header("Accept", "application/json")
-        response = urllib2.urlopen(request, timeout=timeout, context=context)
+        response = _urlopen(request, timeout, context, use_pool=use_pool)
     except urllib2.HTTPError as exc:
         logging.debug(exc.code)
         raise
@@ -798,6 +1698,6 @@ def from_json(
         raise
     else:
         # copy headers from response
-        headers.update({k.lower(): v for k, v in response.getheaders()})
+        headers.update((k.lower(), v) for k, v in response.headers.items())
         # load JSON response
-        return json.loads(response.read())
+        return _json_loads(response.read())